@@ -1,13 +1,22 @@
 import sys
 from PySide6.QtWidgets import QApplication
 from views.main_window import MainWindow
-from views.home_view import HomeView
+from views.theme import apply_theme
 from models.dataset_model import DatasetModel 
-from views.dataset.dataset_view import DatasetView # 正确的导入路径
-from controllers.dataset_controller import DatasetController
 from controllers.main_controller import MainController 
 from utils.database import DatabaseManager
 from models.dataset_model import Base 
+from models.dataset_son_model import Base as DataBase, DataModel
+from models.dataset_stats_model import Base as StatsBase, DatasetStatsModel
+from models.tag_model import Base as TagBase, DataTagModel
+from models.archive_model import Base as ArchiveBase, ARCHIVE_TABLES
+from models.eval_model import Base as EvalBase, EvalResultModel
+from utils.schema import ensure_indexes, ensure_columns
+from utils.fulltext import ensure_fulltext_indexes
+from utils.compaction import CompactionJob
+from utils.task_executor import TaskExecutor
+from utils.data_events import notify_write
+from utils.sharding import ShardRouter
 from utils.logger import setup_logging, get_logger
 
 setup_logging()
@@ -21,7 +30,26 @@ def initialize_database():
         engine = DatabaseManager.get_engine()
         if engine:
             # 创建数据表
-            Base.metadata.create_all(engine)
+            for base in (Base, DataBase, StatsBase, TagBase, ArchiveBase, EvalBase):
+                base.metadata.create_all(engine)
+            # 已存在的表补建新增列（长文本、答案预览等）及分页索引
+            ensure_columns(engine, DataModel, EvalResultModel, *[archive for _, archive in ARCHIVE_TABLES])
+            ensure_indexes(engine, DatasetModel, DataModel)
+            # 名称与数据文本的全文索引（MySQL ngram / SQLite FTS5）
+            ensure_fulltext_indexes(engine)
+            # 启用分片时，各分片只存放数据子项、标签及其归档表
+            item_archive = [archive for model, archive in ARCHIVE_TABLES if model is DataModel]
+            for shard_engine in ShardRouter.engines():
+                for base in (DataBase, TagBase):
+                    base.metadata.create_all(shard_engine)
+                ArchiveBase.metadata.create_all(shard_engine, tables=item_archive)
+                ensure_columns(shard_engine, DataModel, *item_archive)
+                ensure_indexes(shard_engine, DataModel)
+                ensure_fulltext_indexes(shard_engine)
+            with DatabaseManager.get_session() as session:
+                # 首页统计表为空时全量构建一次
+                DatasetStatsModel.ensure_initialized(session)
+            DatabaseManager.remove_session()
             logger.info("数据库表检查/创建成功。")
             return True # 成功
         else:
@@ -31,8 +59,38 @@ def initialize_database():
         logger.critical(f"数据库初始化失败: {e}", exc_info=True)
         return False # 失败
 
+def backfill_history():
+    """历史数据补建标签倒排索引与答案预览列；两者都要扫描数据表，在主窗口显示后于后台执行"""
+    total = 0
+    with DatabaseManager.get_session() as session:
+        for shard_session in ShardRouter.all_sessions(session):
+            total += DataTagModel.backfill(shard_session)
+            total += DataModel.backfill_previews(shard_session)
+    if total:
+        notify_write(DataModel.__tablename__)
+    return total
+
+
+def create_dataset_page():
+    """数据集管理页工厂（页面模块在首次创建时才导入，不计入启动耗时）"""
+    from views.dataset.dataset_view import DatasetView
+    from controllers.dataset_controller import DatasetController
+    dataset_view = DatasetView()
+    return dataset_view, DatasetController(dataset_view)
+
+
+def create_home_page():
+    """首页工厂"""
+    from views.home_view import HomeView
+    from controllers.home_controller import HomeController
+    home_view = HomeView()
+    return home_view, HomeController(home_view)
+
+
 def main():
     app = QApplication(sys.argv)
+    # 全局样式表与图标缓存只安装一次
+    apply_theme(app)
 
     # 首先初始化数据库
     if not initialize_database():
@@ -44,24 +102,23 @@ def main():
     # 创建主窗口
     main_window = MainWindow()
 
-    # 创建各页面
-    home_view = HomeView()
-    dataset_view = DatasetView() # 创建数据集页面
-
-    # 添加页面到主窗口
-    main_window.add_page(dataset_view, "数据集管理")
-    main_window.add_page(home_view, "首页")
+    # 各页面及其控制器在首次切换到该页时才创建
+    main_window.add_page(create_dataset_page, "数据集管理")
+    main_window.add_page(create_home_page, "首页")
 
+    # 先显示主窗口，首个页面在事件循环开始后再创建和加载
+    main_window.show()
 
     # 创建主控制器，负责主窗口页面切换
     main_controller = MainController(main_window)
 
-    # 创建数据集控制器，负责数据集页面逻辑
-    dataset_controller = DatasetController(dataset_view) # 实例化控制器
-
+    # 历史数据补建在后台执行，不阻塞启动；补建完成前旧数据的标签筛选与答案预览不完整
+    backfill_executor = TaskExecutor(max_threads=1, parent=main_window)
+    backfill_executor.submit(backfill_history)
 
-    # 显示主窗口
-    main_window.show()
+    # 后台定时归档软删除数据
+    compaction_job = CompactionJob(main_window)
+    compaction_job.start()
 
     # 运行应用
     sys.exit(app.exec())
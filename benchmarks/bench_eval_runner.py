@@ -0,0 +1,64 @@
+"""
+评测执行器吞吐基准：在同一进程内启动模拟模型服务，用合成数据跑一次评测，
+输出每分钟完成的请求数与延迟分布（不需要数据库）。
+
+用法（在项目根目录执行）：
+    python benchmarks/bench_eval_runner.py [--items 5000] [--concurrency 128] [--latency-ms 200]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evaluation.mock_server import start_mock_server
+from evaluation.model_adapter import OpenAICompatibleAdapter
+from evaluation.runner import EvalRunner
+
+
+async def synthetic_items(count):
+    for data_id in range(1, count + 1):
+        yield data_id, f"问题 {data_id}: 请计算 {data_id} + {data_id} 等于多少？", None
+
+
+async def bench(args):
+    server = await start_mock_server(port=args.port, latency_ms=args.latency_ms,
+                                     jitter_ms=args.latency_ms / 4, error_rate=args.error_rate)
+    latencies = []
+
+    def collect(result):
+        if result['latency_ms'] is not None and not result['cached']:
+            latencies.append(result['latency_ms'])
+
+    try:
+        adapter = OpenAICompatibleAdapter(f"http://127.0.0.1:{args.port}", "mock-model")
+        runner = EvalRunner(adapter, concurrency=args.concurrency, timeout=10, max_retries=3, backoff=0.05)
+        stats = await runner.run(
+            synthetic_items(args.items),
+            on_result=collect
+        )
+    finally:
+        await server.cleanup()
+
+    print(f"完成 {stats['total']} 条，失败 {stats['failed']} 条，耗时 {stats['elapsed_seconds']}s")
+    print(f"吞吐 {stats['per_minute']:.0f} 条/分钟（并发 {args.concurrency}，模拟延迟 {args.latency_ms:.0f} ms）")
+    if latencies:
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(f"延迟 中位数 {statistics.median(latencies):.0f} ms  P95 {p95} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="评测执行器吞吐基准")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=128)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument("--port", type=int, default=8911)
+    asyncio.run(bench(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
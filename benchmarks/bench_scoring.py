@@ -0,0 +1,60 @@
+"""
+评分引擎吞吐基准：用合成的模型输出与参考答案计算全部指标，
+对比单进程与进程池的耗时，并折算评分 100 万条所需时间（不需要数据库）。
+
+用法（在项目根目录执行）：
+    python benchmarks/bench_scoring.py [--items 200000] [--processes 8]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evaluation.scoring import ScoringEngine
+
+WORDS = ("the answer is", "因此", "结果为", "we compute", "首先", "然后", "so", "total", "计算得到", "which gives")
+
+
+def synthetic_pairs(count, seed=7):
+    rng = random.Random(seed)
+    predictions, references = [], []
+    for _ in range(count):
+        value = rng.randint(1, 10000)
+        reference = f"{' '.join(rng.choices(WORDS, k=rng.randint(3, 12)))} {value}"
+        if rng.random() < 0.5:
+            prediction = reference
+        else:
+            prediction = f"{' '.join(rng.choices(WORDS, k=rng.randint(5, 40)))} {value + rng.randint(0, 2)}"
+        predictions.append(prediction)
+        references.append(reference)
+    return predictions, references
+
+
+def timed(engine, predictions, references):
+    start = time.perf_counter()
+    scores = engine.score(predictions, references)
+    return time.perf_counter() - start, scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="评分引擎吞吐基准")
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    predictions, references = synthetic_pairs(args.items)
+    for processes in sorted({1, args.processes}):
+        with ScoringEngine(processes=processes) as engine:
+            elapsed, scores = timed(engine, predictions, references)
+            summary = engine.summarize(scores)
+        per_million = elapsed / args.items * 1_000_000
+        print(f"进程数 {processes}: {args.items} 条耗时 {elapsed:.2f}s，"
+              f"折算 100 万条约 {per_million / 60:.1f} 分钟")
+    print({metric: item['mean'] for metric, item in summary.items()})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+冷启动基准：
+1. 在全新解释器中以 -X importtime 导入 app，列出累计耗时最高的模块；
+2. 测量从进程启动到主窗口完成首次绘制的时间：在临时 SQLite 数据库上执行完整的 app.main
+   （建表、补建列与索引、主控制器、后台补建与归档任务），空库上各项补建几乎不耗时，
+   因此不反映大数据量下的补建开销，也不包含 MySQL 连接耗时；
+3. 检查启动阶段没有加载 pandas 等重量级模块。
+任一项超出预算时以非零状态码退出，可用于回归检查。
+
+用法（在项目根目录执行）：
+    python benchmarks/bench_startup.py [--runs 5] [--import-budget-ms 1500] [--window-budget-ms 2500]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 启动阶段不应出现的模块（只在导入/导出等操作时按需加载）
+FORBIDDEN_MODULES = ['pandas', 'xlsxwriter', 'openpyxl', 'tkinter', 'turtle']
+
+# 子进程：以临时数据库执行 app.main，输出主窗口首次绘制完成时的耗时
+WINDOW_SCRIPT = r"""
+import json, os, shutil, sys, tempfile, time
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
+import app
+from views.main_window import MainWindow
+from utils.database import DatabaseManager
+
+# 临时 SQLite 库代替正式配置，走与正常启动相同的初始化流程
+db_dir = tempfile.mkdtemp(prefix="bench_startup_")
+DatabaseManager.config_path = os.path.join(db_dir, "database.ini")
+with open(DatabaseManager.config_path, "w", encoding="utf-8") as f:
+    f.write(f"[database]\nbackend = sqlite\n\n[sqlite]\npath = {os.path.join(db_dir, 'bench.db')}\n")
+
+class BenchApplication(QApplication):
+    def exec(self):
+        # app.main 显示主窗口后进入事件循环：此时完成首次绘制并记录耗时
+        window = next(w for w in self.topLevelWidgets() if isinstance(w, MainWindow))
+        window.grab()
+        shown = time.perf_counter()
+
+        def report():
+            print(json.dumps({
+                "window_ms": (shown - START) * 1000,
+                "loaded": sorted(m for m in FORBIDDEN if m in sys.modules),
+            }))
+            self.quit()
+
+        QTimer.singleShot(0, report)
+        return super().exec()
+
+app.QApplication = BenchApplication
+try:
+    app.main()
+except SystemExit:
+    pass
+finally:
+    DatabaseManager.close_engine()
+    shutil.rmtree(db_dir, ignore_errors=True)
+"""
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_python(args, code=None):
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    command = [sys.executable, *args]
+    if code is not None:
+        command += ["-c", code]
+    return subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def import_breakdown(top):
+    """以 -X importtime 导入 app，返回 (总耗时毫秒, 累计耗时最高的顶层依赖)"""
+    result = run_python(["-X", "importtime"], "import app")
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((int(cumulative_us), int(self_us), len(indent), module))
+    total_ms = next((cumulative / 1000 for cumulative, _, _, module in rows if module == "app"), 0.0)
+    # 只看 app 的直接依赖层级，避免子模块重复计数
+    direct = [row for row in rows if row[2] <= 3 and row[3] != "app"]
+    return total_ms, sorted(direct, reverse=True)[:top]
+
+
+def time_to_window():
+    """进程启动到主窗口首次绘制的耗时与启动期已加载的重量级模块"""
+    code = (f"import time; START = time.perf_counter(); FORBIDDEN = {FORBIDDEN_MODULES!r}\n"
+            + WINDOW_SCRIPT)
+    result = run_python([], code)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="冷启动基准")
+    parser.add_argument("--runs", type=int, default=5, help="重复次数，取中位数")
+    parser.add_argument("--top", type=int, default=15, help="列出耗时最高的模块数")
+    parser.add_argument("--import-budget-ms", type=float, default=1500, help="导入 app 的耗时预算")
+    parser.add_argument("--window-budget-ms", type=float, default=2500, help="首次绘制的耗时预算")
+    args = parser.parse_args()
+
+    import_times, window_times, loaded = [], [], set()
+    breakdown = []
+    for _ in range(args.runs):
+        total_ms, breakdown = import_breakdown(args.top)
+        import_times.append(total_ms)
+        window = time_to_window()
+        window_times.append(window["window_ms"])
+        loaded.update(window["loaded"])
+
+    print("导入耗时最高的模块（最后一次，单位 ms）:")
+    for cumulative_us, self_us, _, module in breakdown:
+        print(f"  {cumulative_us / 1000:9.1f}  (自身 {self_us / 1000:7.1f})  {module}")
+
+    import_ms = statistics.median(import_times)
+    window_ms = statistics.median(window_times)
+    print(f"import app        中位数 {import_ms:8.1f} ms  预算 {args.import_budget_ms:.0f} ms")
+    print(f"主窗口首次绘制    中位数 {window_ms:8.1f} ms  预算 {args.window_budget_ms:.0f} ms")
+
+    failures = []
+    if import_ms > args.import_budget_ms:
+        failures.append("import app 超出预算")
+    if window_ms > args.window_budget_ms:
+        failures.append("主窗口首次绘制超出预算")
+    if loaded:
+        failures.append(f"启动阶段加载了重量级模块: {', '.join(sorted(loaded))}")
+    for failure in failures:
+        print(f"失败: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
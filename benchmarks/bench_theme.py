@@ -0,0 +1,107 @@
+"""
+主题样式基准：对比“每个控件内联样式表 + image:url 图标”与
+“全局样式表 + QIcon 缓存”两种方式下的控件构建与重绘耗时。
+
+用法（在项目根目录执行）：
+    python benchmarks/bench_theme.py [行数]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton
+from views.theme import STYLESHEET, apply_theme, icon_button
+
+ICONS = ['view', 'edit', 'import', 'delete']
+
+INLINE_STYLE = """
+    QPushButton {{
+        background-color: transparent;
+        border: none;
+        image: url(utils/img/{name}.png);
+        width: 16px;
+        height: 16px;
+    }}
+    QPushButton:pressed {{
+        padding: 2px;
+    }}
+"""
+
+
+def build_inline(rows):
+    """旧写法：每个按钮单独 setStyleSheet，图标由样式引擎逐个解码"""
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    for _ in range(rows):
+        row_layout = QHBoxLayout()
+        for name in ICONS:
+            button = QPushButton()
+            button.setStyleSheet(INLINE_STYLE.format(name=name))
+            row_layout.addWidget(button)
+        layout.addLayout(row_layout)
+    return root
+
+
+def build_themed(rows):
+    """新写法：全局样式表匹配 class 属性，图标取自缓存"""
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    for _ in range(rows):
+        row_layout = QHBoxLayout()
+        for name in ICONS:
+            row_layout.addWidget(icon_button(name))
+        layout.addLayout(row_layout)
+    return root
+
+
+def measure(label, build, rows):
+    """返回 (构建耗时, 首次绘制耗时, 重绘耗时)，单位毫秒"""
+    start = time.perf_counter()
+    widget = build(rows)
+    widget.resize(400, rows * 36)
+    built = time.perf_counter()
+    widget.grab()
+    first_paint = time.perf_counter()
+    widget.grab()
+    repaint = time.perf_counter()
+    widget.deleteLater()
+    QApplication.processEvents()
+    print(f"{label:<12} 构建 {(built - start) * 1000:8.1f} ms  "
+          f"首次绘制 {(first_paint - built) * 1000:8.1f} ms  "
+          f"重绘 {(repaint - first_paint) * 1000:8.1f} ms")
+
+
+def measure_dataset_view():
+    """在全局主题下构建并绘制数据集管理页"""
+    from views.dataset.dataset_view import DatasetView
+    start = time.perf_counter()
+    view = DatasetView()
+    built = time.perf_counter()
+    view.grab()
+    painted = time.perf_counter()
+    print(f"{'DatasetView':<12} 构建 {(built - start) * 1000:8.1f} ms  "
+          f"首次绘制 {(painted - built) * 1000:8.1f} ms")
+    view.deleteLater()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    app = QApplication(sys.argv)
+    print(f"按钮行数: {rows}（每行 {len(ICONS)} 个图标按钮）")
+
+    # 优化前：应用级样式表为空，全部样式内联
+    measure("内联样式", build_inline, rows)
+
+    # 优化后：安装一次全局样式表并预加载图标
+    start = time.perf_counter()
+    apply_theme(app)
+    print(f"{'安装主题':<12} {(time.perf_counter() - start) * 1000:8.1f} ms（样式表 {len(STYLESHEET)} 字符）")
+    measure("全局主题", build_themed, rows)
+    measure_dataset_view()
+
+
+if __name__ == '__main__':
+    main()
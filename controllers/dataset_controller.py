@@ -1,29 +1,56 @@
+import math
+from collections import Counter
 from functools import partial
-from itertools import count
-from PySide6.QtCore import QObject, Slot
+from PySide6.QtCore import QObject, QTimer, Slot
 from utils.database import DatabaseManager
 from utils.logger import get_logger
 from views.dataset.dataset_view import DatasetView
-from models.dataset_model import DatasetModel, DatasetStatus
-from datetime import datetime, timezone, timedelta
-from views.dataset.dataset_dialog import DatasetDialog
-from views.dataset.dataset_details_dialog import DatasetDetailsDialog
-from views.dataset.import_dialog import ImportDialog
-from models.dataset_son_model import DataModel
-from functools import partial
+from models.dataset_model import DatasetModel
+from models.dataset_son_model import DataModel, split_tags
+from models.dataset_stats_model import DatasetStatsModel
+from utils.pagination import KeysetPager
+from utils.count_cache import is_approximate, filter_signature
+from utils.data_events import notify_write
+from utils.page_cache import page_cache
+from utils.task_executor import TaskExecutor
+from utils.prefetcher import PagePrefetcher
+from utils.media_store import get_media_store
 
 
 logger = get_logger("dataset_controller")
 
+# 导入时每批写入的条数，每批与统计更新一起提交
+IMPORT_BATCH_SIZE = 500
+
 class DatasetController(QObject):
     def __init__(self, view: DatasetView):
         super().__init__()
         self.view = view
         self.logger = get_logger(__name__)
         self.current_page = 1
-        self.items_per_page = 10
+        self.items_per_page = self.view.page_size()
+        self.current_filters = None
+        # 相邻翻页走 keyset 游标，任意跳页回退到 OFFSET
+        self.pager = KeysetPager(
+            DatasetModel.get_keyset_datasets,
+            DatasetModel.get_offset_datasets,
+            partial(DatasetModel.count_datasets, approximate=True),
+            per_page=self.items_per_page,
+            cache_table=DatasetModel.__tablename__
+        )
+        self.executor = TaskExecutor(parent=self)
+        # 前台列表查询单线程串行执行，新查询提交时丢弃排队中的旧查询
+        self.query_executor = TaskExecutor(max_threads=1, parent=self)
+        self._query_generation = 0
+        self._load_task = None
+        # 界面操作触发的读写（打开对话框、增删改、导入）
+        self.action_executor = TaskExecutor(parent=self)
+        self.query_executor.busy_changed.connect(self.update_loading)
+        self.action_executor.busy_changed.connect(self.update_loading)
+        self.prefetcher = PagePrefetcher(parent=self)
         self.connect_signals()
-        self.load_initial_data()
+        # 首次加载推迟到页面显示之后
+        QTimer.singleShot(0, self.load_initial_data)
 
     def connect_signals(self):
         """连接所有信号"""
@@ -32,6 +59,7 @@ class DatasetController(QObject):
         self.view.insert_signal.connect(self.show_dataset_dialog)
         self.view.export_signal.connect(self.handle_export)
         self.view.page_changed_signal.connect(self.handle_page_change)
+        self.view.page_size_changed_signal.connect(self.handle_page_size_change)
         self.view.edit_signal.connect(self.show_dataset_dialog)
         self.view.view_signal.connect(self.show_dataset_details_dialog)
         self.view.import_signal.connect(self.show_import_dialog)
@@ -44,118 +72,179 @@ class DatasetController(QObject):
         self.load_data()
 
     def load_data(self):
-        """加载数据"""
-        try:
+        """在后台加载当前页，只有最新一次请求的结果会刷新表格"""
+        self._query_generation += 1
+        generation = self._query_generation
+        # 旧查询未开始的直接取消，已在执行的结果不再回调
+        self.query_executor.cancel_pending()
+        if self._load_task is not None:
+            self.query_executor.cancel(self._load_task)
+        snapshot = self.pager.snapshot()
+        self._load_task = self.query_executor.submit(
+            self._load_page, snapshot, self.current_page,
+            on_result=partial(self.apply_page, generation, snapshot),
+            on_error=partial(self.handle_load_error, generation)
+        )
+
+    def update_loading(self, _=None):
+        """前台查询或界面操作进行中时显示加载状态"""
+        self.view.set_loading(self.query_executor.is_busy() or self.action_executor.is_busy())
+
+    def _load_page(self, pager, page):
+        """工作线程：用分页器快照加载一页"""
+        with DatabaseManager.get_session() as session:
+            return pager.load(session, page)
+
+    def apply_page(self, generation, snapshot, result):
+        """GUI线程：丢弃已被新查询取代的结果，否则刷新表格"""
+        if generation != self._query_generation:
+            self.logger.debug(f"丢弃过期查询结果 (第 {generation} 次请求)")
+            return
+        datasets, total, pages, self.current_page = result
+        self.pager.merge(snapshot)
+        self.view.update_table(datasets, total, self.current_page, pages)
+        self.logger.debug(f"分页缓存统计: {page_cache.stats()}")
+        if is_approximate(total):
+            self.refine_total_count()
+        else:
+            # 预取相邻页，下一次翻页直接命中缓存
+            self.prefetcher.prefetch(self.pager, self.current_page, pages)
+
+    def handle_load_error(self, generation, message):
+        """加载失败，过期请求的错误不再提示"""
+        if generation != self._query_generation:
+            return
+        self.logger.error(f"加载数据失败: {message}")
+        self.view.show_error("错误", "加载数据失败")
+
+    def refine_total_count(self):
+        """后台计算精确总数（写入计数缓存），完成后刷新分页信息"""
+        filters = self.current_filters
+        signature = filter_signature(filters)
+
+        def count_exact():
             with DatabaseManager.get_session() as session:
-                datasets, total, pages = DatasetModel.get_paginated_datasets(
-                    session,
-                    page=self.current_page,
-                    per_page=self.items_per_page
-                )
-                self.view.update_table(datasets, total, self.current_page, pages)
-        except Exception as e:
-            self.logger.error(f"加载数据失败: {e}")
-            self.view.show_error("错误", "加载数据失败")
-        finally:
-            DatabaseManager.remove_session()
+                return DatasetModel.count_datasets(session, filters)
+
+        def apply_exact(total):
+            # 过滤条件已变化则丢弃结果
+            if filter_signature(self.current_filters) != signature:
+                return
+            per_page = self.pager.per_page
+            pages = math.ceil(total / per_page) if per_page > 0 else 1
+            if 0 < pages < self.current_page:
+                # 按近似总数跳到了实际末页之后：精确总数已写入计数缓存，重新加载时按它调整页码
+                self.current_page = pages
+                self.load_data()
+                return
+            self.view.update_pagination(total, self.current_page, pages)
+
+        self.executor.submit(count_exact, on_result=apply_exact)
+
+    def reload_after_write(self):
+        """写入后已记录的游标失效，清空后重新加载当前页"""
+        self.prefetcher.cancel()
+        self.pager.clear()
+        self.load_data()
 
     @Slot(dict)
     def handle_query(self, filters):
         """处理查询请求"""
         self.current_page = 1
-        try:
-            with DatabaseManager.get_session() as session:
-                datasets, total, pages = DatasetModel.get_paginated_datasets(
-                    session,
-                    page=self.current_page,
-                    per_page=self.items_per_page,
-                    filters=filters
-                )
-                print(f"datasets:{datasets}")
-                self.view.update_table(datasets, total, self.current_page, pages)
-        except Exception as e:
-            self.logger.error(f"查询失败: {e}")
-            self.view.show_error("错误", "查询数据失败")
-        finally:
-            DatabaseManager.remove_session()
+        self.current_filters = filters
+        self.prefetcher.cancel()
+        self.pager.reset(filters)
+        self.load_data()
 
     @Slot()
     def handle_reset(self):
         """处理重置请求"""
         # 重置所有过滤器
+        self.current_page = 1
+        self.current_filters = None
+        self.prefetcher.cancel()
+        self.pager.reset()
         self.load_data()
 
+    def run_db(self, fn, *args, on_result=None, error_text="数据库操作失败"):
+        """在工作线程执行数据库操作，失败时在GUI线程提示"""
+        def on_error(message):
+            self.logger.error(f"{error_text}: {message}")
+            self.view.show_error("错误", error_text)
+        return self.action_executor.submit(fn, *args, on_result=on_result, on_error=on_error)
+
+    def _get_dataset(self, dataset_id):
+        """工作线程：读取数据集，会话关闭后对象保留已加载的字段"""
+        with DatabaseManager.get_session() as session:
+            return DatasetModel.get_dataset_by_id(session, int(dataset_id))
+
     @Slot(str)
     def show_dataset_dialog(self, dataset_id=None):
         """显示数据集对话框,处理新建和修改请求"""
-        try:
-            dataset = None
-            mode = "insert"
-            
-            if dataset_id is not None:
-                with DatabaseManager.get_session() as session:
-                    dataset = DatasetModel.get_dataset_by_id(session, int(dataset_id))
-                    if not dataset:
-                        self.logger.warning(f"数据集 {dataset_id} 不存在")
-                        self.view.show_error("错误", "数据集不存在")
-                        return
-                mode = "modify"
-                    
-            dialog = DatasetDialog(self.view, dataset=dataset, mode=mode)
-            dialog.confirmed.connect(self.handle_dataset_operation)
-            dialog.exec()
-            
-        except Exception as e:
-            if dataset_id:
-                self.logger.error(f"获取数据集 {dataset_id} 失败: {e}")
-                self.view.show_error("错误", "获取数据集失败")
+        if dataset_id is None:
+            self.open_dataset_dialog(None, "insert")
+            return
+
+        def opened(dataset):
+            if not dataset:
+                self.logger.warning(f"数据集 {dataset_id} 不存在")
+                self.view.show_error("错误", "数据集不存在")
+                return
+            self.open_dataset_dialog(dataset, "modify")
+
+        self.run_db(self._get_dataset, dataset_id, on_result=opened, error_text="获取数据集失败")
+
+    def open_dataset_dialog(self, dataset, mode):
+        # 对话框模块在首次使用时才导入，不拖慢启动
+        from views.dataset.dataset_dialog import DatasetDialog
+        dialog = DatasetDialog(self.view, dataset=dataset, mode=mode)
+        dialog.confirmed.connect(self.handle_dataset_operation)
+        dialog.exec()
 
     @Slot(dict)
     def handle_dataset_operation(self, form_data):
         """处理数据集操作(新增/编辑)"""
-        try:
+        values = {
+            'dataset_name': form_data['dataset_name'],
+            'dataset_category': form_data['dataset_category'],
+            'status': form_data['status'],
+            'remark': form_data['remark']
+        }
+        mode = form_data['mode']
+
+        def save():
+            # 模型方法校验失败时只返回 None/False，转成异常以便在 failed 中提示原因
             with DatabaseManager.get_session() as session:
-                if form_data['mode'] == "insert":
-                    try:
-                        DatasetModel.add_dataset(session, {
-                            'dataset_name': form_data['dataset_name'],
-                            'dataset_category': form_data['dataset_category'],
-                            'status': form_data['status'],
-                            'remark': form_data['remark']
-                        })
-                        session.commit()
-                        self.view.show_message("提示", "数据集新增成功")
-                    except Exception as add_error:
-                        session.rollback()
-                        self.logger.error(f"新增数据集失败: {add_error}")
-                        self.view.show_error("错误", str(add_error))
-                        return
-                elif form_data['mode'] == "modify":
-                    try:
-                        DatasetModel.update_dataset(session, form_data['dataset_id'], {
-                            'dataset_name': form_data['dataset_name'],
-                            'dataset_category': form_data['dataset_category'],
-                            'status': form_data['status'],
-                            'remark': form_data['remark']
-                        })
-                        self.view.show_message("提示", "数据集修改成功")
-                    except Exception as update_error:
-                        self.logger.error(f"修改数据集失败: {update_error}")
-                        self.view.show_error("错误", str(update_error))
-                        return
-                self.load_data()
-        except Exception as e:
-            self.logger.error(f"数据集操作失败: {e}")
-            self.view.show_error("错误", "数据集操作失败")
-        finally:
-            DatabaseManager.remove_session()
+                if mode == "insert":
+                    if DatasetModel.add_dataset(session, values) is None:
+                        raise ValueError("数据集新增失败：名称为空、已存在，或分类/状态无效")
+                elif mode == "modify":
+                    if not DatasetModel.update_dataset(session, form_data['dataset_id'], values):
+                        raise ValueError("数据集修改失败：数据集不存在、名称已存在，或分类/状态无效")
+
+        def saved(_):
+            self.view.show_message("提示", "数据集新增成功" if mode == "insert" else "数据集修改成功")
+            self.reload_after_write()
+
+        def failed(message):
+            # 校验失败（如名称重复）的原因直接展示给用户
+            self.logger.error(f"{'新增' if mode == 'insert' else '修改'}数据集失败: {message}")
+            self.view.show_error("错误", message)
+
+        self.action_executor.submit(save, on_result=saved, on_error=failed)
 
     @Slot(str)
     def show_dataset_details_dialog(self, dataset_id):
         """处理查看请求"""
-        dataset = DatasetModel.get_dataset_by_id(DatabaseManager.get_session(), int(dataset_id))
-        dialog = DatasetDetailsDialog(dataset,self.view)
-        dialog.exec()
+        def opened(dataset):
+            if not dataset:
+                self.view.show_error("错误", "数据集不存在")
+                return
+            from views.dataset.dataset_details_dialog import DatasetDetailsDialog
+            dialog = DatasetDetailsDialog(dataset, self.view)
+            dialog.exec()
+
+        self.run_db(self._get_dataset, dataset_id, on_result=opened, error_text="获取数据集失败")
 
     # 新增导出、查看、导入、删除的槽函数模板
     @Slot()
@@ -167,6 +256,7 @@ class DatasetController(QObject):
     @Slot()
     def show_import_dialog(self, dataset_id):
         """处理导入请求"""
+        from views.dataset.import_dialog import ImportDialog
         dialog = ImportDialog(self.view, dataset_id)
         dialog.update_import_table()
         dialog.import_confirmed.connect(lambda datas:self.import_data(dataset_id, datas))
@@ -174,60 +264,129 @@ class DatasetController(QObject):
 
     @Slot(int,list)
     def import_data(self, dataset_id, datas):
-        """导入数据"""
-        # 实现导入逻辑
-        self.logger.info(f"导入数据到数据集 {dataset_id},datas : {datas}")
-        try:
-            with DatabaseManager.get_session() as session:
-                for data in datas:
-                    data['dataset_id'] = dataset_id
-                    data['title'] = data.get('title', '')
-                    data['tag'] = data.get('tag', '')
-                    data['answer'] = data.get('answer', '')
-                    DataModel.add_data(session, data, dataset_id)
-                    session.commit()
-                # 更新数据集的 content_size 字段
-                dataset = DatasetModel.get_dataset_by_id(session, dataset_id)
-                content_size = len(DataModel.get_all_data(session, dataset_id=dataset_id))                
-                dataset.content_size = content_size
-                session.commit()
+        """导入数据（在工作线程写入）"""
+        self.logger.info(f"导入数据到数据集 {dataset_id}, 共 {len(datas)} 条")
+        dataset_id = int(dataset_id)
+
+        def imported(result):
+            count, failed_media = result
+            if failed_media:
+                # 媒体文件读取失败的数据未导入，逐个列出（过多时截断）
+                shown = "\n".join(failed_media[:10]) + ("\n..." if len(failed_media) > 10 else "")
+                self.view.show_message("提示", f"已导入 {count} 条数据，{len(failed_media)} 条因媒体文件读取失败未导入：\n{shown}")
+            else:
                 self.view.show_message("提示", "数据导入成功")
+            self.reload_after_write()
 
-                self.load_data()
-                
-        except Exception as e:
-            self.logger.error(f"导入数据失败: {e}")
-            self.view.show_error("错误", "导入数据失败")
-        finally:
-            DatabaseManager.remove_session()
+        self.run_db(self._import_data, dataset_id, datas, on_result=imported, error_text="导入数据失败")
 
+    def _import_data(self, dataset_id, datas):
+        """
+        工作线程：分批写入数据子项、媒体文件并更新统计。
+        每批的数据、标签关联、content_size 与首页统计在同一事务中提交；
+        启用分片时数据在分片库，先提交分片再提交主库；主库提交失败时撤销分片上的本批数据。
+        媒体文件读取失败的数据不导入。
+        :return: (导入条数, 媒体文件读取失败的路径列表)
+        """
+        media_store = get_media_store()
+        imported = 0
+        failed_media = []
+        with DatabaseManager.get_session() as session:
+            shard = DataModel.shard_session(session, dataset_id)
+            try:
+                for start in range(0, len(datas), IMPORT_BATCH_SIZE):
+                    batch = []
+                    for data in datas[start:start + IMPORT_BATCH_SIZE]:
+                        data['title'] = data.get('title', '')
+                        data['answer'] = data.get('answer', '')
+                        if data.get('media_path'):
+                            # 媒体文件写入内容寻址存储，相同内容只存一份
+                            try:
+                                data['media_hash'], data['media_size'], data['media_type'] = media_store.put_file(data['media_path'])
+                            except OSError as e:
+                                self.logger.error(f"导入媒体文件失败 ({data['media_path']}): {e}")
+                                failed_media.append(data['media_path'])
+                                continue
+                        batch.append(data)
+                    if not batch:
+                        continue
+                    item_ids = [item.id for item in DataModel.add_data_batch(session, batch, dataset_id)]
+                    DatasetModel.add_content_size(session, dataset_id, len(batch))
+                    # 增量更新首页统计
+                    tag_counts = Counter(tag for data in batch for tag in split_tags(data.get('tags')))
+                    DatasetStatsModel.items_imported(session, len(batch), tag_counts)
+                    if shard is session:
+                        session.commit()
+                    else:
+                        shard.commit()
+                        try:
+                            session.commit()
+                        except Exception:
+                            # content_size 与统计未能写入：撤销分片上的本批数据，保持两边一致
+                            session.rollback()
+                            DataModel.discard_batch(shard, item_ids)
+                            raise
+                    imported += len(batch)
+            except Exception:
+                self.logger.error(f"导入中断 (数据集ID: {dataset_id})，已导入 {imported} 条", exc_info=True)
+                session.rollback()
+                shard.rollback()
+                raise
+            finally:
+                if imported:
+                    notify_write(DataModel.__tablename__, dataset_id)
+                    notify_write(DatasetModel.__tablename__)
+        return imported, failed_media
 
     @Slot(str)
     def handle_delete(self, dataset_id):
         """处理删除请求"""
-        dataset = DatasetModel.get_dataset_by_id(DatabaseManager.get_session(), int(dataset_id))
-        dataset_name = dataset.dataset_name
-        self.view.ask_for_confirmation("删除数据集", f"确定要删除数据集: \n{dataset_name} 吗？",dataset_id) 
+        def confirm(dataset):
+            if not dataset:
+                self.view.show_error("错误", "数据集不存在")
+                return
+            self.view.ask_for_confirmation("删除数据集", f"确定要删除数据集: \n{dataset.dataset_name} 吗？", dataset_id)
+
+        self.run_db(self._get_dataset, dataset_id, on_result=confirm, error_text="获取数据集失败")
 
     @Slot()
     def delete_dataset(self, dataset_id):
         """删除数据集"""
-        if dataset_id:
-            dataset_name = DatasetModel.get_dataset_by_id(DatabaseManager.get_session(), int(dataset_id)).dataset_name
-            try:
-                with DatabaseManager.get_session() as session:
-                    DatasetModel.delete_dataset(session, dataset_id)
-                    session.commit()
-                    self.view.show_message("提示", f"数据集:{dataset_name}删除成功")
-                    self.load_data()
-
-            except Exception as e:
-                self.logger.error(f"删除数据集 {dataset_id} 失败: {e}")
-                self.view.show_error("错误", "删除数据集失败")
-        
+        if not dataset_id:
+            return
+
+        def delete():
+            with DatabaseManager.get_session() as session:
+                dataset = DatasetModel.get_dataset_by_id(session, int(dataset_id))
+                if dataset is None:
+                    raise ValueError("数据集不存在")
+                dataset_name = dataset.dataset_name
+                if not DatasetModel.delete_dataset(session, int(dataset_id)):
+                    raise ValueError(f"数据集:{dataset_name}删除失败")
+                return dataset_name
+
+        def deleted(dataset_name):
+            self.view.show_message("提示", f"数据集:{dataset_name}删除成功")
+            self.reload_after_write()
+
+        def failed(message):
+            self.logger.error(f"删除数据集失败: {message}")
+            self.view.show_error("错误", message)
+
+        self.action_executor.submit(delete, on_result=deleted, on_error=failed)
+
     @Slot(int)
     def handle_page_change(self, page):
         """处理页码变化"""
         if page != self.current_page:
             self.current_page = page
             self.load_data()
+
+    @Slot(int)
+    def handle_page_size_change(self, per_page):
+        """切换每页条数，游标与分页缓存键都随之变化，从第一页重新加载"""
+        self.items_per_page = per_page
+        self.current_page = 1
+        self.prefetcher.cancel()
+        self.pager.reset(self.current_filters, per_page=per_page)
+        self.load_data()
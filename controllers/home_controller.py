@@ -0,0 +1,55 @@
+from PySide6.QtCore import QObject, Slot
+from utils.database import DatabaseManager
+from utils.logger import get_logger
+from utils.task_executor import TaskExecutor
+from utils import data_events
+from views.home_view import HomeView
+from models.dataset_stats_model import DatasetStatsModel
+
+
+class HomeController(QObject):
+    def __init__(self, view: HomeView):
+        super().__init__()
+        self.view = view
+        self.logger = get_logger(__name__)
+        self.dirty = True
+        self.executor = TaskExecutor(max_threads=1, parent=self)
+        self.connect_signals()
+        # 写入事件只标记看板过期，页面再次显示时才重新读取
+        data_events.subscribe(self.mark_dirty)
+
+    def connect_signals(self):
+        """连接所有信号"""
+        self.view.refresh_signal.connect(self.load_dashboard)
+        self.view.shown_signal.connect(self.handle_shown)
+
+    def mark_dirty(self, table_name=None, dataset_id=None):
+        """统计数据可能已变化"""
+        self.dirty = True
+
+    @Slot()
+    def handle_shown(self):
+        """页面显示时按需刷新"""
+        if self.dirty:
+            self.load_dashboard()
+
+    @Slot()
+    def load_dashboard(self):
+        """在后台读取预计算的统计数据"""
+        if self.executor.is_busy():
+            return
+        self.view.refresh_button.setEnabled(False)
+        self.executor.submit(self._read_dashboard, on_result=self.apply_dashboard, on_error=self.handle_error)
+
+    def _read_dashboard(self):
+        with DatabaseManager.get_session() as session:
+            return DatasetStatsModel.get_dashboard(session)
+
+    def apply_dashboard(self, stats):
+        self.view.update_dashboard(stats)
+        self.view.refresh_button.setEnabled(True)
+        self.dirty = False
+
+    def handle_error(self, message):
+        self.logger.error(f"加载首页统计失败: {message}")
+        self.view.refresh_button.setEnabled(True)
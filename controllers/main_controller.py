@@ -1,4 +1,4 @@
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QTimer, Slot
 
 class MainController(QObject):
     def __init__(self, main_window):
@@ -12,7 +12,8 @@ class MainController(QObject):
         # 这里不再需要连接 currentRowChanged
         
         # 初始化显示首页 (通过调用控制器的方法)
-        self.switch_page(0)
+        # 推迟到事件循环开始后，窗口先完成首次绘制，首页再创建
+        QTimer.singleShot(0, lambda: self.switch_page(0))
     
     @Slot(int)
     def switch_page(self, index):
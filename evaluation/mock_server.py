@@ -0,0 +1,81 @@
+"""
+本地模拟模型服务，实现 OpenAI 兼容的 /v1/chat/completions 接口，
+可配置延迟、抖动和错误率，用于评测执行器的联调与压测。
+
+用法（在项目根目录执行）：
+    python -m evaluation.mock_server --port 8900 --latency-ms 200 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import random
+from aiohttp import web
+
+
+def create_app(latency_ms=100, jitter_ms=50, error_rate=0.0, timeout_rate=0.0):
+    """
+    :param error_rate: 返回 503 的比例（可重试错误）
+    :param timeout_rate: 长时间不响应的比例，用于验证客户端超时
+    """
+    async def chat_completions(request):
+        payload = await request.json()
+        messages = payload.get('messages') or []
+        prompt = messages[-1].get('content', '') if messages else ''
+        if isinstance(prompt, list):
+            # 多模态消息：只取文本片段
+            prompt = ' '.join(part.get('text', '') for part in prompt if part.get('type') == 'text')
+
+        roll = random.random()
+        if roll < timeout_rate:
+            await asyncio.sleep(3600)
+        delay = max(latency_ms + random.uniform(-jitter_ms, jitter_ms), 0) / 1000
+        await asyncio.sleep(delay)
+        if roll < timeout_rate + error_rate:
+            return web.json_response({'error': {'message': 'mock overloaded'}}, status=503)
+
+        output = f"模拟回答: {prompt[:200]}"
+        return web.json_response({
+            'id': f"mock-{random.getrandbits(48):012x}",
+            'object': 'chat.completion',
+            'model': payload.get('model', 'mock-model'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': output},
+                'finish_reason': 'stop',
+            }],
+            'usage': {
+                'prompt_tokens': len(prompt.split()),
+                'completion_tokens': len(output.split()),
+                'total_tokens': len(prompt.split()) + len(output.split()),
+            },
+        })
+
+    app = web.Application()
+    app.router.add_post('/v1/chat/completions', chat_completions)
+    return app
+
+
+async def start_mock_server(host='127.0.0.1', port=8900, **options):
+    """在当前事件循环中启动模拟服务，返回 runner（调用 await runner.cleanup() 关闭）"""
+    runner = web.AppRunner(create_app(**options))
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地模拟模型服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--jitter-ms", type=float, default=50)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    web.run_app(
+        create_app(args.latency_ms, args.jitter_ms, args.error_rate, args.timeout_rate),
+        host=args.host, port=args.port
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+import aiohttp
+from utils.logger import get_logger
+
+logger = get_logger("model_adapter")
+
+# 需要重试的 HTTP 状态码：限流与服务端错误
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class ModelRequestError(Exception):
+    """模型请求失败，retryable 表示是否值得重试"""
+
+    def __init__(self, message, retryable=False, status=None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.status = status
+
+
+class ModelAdapter:
+    """
+    模型适配器基类。子类实现 generate，返回
+    {'output': 文本, 'prompt_tokens': int, 'completion_tokens': int}。
+    media 为随提示词一起发送的媒体：{'sha256': 哈希, 'mime_type': MIME 类型, 'data': base64 内容}。
+    """
+
+    def __init__(self, model, params=None):
+        self.model = model
+        self.params = params or {}
+
+    async def generate(self, http, prompt, media=None):
+        raise NotImplementedError
+
+
+# 音频 MIME 子类型与 input_audio.format 的对应
+AUDIO_FORMATS = {'mpeg': 'mp3', 'mp3': 'mp3', 'wav': 'wav', 'x-wav': 'wav', 'wave': 'wav'}
+
+
+def media_content_part(media):
+    """把媒体转换为 OpenAI 兼容接口的消息内容片段"""
+    kind, _, subtype = media['mime_type'].partition('/')
+    data_url = f"data:{media['mime_type']};base64,{media['data']}"
+    if kind == 'image':
+        return {'type': 'image_url', 'image_url': {'url': data_url}}
+    if kind == 'video':
+        return {'type': 'video_url', 'video_url': {'url': data_url}}
+    if kind == 'audio' and subtype in AUDIO_FORMATS:
+        return {'type': 'input_audio', 'input_audio': {'data': media['data'], 'format': AUDIO_FORMATS[subtype]}}
+    raise ModelRequestError(f"不支持的媒体类型: {media['mime_type']}")
+
+
+class OpenAICompatibleAdapter(ModelAdapter):
+    """OpenAI 兼容的 /v1/chat/completions 接口（vLLM、本地模拟服务等）"""
+
+    def __init__(self, base_url, model, api_key=None, params=None):
+        super().__init__(model, params)
+        self.url = base_url.rstrip('/') + '/v1/chat/completions'
+        self.headers = {'Content-Type': 'application/json'}
+        if api_key:
+            self.headers['Authorization'] = f"Bearer {api_key}"
+
+    async def generate(self, http, prompt, media=None):
+        content = [{'type': 'text', 'text': prompt}, media_content_part(media)] if media else prompt
+        payload = {
+            'model': self.model,
+            'messages': [{'role': 'user', 'content': content}],
+            **self.params,
+        }
+        try:
+            async with http.post(self.url, json=payload, headers=self.headers) as response:
+                if response.status != 200:
+                    body = await response.text()
+                    raise ModelRequestError(
+                        f"HTTP {response.status}: {body[:200]}",
+                        retryable=response.status in RETRYABLE_STATUS,
+                        status=response.status
+                    )
+                data = await response.json()
+        except aiohttp.ClientError as e:
+            # 连接断开、读取中断等网络错误均可重试
+            raise ModelRequestError(f"{type(e).__name__}: {e}", retryable=True) from e
+
+        try:
+            output = data['choices'][0]['message']['content']
+        except (KeyError, IndexError, TypeError) as e:
+            raise ModelRequestError(f"响应格式无效: {str(data)[:200]}") from e
+        usage = data.get('usage') or {}
+        return {
+            'output': output,
+            'prompt_tokens': usage.get('prompt_tokens'),
+            'completion_tokens': usage.get('completion_tokens'),
+        }
+
@@ -0,0 +1,99 @@
+import asyncio
+import hashlib
+import json
+from evaluation.model_adapter import ModelAdapter, ModelRequestError
+from utils.disk_lru import LRUDirectory
+from utils.logger import get_logger
+
+logger = get_logger("response_cache")
+
+
+def cache_key(model, prompt, params=None, media_hash=None):
+    """缓存键：模型名、采样参数、提示词哈希与媒体哈希（如有）共同决定"""
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    params_json = json.dumps(params or {}, sort_keys=True, ensure_ascii=False)
+    source = f"{model}\n{params_json}\n{prompt_hash}" + (f"\n{media_hash}" if media_hash else "")
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+class ResponseDiskCache:
+    """
+    模型响应的磁盘缓存：每条响应一个 JSON 文件，存放在 <root>/ab/<key>.json，
+    总大小超过上限时按最近访问时间淘汰。可在工作线程中并发使用。
+    """
+
+    def __init__(self, root='data/eval_cache', max_bytes=1024 * 1024 * 1024):
+        self.files = LRUDirectory(root, max_bytes, suffix='.json', fanout=True)
+        logger.info(f"响应缓存: {len(self.files)} 条, {self.files.total_bytes / 1024 / 1024:.1f} MB")
+
+    def get(self, key):
+        """命中时返回响应字典，并刷新访问时间"""
+        path = self.files.touch(key)
+        if path is None:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"响应缓存读取失败，已忽略: {key} ({e})")
+            self.files.discard(key)
+            return None
+
+    def put(self, key, response):
+        """写入响应，必要时淘汰最久未访问的条目"""
+        def write(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(response, f, ensure_ascii=False)
+            return True
+
+        self.files.write(key, write)
+
+
+class CachedAdapter(ModelAdapter):
+    """
+    带缓存的模型适配器：先查磁盘缓存，未命中再请求被包装的适配器。
+    相同键的请求进行中时，后到的请求等待同一个结果而不再重复发送，
+    因此重复运行和数据集内重复的题目对每个唯一提示词只请求一次。
+    只缓存成功的响应；来自缓存或合并等待的响应带 cached=True，其耗时与 token 数并非本次请求产生。
+    """
+
+    def __init__(self, adapter, cache):
+        super().__init__(adapter.model, adapter.params)
+        self.adapter = adapter
+        self.cache = cache
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+        self._inflight = {}
+
+    async def generate(self, http, prompt, media=None):
+        key = cache_key(self.model, prompt, self.params, media['sha256'] if media else None)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats['coalesced'] += 1
+            # shield：等待方超时取消时不影响发起方的请求
+            response = await asyncio.shield(pending)
+            return {**response, 'cached': True}
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await asyncio.to_thread(self.cache.get, key)
+            if response is not None:
+                self.stats['hits'] += 1
+                future.set_result(response)
+                return {**response, 'cached': True}
+            self.stats['misses'] += 1
+            response = await self.adapter.generate(http, prompt, media)
+            future.set_result(response)
+            # 写盘完成前仍登记为进行中，期间到达的相同请求直接复用结果
+            await asyncio.to_thread(self.cache.put, key, response)
+            return response
+        except BaseException as e:
+            if not future.done():
+                # 发起方被取消（如超时）时，等待方按可重试错误处理，由执行器各自重试
+                error = e if isinstance(e, ModelRequestError) else ModelRequestError(
+                    f"合并的请求未完成: {type(e).__name__}", retryable=True)
+                future.set_exception(error)
+                future.exception()  # 没有等待方时避免“异常未被读取”的警告
+            raise
+        finally:
+            self._inflight.pop(key, None)
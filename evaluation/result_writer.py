@@ -0,0 +1,82 @@
+import asyncio
+import queue
+import threading
+import time
+from utils.database import DatabaseManager
+from utils.logger import get_logger
+from models.eval_model import EvalResultModel
+
+logger = get_logger("result_writer")
+
+_STOP = object()
+
+
+class ResultWriter:
+    """
+    评测结果的缓冲写入器：请求路径上只做入队，后台线程攒够一批
+    （或距上次写入超过 flush_interval 秒）后一次批量写入。
+    队列有上限，数据库写不动时 add 只让调用它的工作协程等待，不阻塞事件循环。
+    两次写入都失败的批次计入 dropped，调用方据此把运行标记为失败。
+    """
+
+    def __init__(self, run_id, batch_size=500, flush_interval=1.0, max_pending=50000):
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        self.counts = {'total': 0, 'succeeded': 0, 'failed': 0}
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._loop, name=f"eval-writer-{run_id}", daemon=True)
+        self._thread.start()
+
+    async def add(self, result):
+        """提交一条结果（作为 EvalRunner.run 的 on_result 回调）"""
+        self.counts['total'] += 1
+        self.counts['succeeded' if result.get('error') is None else 'failed'] += 1
+        try:
+            self._queue.put_nowait(result)
+        except queue.Full:
+            # 队列已满：在线程中等待空位，背压只作用于当前工作协程
+            await asyncio.to_thread(self._queue.put, result)
+
+    def close(self, timeout=None):
+        """写完队列中剩余的结果后停止后台线程"""
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        logger.info(f"评测结果写入完成 (运行ID: {self.run_id}): 写入 {self.written} 条，失败 {self.dropped} 条")
+
+    def _loop(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        stopping = False
+        try:
+            while not stopping:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    if item is _STOP:
+                        stopping = True
+                    else:
+                        batch.append(item)
+                except queue.Empty:
+                    pass
+                if batch and (stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                    self._flush(batch)
+                    batch = []
+                if time.monotonic() >= deadline:
+                    deadline = time.monotonic() + self.flush_interval
+        finally:
+            DatabaseManager.remove_session()
+
+    def _flush(self, batch):
+        """写入一批，失败时重试一次，仍失败则记录丢弃条数"""
+        for attempt in (1, 2):
+            try:
+                with DatabaseManager.get_session() as session:
+                    self.written += EvalResultModel.bulk_insert(session, self.run_id, batch)
+                return
+            except Exception as e:
+                logger.warning(f"评测结果写入失败 (第 {attempt} 次, {len(batch)} 条): {e}")
+                DatabaseManager.remove_session()
+        logger.error(f"评测结果写入失败，已丢弃 {len(batch)} 条 (运行ID: {self.run_id})")
+        self.dropped += len(batch)
@@ -0,0 +1,99 @@
+"""
+对数据集执行一次评测，结果写入 t_eval_run / t_eval_result。模型服务地址、并发数等默认值取自 config/database.ini 的 [evaluation]。
+
+用法（在项目根目录执行）：
+    python -m evaluation.run_eval --dataset-id 1 [--model mock-model] [--concurrency 64]
+"""
+import argparse
+import asyncio
+import sys
+from utils.database import DatabaseManager
+from utils.logger import setup_logging, get_logger
+from evaluation.model_adapter import OpenAICompatibleAdapter
+from evaluation.runner import EvalRunner, dataset_items
+from evaluation.result_writer import ResultWriter
+from evaluation.response_cache import ResponseDiskCache, CachedAdapter
+from models.eval_model import Base as EvalBase, EvalRunModel, EvalResultModel, EvalRunStatus
+from utils.schema import ensure_columns
+from utils.media_store import get_media_store
+
+logger = get_logger("run_eval")
+
+
+def main():
+    setup_logging()
+    config = DatabaseManager.load_config()
+    section = config['evaluation'] if config.has_section('evaluation') else {}
+
+    parser = argparse.ArgumentParser(description="数据集评测")
+    parser.add_argument("--dataset-id", type=int, required=True)
+    parser.add_argument("--base-url", default=section.get('base_url', 'http://127.0.0.1:8900'))
+    parser.add_argument("--model", default=section.get('model', 'mock-model'))
+    parser.add_argument("--api-key", default=section.get('api_key') or None)
+    parser.add_argument("--concurrency", type=int, default=int(section.get('concurrency', 32)))
+    parser.add_argument("--timeout", type=float, default=float(section.get('timeout_seconds', 60)))
+    parser.add_argument("--max-retries", type=int, default=int(section.get('max_retries', 3)))
+    parser.add_argument("--temperature", type=float, default=None)
+    parser.add_argument("--max-tokens", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true", help="不读写响应缓存，全部重新请求")
+    args = parser.parse_args()
+
+    DatabaseManager.initialize_engine()
+    if DatabaseManager.get_engine() is None:
+        logger.critical("数据库初始化失败，评测退出。")
+        sys.exit(1)
+
+    EvalBase.metadata.create_all(DatabaseManager.get_engine())
+    ensure_columns(DatabaseManager.get_engine(), EvalResultModel)
+
+    params = {}
+    if args.temperature is not None:
+        params['temperature'] = args.temperature
+    if args.max_tokens is not None:
+        params['max_tokens'] = args.max_tokens
+    adapter = OpenAICompatibleAdapter(args.base_url, args.model, args.api_key, params)
+    if not args.no_cache:
+        cache_dir = section.get('cache_dir', 'data/eval_cache')
+        cache_mb = int(section.get('cache_mb', 1024))
+        adapter = CachedAdapter(adapter, ResponseDiskCache(cache_dir, cache_mb * 1024 * 1024))
+    runner = EvalRunner(adapter, args.concurrency, args.timeout, args.max_retries, media_store=get_media_store())
+    run_config = {
+        'base_url': args.base_url, 'concurrency': args.concurrency, 'timeout': args.timeout,
+        'max_retries': args.max_retries, 'params': params, 'cache': not args.no_cache,
+    }
+    with DatabaseManager.get_session() as session:
+        run_id = EvalRunModel.create_run(session, args.dataset_id, args.model, run_config)
+    if run_id is None:
+        DatabaseManager.close_engine()
+        sys.exit(1)
+
+    # 结果经缓冲写入器批量落库，事件循环线程只负责入队
+    writer = ResultWriter(run_id)
+    stats = None
+    status = EvalRunStatus.FAILED
+    try:
+        stats = asyncio.run(runner.run(dataset_items(args.dataset_id), on_result=writer.add))
+        status = EvalRunStatus.FINISHED
+    except KeyboardInterrupt:
+        status = EvalRunStatus.CANCELLED
+        raise
+    finally:
+        writer.close()
+        if writer.dropped:
+            # 有结果未能落库时，运行记录不完整
+            logger.error(f"运行 {run_id} 有 {writer.dropped} 条结果写入失败，标记为失败")
+            status = EvalRunStatus.FAILED
+        with DatabaseManager.get_session() as session:
+            EvalRunModel.finish_run(session, run_id, writer.counts, status)
+        DatabaseManager.remove_session()
+        DatabaseManager.close_engine()
+    print(f"运行 {run_id}（{status.value}）：完成 {stats['total']} 条，失败 {stats['failed']} 条，"
+          f"未保存 {writer.dropped} 条，耗时 {stats['elapsed_seconds']}s，{stats['per_minute']} 条/分钟")
+    if isinstance(adapter, CachedAdapter):
+        print(f"响应缓存：命中 {adapter.stats['hits']}，合并 {adapter.stats['coalesced']}，"
+              f"实际请求 {adapter.stats['misses']}（取自缓存的结果已标记 cached，不计入模型耗时统计）")
+    if status is not EvalRunStatus.FINISHED:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+import asyncio
+import inspect
+import random
+import time
+import aiohttp
+from utils.database import DatabaseManager
+from utils.logger import get_logger
+from models.dataset_son_model import DataModel
+from evaluation.model_adapter import ModelRequestError
+
+logger = get_logger("eval_runner")
+
+DEFAULT_PROMPT_TEMPLATE = "{title}"
+CONTEXT_PROMPT_TEMPLATE = "参考资料：\n{context}\n\n问题：{title}"
+
+
+def render_prompt(title, context=None, template=None):
+    """根据数据标题和上下文生成提示词"""
+    if template:
+        return template.format(title=title, context=context or '')
+    if context:
+        return CONTEXT_PROMPT_TEMPLATE.format(title=title, context=context)
+    return DEFAULT_PROMPT_TEMPLATE.format(title=title)
+
+
+def _read_batch(dataset_id, after_id, batch_size):
+    """工作线程：读取一批启用的数据"""
+    try:
+        with DatabaseManager.get_session() as session:
+            return DataModel.get_enabled_batch(session, dataset_id, after_id, batch_size, with_media=True)
+    finally:
+        DatabaseManager.remove_session()
+
+
+async def dataset_items(dataset_id, batch_size=500):
+    """按主键顺序流式产出数据集中启用的数据 (ID, 标题, 上下文, 媒体哈希, MIME 类型)，数据库读取不阻塞事件循环"""
+    after_id = 0
+    while True:
+        rows = await asyncio.to_thread(_read_batch, dataset_id, after_id, batch_size)
+        for row in rows:
+            yield row
+        if len(rows) < batch_size:
+            return
+        after_id = rows[-1][0]
+
+
+class EvalRunner:
+    """
+    评测执行器：把数据逐条发送给模型适配器。
+    并发数由固定数量的工作协程控制，待发送队列有上限，读取速度随请求速度自动放缓；
+    每次请求有独立超时，可重试的错误按指数退避重试。
+    """
+
+    def __init__(self, adapter, concurrency=32, timeout=60, max_retries=3, backoff=0.5, prompt_template=None,
+                 media_store=None):
+        """:param media_store: MediaStore，数据带媒体文件时从中读取并随提示词发送"""
+        self.adapter = adapter
+        self.media_store = media_store
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.prompt_template = prompt_template
+        self._stopped = False
+
+    def cancel(self):
+        """停止运行：不再取新数据，进行中的请求完成后结束"""
+        self._stopped = True
+
+    async def run(self, items, on_result=None):
+        """
+        执行一次评测。
+        :param items: 异步迭代器，产出 (数据ID, 标题, 上下文[, 媒体哈希, MIME 类型])，如 dataset_items(dataset_id)
+        :param on_result: 每条结果的回调（在事件循环线程调用，不应阻塞）；
+                          返回 awaitable 时会等待它完成，可借此对工作协程施加背压
+        :return: 汇总信息
+        :raises: 读取数据或处理结果出错时抛出原异常，已完成的结果已通过 on_result 交出
+        """
+        self._stopped = False
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        stats = {'total': 0, 'succeeded': 0, 'failed': 0, 'cached': 0}
+        start = time.perf_counter()
+
+        async def stop_workers():
+            for _ in range(self.concurrency):
+                await queue.put(None)
+
+        async def produce():
+            # 读完或读取出错时通知工作协程退出；被取消时工作协程也已取消，不再入队
+            try:
+                async for item in items:
+                    if self._stopped:
+                        break
+                    await queue.put(item)
+            except Exception:
+                await stop_workers()
+                raise
+            await stop_workers()
+
+        async def work(http):
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                result = await self.evaluate(http, item)
+                stats['total'] += 1
+                stats['succeeded' if result['error'] is None else 'failed'] += 1
+                stats['cached'] += result['cached']
+                if on_result:
+                    pending = on_result(result)
+                    if inspect.isawaitable(pending):
+                        await pending
+                if stats['total'] % 1000 == 0:
+                    logger.info(f"评测进度: 已完成 {stats['total']} 条，失败 {stats['failed']} 条")
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        async with aiohttp.ClientSession(connector=connector) as http:
+            producer = asyncio.create_task(produce())
+            workers = [asyncio.create_task(work(http)) for _ in range(self.concurrency)]
+            try:
+                done, _ = await asyncio.wait(workers, return_when=asyncio.FIRST_EXCEPTION)
+            finally:
+                # 任一工作协程出错（或本次运行被取消）时，其余协程须在关闭 HTTP 会话前停止
+                for task in workers + [producer]:
+                    task.cancel()
+                await asyncio.gather(*workers, producer, return_exceptions=True)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+            # 读取数据出错时数据流提前结束，不能当作完整的运行
+            if not producer.cancelled() and producer.exception() is not None:
+                raise producer.exception()
+
+        elapsed = time.perf_counter() - start
+        stats['elapsed_seconds'] = round(elapsed, 3)
+        stats['per_minute'] = round(stats['total'] / elapsed * 60, 1) if elapsed > 0 else 0
+        logger.info(f"评测结束: {stats}")
+        return stats
+
+    async def evaluate(self, http, item):
+        """
+        发送单条数据，失败时按策略重试，返回结果字典（error 为 None 表示成功）。
+        cached 为 True 表示输出取自响应缓存，latency_ms 不代表模型的实际耗时。
+        """
+        data_id, title, context = item[:3]
+        prompt = render_prompt(title, context, self.prompt_template)
+        try:
+            media = await self.load_media(item)
+        except OSError as e:
+            # 媒体文件缺失或不可读，重试无意义，不发送请求
+            return self._failure(data_id, 0, f"读取媒体文件失败: {e}")
+        error = None
+        for attempt in range(1, self.max_retries + 2):
+            start = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(self.adapter.generate(http, prompt, media), self.timeout)
+                return {
+                    'data_id': data_id,
+                    'output': response['output'],
+                    'latency_ms': int((time.perf_counter() - start) * 1000),
+                    'prompt_tokens': response.get('prompt_tokens'),
+                    'completion_tokens': response.get('completion_tokens'),
+                    'attempts': attempt,
+                    'error': None,
+                    'cached': bool(response.get('cached')),
+                }
+            except asyncio.TimeoutError:
+                error, retryable = f"请求超时 ({self.timeout}s)", True
+            except ModelRequestError as e:
+                error, retryable = str(e), e.retryable
+            if not retryable or attempt > self.max_retries:
+                break
+            # 指数退避并加入随机抖动，避免限流时所有请求同时重试
+            await asyncio.sleep(self.backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+
+        return self._failure(data_id, attempt, error)
+
+    async def load_media(self, item):
+        """读取数据附带的媒体文件（在工作线程编码），无媒体时返回 None"""
+        if self.media_store is None or len(item) < 5 or not item[3]:
+            return None
+        digest, mime_type = item[3], item[4]
+        data = await asyncio.to_thread(self.media_store.encode_base64, digest)
+        return {'sha256': digest, 'mime_type': mime_type or 'application/octet-stream', 'data': data}
+
+    @staticmethod
+    def _failure(data_id, attempts, error):
+        logger.warning(f"评测请求失败 (数据ID: {data_id}, 尝试 {attempts} 次): {error}")
+        return {
+            'data_id': data_id,
+            'output': None,
+            'latency_ms': None,
+            'prompt_tokens': None,
+            'completion_tokens': None,
+            'attempts': attempts,
+            'error': error,
+            'cached': False,
+        }
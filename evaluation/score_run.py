@@ -0,0 +1,105 @@
+"""
+为一次评测运行打分：按批读取运行结果与对应的参考答案（DataModel.answer），
+交给评分引擎计算后把各项分数回写到 t_eval_result.scores。
+
+用法（在项目根目录执行）：
+    python -m evaluation.score_run --run-id 1 [--metrics exact_match,token_f1] [--processes 8]
+"""
+import argparse
+import json
+import math
+import sys
+import numpy as np
+from utils.database import DatabaseManager
+from utils.logger import setup_logging, get_logger
+from models.dataset_son_model import DataModel
+from models.eval_model import EvalRunModel, EvalResultModel
+from evaluation.scoring import ScoringEngine, METRICS
+
+logger = get_logger("score_run")
+
+
+def _save_scores(session, rows, scores):
+    """回写一批评分，未能全部保存时抛出异常"""
+    saved = EvalResultModel.update_scores(session, {
+        row[0]: {metric: None if math.isnan(values[i]) else round(float(values[i]), 4)
+                 for metric, values in scores.items()}
+        for i, row in enumerate(rows)
+    })
+    if saved != len(rows):
+        raise RuntimeError(f"评分回写失败：{len(rows)} 条中仅保存 {saved} 条")
+
+
+def score_run(run_id, engine, batch_size=20000):
+    """
+    对运行中成功的结果评分（失败的请求没有输出，不参与评分）。
+    读取下一批与回写上一批都在进程池评分当前批的同时进行。
+    :return: 各指标汇总，运行不存在时返回 None；评分回写失败时抛出异常
+    """
+    with DatabaseManager.get_session() as session:
+        run = EvalRunModel.get_run(session, run_id)
+        if run is None:
+            logger.error(f"评测运行不存在 (ID: {run_id})")
+            return None
+        dataset_id = run['dataset_id']
+
+        def read_batch(after_id):
+            """读取一批结果并提交评分，返回 (结果行, 参与评分的行, 评分句柄, 跳过的失败条数)"""
+            rows = EvalResultModel.get_results(session, run_id, after_id, batch_size)
+            succeeded = [row for row in rows if row[3] is None]
+            answers = DataModel.get_answers(session, dataset_id, {row[1] for row in succeeded})
+            handle = engine.submit([row[2] for row in succeeded], [answers.get(row[1]) for row in succeeded])
+            return rows, succeeded, handle, len(rows) - len(succeeded)
+
+        batches = []
+        skipped = 0
+        rows, succeeded, handle, batch_skipped = read_batch(0)
+        while rows:
+            skipped += batch_skipped
+            if len(rows) == batch_size:
+                next_batch = read_batch(rows[-1][0])
+            else:
+                next_batch = ([], [], None, 0)
+            scores = engine.collect(handle)
+            _save_scores(session, succeeded, scores)
+            batches.append(scores)
+            logger.info(f"评分进度 (运行ID: {run_id}): 已处理至结果ID {rows[-1][0]}")
+            rows, succeeded, handle, batch_skipped = next_batch
+
+    if not batches:
+        return {}
+    summary = engine.summarize({metric: np.concatenate([scores[metric] for scores in batches])
+                                for metric in engine.metrics})
+    logger.info(f"评分完成 (运行ID: {run_id}): {summary}，跳过失败结果 {skipped} 条")
+    return summary
+
+
+def main():
+    setup_logging()
+    parser = argparse.ArgumentParser(description="评测结果评分")
+    parser.add_argument("--run-id", type=int, required=True)
+    parser.add_argument("--metrics", default=",".join(METRICS))
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=20000)
+    args = parser.parse_args()
+
+    DatabaseManager.initialize_engine()
+    if DatabaseManager.get_engine() is None:
+        logger.critical("数据库初始化失败，评分退出。")
+        sys.exit(1)
+    try:
+        with ScoringEngine(args.metrics.split(","), processes=args.processes) as engine:
+            summary = score_run(args.run_id, engine, args.batch_size)
+    except Exception as e:
+        logger.error(f"评分失败 (运行ID: {args.run_id}): {e}", exc_info=True)
+        summary = None
+    finally:
+        DatabaseManager.remove_session()
+        DatabaseManager.close_engine()
+    if summary is None:
+        sys.exit(1)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
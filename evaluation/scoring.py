@@ -0,0 +1,246 @@
+"""
+模型输出评分：精确匹配、归一化匹配、词级 F1、BLEU、ROUGE-L 与数值容差匹配。
+
+评分按块进行：块内的比较、计数与聚合用 NumPy 向量化完成，
+BLEU / ROUGE-L 等逐对计算的指标随整个块一起交给进程池并行。
+参考答案缺失（或数值指标中参考答案不含数字）的条目得分为 NaN，汇总时忽略。
+"""
+import math
+import os
+import re
+import unicodedata
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+import numpy as np
+
+METRICS = ('exact_match', 'normalized_match', 'token_f1', 'bleu', 'rouge_l', 'numeric_match')
+DEFAULT_METRICS = METRICS
+
+_PUNCT_RE = re.compile(r"[^\w\s]|_")
+_SPACE_RE = re.compile(r"\s+")
+# 中日韩文字逐字切分，其余按连续字母数字切分
+_TOKEN_RE = re.compile(r"[㐀-䶿一-鿿豈-﫿]|[^\W_㐀-䶿一-鿿豈-﫿]+")
+_NUMBER_RE = re.compile(r"[-+]?(?:\d[\d,]*(?:\.\d+)?|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def normalize_text(text):
+    """全角转半角、转小写、去标点并合并空白"""
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKC', text).lower()
+    return _SPACE_RE.sub(' ', _PUNCT_RE.sub(' ', text)).strip()
+
+
+def tokenize(normalized):
+    """对归一化后的文本分词"""
+    return _TOKEN_RE.findall(normalized)
+
+
+def extract_number(text):
+    """取文本中最后一个数字（答案通常在末尾），没有数字时返回 NaN"""
+    if not text:
+        return math.nan
+    matches = _NUMBER_RE.findall(unicodedata.normalize('NFKC', text))
+    if not matches:
+        return math.nan
+    try:
+        return float(matches[-1].replace(',', ''))
+    except ValueError:
+        return math.nan
+
+
+def token_f1(pred_tokens, ref_tokens):
+    """
+    一批 (预测, 参考) 的词级 F1。
+    词先编码为整数，按 (条目, 词) 组合键用 np.unique 计数，
+    两侧键求交集后取较小计数即为重叠词数，整批只需几次数组运算。
+    """
+    count = len(pred_tokens)
+    vocab = {}
+
+    def encode(token_lists):
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=count)
+        ids = np.fromiter(
+            (vocab.setdefault(token, len(vocab)) for tokens in token_lists for token in tokens),
+            dtype=np.int64, count=int(lengths.sum())
+        )
+        return lengths, np.repeat(np.arange(count, dtype=np.int64), lengths), ids
+
+    pred_len, pred_owner, pred_ids = encode(pred_tokens)
+    ref_len, ref_owner, ref_ids = encode(ref_tokens)
+    width = max(len(vocab), 1)
+    pred_keys, pred_counts = np.unique(pred_owner * width + pred_ids, return_counts=True)
+    ref_keys, ref_counts = np.unique(ref_owner * width + ref_ids, return_counts=True)
+    common, pred_index, ref_index = np.intersect1d(pred_keys, ref_keys, assume_unique=True, return_indices=True)
+    overlap = np.bincount(common // width, weights=np.minimum(pred_counts[pred_index], ref_counts[ref_index]),
+                          minlength=count)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = overlap / pred_len
+        recall = overlap / ref_len
+        f1 = np.where(overlap > 0, 2 * precision * recall / (precision + recall), 0.0)
+    f1[(pred_len == 0) & (ref_len == 0)] = 1.0
+    return f1
+
+
+def _ngrams(tokens, n):
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+def sentence_bleu(pred, ref, max_n=4):
+    """句级 BLEU，高阶 n-gram 加一平滑，短答案不会因缺少 4-gram 直接得 0"""
+    if not pred or not ref:
+        return 0.0
+    log_precision = 0.0
+    for n in range(1, max_n + 1):
+        overlap = sum((_ngrams(pred, n) & _ngrams(ref, n)).values())
+        total = max(len(pred) - n + 1, 0)
+        if n > 1:
+            overlap, total = overlap + 1, total + 1
+        if overlap == 0:
+            return 0.0
+        log_precision += math.log(overlap / total)
+    brevity = min(0.0, 1 - len(ref) / len(pred))
+    return math.exp(log_precision / max_n + brevity)
+
+
+def lcs_length(a, b):
+    """最长公共子序列长度（位并行算法，O(len(a) * len(b) / 字长)）"""
+    if not a or not b:
+        return 0
+    masks = {}
+    for i, token in enumerate(a):
+        masks[token] = masks.get(token, 0) | (1 << i)
+    full = (1 << len(a)) - 1
+    row = full
+    for token in b:
+        matched = row & masks.get(token, 0)
+        row = ((row + matched) | (row - matched)) & full
+    return len(a) - bin(row).count('1')
+
+
+def rouge_l(pred, ref):
+    """ROUGE-L F 值"""
+    lcs = lcs_length(ref, pred)
+    if lcs == 0:
+        return 0.0
+    precision, recall = lcs / len(pred), lcs / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+
+def score_chunk(predictions, references, metrics=DEFAULT_METRICS, rel_tol=1e-4, abs_tol=1e-6):
+    """
+    计算一块数据的各项指标（进程池的工作函数）。
+    :return: {指标: float64 数组}，与输入一一对应
+    """
+    count = len(predictions)
+    has_ref = np.fromiter((ref is not None for ref in references), dtype=bool, count=count)
+    predictions = [pred or '' for pred in predictions]
+    references = [ref or '' for ref in references]
+    scores = {}
+
+    if 'exact_match' in metrics:
+        pred_array = np.array([pred.strip() for pred in predictions], dtype=object)
+        ref_array = np.array([ref.strip() for ref in references], dtype=object)
+        scores['exact_match'] = (pred_array == ref_array).astype(np.float64)
+
+    needs_tokens = {'token_f1', 'bleu', 'rouge_l'} & set(metrics)
+    if 'normalized_match' in metrics or needs_tokens:
+        norm_preds = [normalize_text(pred) for pred in predictions]
+        norm_refs = [normalize_text(ref) for ref in references]
+        if 'normalized_match' in metrics:
+            scores['normalized_match'] = (
+                np.array(norm_preds, dtype=object) == np.array(norm_refs, dtype=object)
+            ).astype(np.float64)
+        if needs_tokens:
+            pred_tokens = [tokenize(text) for text in norm_preds]
+            ref_tokens = [tokenize(text) for text in norm_refs]
+            if 'token_f1' in metrics:
+                scores['token_f1'] = token_f1(pred_tokens, ref_tokens)
+            if 'bleu' in metrics:
+                scores['bleu'] = np.fromiter(map(sentence_bleu, pred_tokens, ref_tokens), dtype=np.float64, count=count)
+            if 'rouge_l' in metrics:
+                scores['rouge_l'] = np.fromiter(map(rouge_l, pred_tokens, ref_tokens), dtype=np.float64, count=count)
+
+    if 'numeric_match' in metrics:
+        pred_numbers = np.fromiter(map(extract_number, predictions), dtype=np.float64, count=count)
+        ref_numbers = np.fromiter(map(extract_number, references), dtype=np.float64, count=count)
+        matched = np.isclose(pred_numbers, ref_numbers, rtol=rel_tol, atol=abs_tol).astype(np.float64)
+        scores['numeric_match'] = np.where(np.isnan(ref_numbers), np.nan, matched)
+
+    for values in scores.values():
+        values[~has_ref] = np.nan
+    return scores
+
+
+class ScoringEngine:
+    """
+    批量评分引擎：把一批输出按进程数切块，交给进程池并行评分。
+    processes=0 时在当前进程内计算（调试或小批量）。
+    """
+
+    def __init__(self, metrics=DEFAULT_METRICS, processes=None, chunk_size=2000, rel_tol=1e-4, abs_tol=1e-6):
+        unknown = set(metrics) - set(METRICS)
+        if unknown:
+            raise ValueError(f"未知的评分指标: {', '.join(sorted(unknown))}")
+        self.metrics = tuple(metrics)
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.chunk_size = chunk_size
+        self._score_chunk = partial(score_chunk, metrics=self.metrics, rel_tol=rel_tol, abs_tol=abs_tol)
+        self._pool = None
+
+    def submit(self, predictions, references):
+        """
+        提交一批评分，返回交给 collect() 的句柄。使用进程池时立即返回，
+        调用方可在评分进行的同时读写数据库。
+        块大小不超过 ceil(条数 / 进程数)，保证每批都能分给全部进程。
+        :param predictions: 模型输出列表（失败的条目可为 None）
+        :param references: 参考答案列表（缺失为 None）
+        """
+        if len(predictions) != len(references):
+            raise ValueError("预测与参考答案数量不一致")
+        size = self.chunk_size
+        if self.processes > 1:
+            size = max(1, min(size, math.ceil(len(predictions) / self.processes)))
+        pred_chunks = [predictions[i:i + size] for i in range(0, len(predictions), size)]
+        ref_chunks = [references[i:i + size] for i in range(0, len(references), size)]
+        if self.processes <= 1 or len(pred_chunks) <= 1:
+            return list(map(self._score_chunk, pred_chunks, ref_chunks))
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processes)
+        return [self._pool.submit(self._score_chunk, preds, refs) for preds, refs in zip(pred_chunks, ref_chunks)]
+
+    def collect(self, handle):
+        """等待 submit() 的结果，返回 {指标: float64 数组}"""
+        parts = [part.result() if isinstance(part, Future) else part for part in handle]
+        if not parts:
+            return {metric: np.empty(0) for metric in self.metrics}
+        return {metric: np.concatenate([part[metric] for part in parts]) for metric in self.metrics}
+
+    def score(self, predictions, references):
+        """同步评分，返回 {指标: float64 数组}"""
+        return self.collect(self.submit(predictions, references))
+
+    @staticmethod
+    def summarize(scores):
+        """各指标平均分（忽略 NaN）及参与计分的条数"""
+        summary = {}
+        for metric, values in scores.items():
+            valid = ~np.isnan(values)
+            summary[metric] = {
+                'mean': round(float(values[valid].mean()), 4) if valid.any() else None,
+                'count': int(valid.sum()),
+            }
+        return summary
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,27 @@
+from sqlalchemy import Table, Column, DateTime
+from sqlalchemy.orm import declarative_base
+from datetime import datetime
+from models.dataset_model import DatasetModel
+from models.dataset_son_model import DataModel
+
+Base = declarative_base()
+
+
+def archive_table_for(model):
+    """按业务表结构生成对应的归档表 <表名>_archive，额外记录归档时间"""
+    source = model.__table__
+    columns = [
+        Column(c.name, c.type, primary_key=c.primary_key, autoincrement=False,
+               nullable=c.nullable, comment=c.comment)
+        for c in source.columns
+    ]
+    columns.append(Column('archived_time', DateTime, nullable=False, default=datetime.utcnow, comment='归档时间'))
+    return Table(f"{source.name}_archive", Base.metadata, *columns,
+                 comment=f"{source.name} 的归档表，存放已软删除的历史数据")
+
+
+# 归档顺序：先子项，后数据集
+ARCHIVE_TABLES = [
+    (DataModel, archive_table_for(DataModel)),
+    (DatasetModel, archive_table_for(DatasetModel)),
+]
@@ -1,10 +1,16 @@
 from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLAlchemyEnum, Index
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.sql import func
-from datetime import datetime
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql import func, text
 import enum
-import math
 from utils.logger import get_logger
+from utils.pagination import apply_keyset, page_bounds
+from utils.count_cache import count_cache, has_filters, ApproximateCount, APPROXIMATE_COUNT_THRESHOLD
+from utils.data_events import notify_write
+from utils.fulltext import match_clauses
+from utils.sharding import ShardRouter
+from models.projected_row import ProjectedRow
+from models.dataset_son_model import DataModel
+from models.dataset_stats_model import DatasetStatsModel
 from datetime import datetime, timezone, timedelta
 # from views.dataset.dataset_view import DatasetView
 
@@ -25,6 +31,10 @@ class DatasetCategory(enum.Enum):
 
 class DatasetModel(Base):
     __tablename__ = 't_dataset_info'
+    __table_args__ = (
+        # keyset 分页索引：WHERE del_flag=0 ORDER BY created_time DESC, id DESC
+        Index('idx_dataset_del_created', 'del_flag', 'created_time', 'id'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment='数据集ID，主键自增')
     dataset_name = Column(String(255), nullable=False, unique=True, comment='数据集名称，不允许为空')
@@ -48,6 +58,11 @@ class DatasetModel(Base):
             "created_time": self.created_time.strftime('%Y-%m-%d %H:%M:%S') if self.created_time else None # 格式化时间
         }
 
+    @classmethod
+    def list_columns(cls):
+        """列表页展示所需的列，不含备注等详情字段"""
+        return (cls.id, cls.dataset_name, cls.dataset_category, cls.status, cls.content_size, cls.created_time)
+
     @classmethod
     def _apply_filters(cls, query, filters):
         """安全地应用过滤条件到查询，兼容QDate类型"""
@@ -59,10 +74,9 @@ class DatasetModel(Base):
         try:
             # 过滤已删除的数据集
             query = query.filter(cls.del_flag == 0)
-            # 名称过滤
+            # 名称过滤（全文索引，前缀匹配）
             if filters.get('dataset_name'):
-                search_term = f"%{str(filters['dataset_name']).strip()}%"
-                query = query.filter(cls.dataset_name.ilike(search_term))
+                query = query.filter(*match_clauses(query.session, cls, ('dataset_name',), filters['dataset_name']))
 
             # 状态过滤
             if filters.get('status') and filters['status'] != '全部':
@@ -103,34 +117,93 @@ class DatasetModel(Base):
         return query
 
     @classmethod
-    def get_paginated_datasets(cls, session, page=1, per_page=10, filters=None):
-        """获取分页的数据集，基于过滤条件"""
+    def count_datasets(cls, session, filters=None, approximate=False):
+        """
+        统计满足过滤条件的数据集数量，结果按过滤签名缓存，写入时失效。
+        approximate=True 时，无过滤条件的大表先返回表统计估算值。
+        """
         if not session:
             logger.error("数据库会话不可用")
-            return [], 0, 1 # 数据、总条目数、总页数
+            return 0
 
-        query = session.query(cls)
-        query = cls._apply_filters(query, filters)
+        key = count_cache.key(cls.__tablename__, filters)
+        cached = count_cache.get(key)
+        if cached is not None:
+            return cached
+        version = count_cache.version(cls.__tablename__)
 
         try:
-            total_items = query.count()
-            total_pages = math.ceil(total_items / per_page) if per_page > 0 else 1
-            if page < 1:
-                page = 1
-            elif page > total_pages and total_pages > 0:
-                page = total_pages # 若页码超出总页数，则调整为最后一页
-
-            offset = (page - 1) * per_page
-            datasets = query.order_by(cls.created_time.desc()).offset(offset).limit(per_page).all()
-            
-            # 将数据集对象转换为字典
-            dataset_dicts = [d.to_dict() for d in datasets]
-            
-            return dataset_dicts, total_items, total_pages
+            if approximate and not has_filters(filters):
+                estimate = cls.estimate_count(session)
+                if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+                    return ApproximateCount(estimate)
+
+            # 直接 SELECT COUNT，避免 query.count() 包装子查询
+            query = cls._apply_filters(session.query(func.count(cls.id)), filters)
+            total = query.scalar() or 0
+            count_cache.set(key, total, version)
+            return total
+        except Exception as e:
+            logger.error(f"统计数据集数量时出错: {e}", exc_info=True)
+            session.rollback()
+            return 0
+
+    @classmethod
+    def estimate_count(cls, session):
+        """从表统计信息估算行数（仅MySQL），无法估算时返回 None"""
+        try:
+            if session.get_bind().dialect.name != 'mysql':
+                return None
+            rows = session.execute(
+                text("SELECT TABLE_ROWS FROM information_schema.TABLES "
+                     "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"),
+                {"table_name": cls.__tablename__}
+            ).scalar()
+            return int(rows) if rows is not None else None
+        except Exception as e:
+            logger.warning(f"读取表统计信息失败: {e}")
+            session.rollback()
+            return None
+
+    @classmethod
+    def get_keyset_datasets(cls, session, cursor=None, direction="next", per_page=10, filters=None):
+        """基于 (created_time, id) 游标获取一页数据集（仅展示列），返回 (投影行, 首行游标, 末行游标)"""
+        if not session:
+            logger.error("数据库会话不可用")
+            return [], None, None
+
+        try:
+            query = cls._apply_filters(session.query(*cls.list_columns()), filters)
+            query = apply_keyset(query, cls.created_time, cls.id, cursor, direction)
+            datasets = query.limit(per_page).all()
+            if direction == "prev":
+                datasets.reverse()
+
+            first_cursor, last_cursor = page_bounds(datasets)
+            return [ProjectedRow(d) for d in datasets], first_cursor, last_cursor
+        except Exception as e:
+            logger.error(f"按游标获取数据集时出错: {e}", exc_info=True)
+            session.rollback()
+            return [], None, None
+
+    @classmethod
+    def get_offset_datasets(cls, session, page=1, per_page=10, filters=None):
+        """按 OFFSET 获取指定页数据集（仅用于任意跳页），返回 (投影行, 首行游标, 末行游标)"""
+        if not session:
+            logger.error("数据库会话不可用")
+            return [], None, None
+
+        try:
+            query = cls._apply_filters(session.query(*cls.list_columns()), filters)
+            offset = (max(page, 1) - 1) * per_page
+            datasets = query.order_by(cls.created_time.desc(), cls.id.desc()).offset(offset).limit(per_page).all()
+
+            first_cursor, last_cursor = page_bounds(datasets)
+            return [ProjectedRow(d) for d in datasets], first_cursor, last_cursor
         except Exception as e:
             logger.error(f"获取分页数据集时出错: {e}", exc_info=True)
-            session.rollback() # 出错时回滚
-            return [], 0, 1
+            session.rollback()
+            return [], None, None
 
     @classmethod
     def get_all_datasets(cls, session, filters=None):
@@ -187,7 +260,9 @@ class DatasetModel(Base):
                 created_time=datetime.now(timezone(timedelta(hours=8)))  # 设置为中国时区(UTC+8)
             )
             session.add(new_dataset)
+            DatasetStatsModel.dataset_added(session, dataset_category.value, status.value)
             session.commit()
+            notify_write(cls.__tablename__)
             logger.info(f"已成功添加数据集 (名称: {dataset_name}, 类别: {dataset_category})")
             return new_dataset
         except ValueError as ve:
@@ -220,14 +295,44 @@ class DatasetModel(Base):
             session.rollback()
             return None
 
+    @classmethod
+    def add_content_size(cls, session, dataset_id, delta):
+        """在当前事务中增减数据集的 content_size（不提交），并发导入时不会互相覆盖"""
+        session.query(cls).filter(cls.id == dataset_id).update(
+            {cls.content_size: cls.content_size + delta}, synchronize_session=False
+        )
+
     @classmethod
     def delete_dataset(cls, session, dataset_id):
-        """删除数据集"""
+        """
+        删除数据集。数据子项在独立分片上时，先提交主库的删除，再级联软删除分片上的数据子项：
+        级联失败只会留下所属数据集已删除的数据子项，由 repair_deleted_cascades 补齐，
+        而不会出现数据子项已删除、数据集却仍存在的情况。
+        """
+        shard = DataModel.shard_session(session, dataset_id)
         try:
             dataset = session.query(cls).filter(cls.id == dataset_id).first()
             if dataset:
+                now = datetime.now(timezone(timedelta(hours=8)))  # 设置为中国时区(UTC+8)
+                if dataset.del_flag == 0:
+                    # 同步扣减统计
+                    DatasetStatsModel.dataset_removed(
+                        session, dataset.dataset_category.value, dataset.status.value,
+                        dataset.content_size, DataModel.count_tags(session, dataset.id)
+                    )
                 dataset.del_flag = 1
-                session.commit()
+                dataset.updated_time = now
+                if shard is session:
+                    # 未分片：数据集与数据子项在同一事务中删除
+                    deleted_items = cls._cascade_delete_items(session, [dataset.id], now)
+                    session.commit()
+                else:
+                    session.commit()
+                    deleted_items = cls._cascade_delete_items_on_shard(shard, dataset_id, now)
+                notify_write(cls.__tablename__)
+                notify_write(DataModel.__tablename__, dataset_id)
+                if deleted_items is not None:
+                    logger.info(f"已级联删除数据集 {dataset_id} 的 {deleted_items} 条数据")
                 logger.info(f"已成功删除数据集 (ID: {dataset_id})")
                 return True
             else:
@@ -238,6 +343,60 @@ class DatasetModel(Base):
             session.rollback()
             return False
 
+    @classmethod
+    def _cascade_delete_items(cls, shard, dataset_ids, now):
+        """级联软删除数据子项：单条集合式 UPDATE（不提交），返回删除条数"""
+        return shard.query(DataModel).filter(
+            DataModel.dataset_id.in_(dataset_ids),
+            DataModel.del_flag == 0
+        ).update({DataModel.del_flag: 1, DataModel.updated_time: now}, synchronize_session=False)
+
+    @classmethod
+    def _cascade_delete_items_on_shard(cls, shard, dataset_id, now, attempts=2):
+        """主库删除提交后在分片上级联删除，失败时重试；仍失败返回 None，留待 repair_deleted_cascades 补齐"""
+        for attempt in range(1, attempts + 1):
+            try:
+                deleted_items = cls._cascade_delete_items(shard, [dataset_id], now)
+                shard.commit()
+                return deleted_items
+            except Exception as e:
+                shard.rollback()
+                logger.warning(f"分片级联删除数据子项失败 (数据集ID: {dataset_id}, 第 {attempt} 次): {e}")
+        logger.error(f"数据集 {dataset_id} 已删除，但其数据子项未能级联删除，将由维护任务补齐")
+        return None
+
+    @classmethod
+    def repair_deleted_cascades(cls, session, batch_size=1000):
+        """
+        补齐分片上的级联删除：把所属数据集已删除、自身仍未删除的数据子项软删除。
+        仅在启用分片时需要（未分片时删除在同一事务中完成），返回补齐条数。
+        """
+        shard_sessions = ShardRouter.all_sessions(session)
+        if shard_sessions == [session]:
+            return 0
+        total = 0
+        last_id = 0
+        try:
+            while True:
+                dataset_ids = [row[0] for row in session.query(cls.id).filter(
+                    cls.del_flag == 1, cls.id > last_id
+                ).order_by(cls.id).limit(batch_size).all()]
+                if not dataset_ids:
+                    break
+                now = datetime.now(timezone(timedelta(hours=8)))
+                for shard in shard_sessions:
+                    total += cls._cascade_delete_items(shard, dataset_ids, now)
+                    shard.commit()
+                last_id = dataset_ids[-1]
+        except Exception as e:
+            logger.error(f"补齐级联删除时出错: {e}", exc_info=True)
+            for shard in shard_sessions:
+                shard.rollback()
+        if total:
+            logger.info(f"已补齐 {total} 条所属数据集已删除的数据子项")
+            notify_write(DataModel.__tablename__)
+        return total
+
     @classmethod
     def update_dataset(cls, session, dataset_id, dataset_data):
         """更新数据集"""    
@@ -255,13 +414,20 @@ class DatasetModel(Base):
                 try:
                     dataset = session.query(cls).filter(cls.id == dataset_id).first()
                     if dataset:
+                        old_category, old_status = dataset.dataset_category, dataset.status
                         dataset.dataset_name = dataset_data.get('dataset_name')
                         dataset.dataset_category = DatasetCategory(dataset_data.get('dataset_category'))
                         dataset.status = DatasetStatus(dataset_data.get('status'))
                         dataset.remark = dataset_data.get('remark')
-                        dataset.content_size = dataset_data.get('content_size')
+                        if dataset_data.get('content_size') is not None:
+                            dataset.content_size = dataset_data.get('content_size')
                         dataset.updated_time = datetime.now(timezone(timedelta(hours=8)))  # 设置为中国时区(UTC+8)
+                        DatasetStatsModel.dataset_changed(
+                            session, old_category.value, old_status.value,
+                            dataset.dataset_category.value, dataset.status.value
+                        )
                         session.commit()
+                        notify_write(cls.__tablename__)
                         logger.info(f"已成功更新数据集 (ID: {dataset_id})")
                         return True
                     else:
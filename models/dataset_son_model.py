@@ -1,11 +1,19 @@
-from turtle import title
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLAlchemyEnum, Index
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import Column, Integer, BigInteger, String, Text, LargeBinary, DateTime, Enum as SQLAlchemyEnum, Index
+from sqlalchemy.orm import declarative_base, deferred, undefer_group
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects import mysql
 from sqlalchemy.sql import func
-from datetime import datetime
 import enum
-import math
+import zlib
 from utils.logger import get_logger
+from utils.pagination import apply_keyset, page_bounds
+from utils.count_cache import count_cache, has_filters, ApproximateCount, APPROXIMATE_COUNT_THRESHOLD
+from utils.data_events import notify_write
+from utils.fulltext import match_clauses
+from models.projected_row import ProjectedRow
+from models.tag_model import DataTagModel, normalize_tag_name
+from utils.sharding import ShardRouter
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 # from views.dataset.dataset_view import DatasetView
 
@@ -13,6 +21,51 @@ from datetime import datetime, timezone, timedelta
 Base = declarative_base()
 logger = get_logger("dataset_son_model")
 
+# 列表页只展示标题、答案的前若干个字符
+TITLE_PREVIEW_LENGTH = 100
+ANSWER_PREVIEW_LENGTH = 100
+# 长文本列的延迟加载分组，打开单条数据时才读取
+LONG_TEXT_GROUP = 'long_text'
+
+
+class CompressedText(TypeDecorator):
+    """zlib 压缩存储的长文本，读写时自动解压/压缩"""
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'mysql':
+            return dialect.type_descriptor(mysql.MEDIUMBLOB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zlib.compress(str(value).encode('utf-8'))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return zlib.decompress(value).decode('utf-8')
+
+
+def long_text():
+    """长文本类型：MySQL 使用 MEDIUMTEXT（最大 16MB），其他数据库使用 TEXT"""
+    return Text().with_variant(mysql.MEDIUMTEXT(), 'mysql')
+
+
+def preview_answer(answer):
+    """答案预览，列表页直接读取，无需加载完整答案"""
+    return answer[:ANSWER_PREVIEW_LENGTH] if answer else answer
+
+
+def split_tags(tag):
+    """拆分逗号分隔的标签字符串（兼容中文逗号），去除空白与重复，名称按标签表长度截断"""
+    if not tag:
+        return []
+    names = (t.strip() for t in str(tag).replace('，', ',').split(','))
+    return list(dict.fromkeys(normalize_tag_name(n) for n in names if n and n.lower() != 'nan'))
+
 class DataStatus(enum.Enum):
     DISABLED = "停用"
     ENABLED = "启用"
@@ -20,11 +73,24 @@ class DataStatus(enum.Enum):
 
 class DataModel(Base):
     __tablename__ = 't_data_info'
+    __table_args__ = (
+        # keyset 分页索引：WHERE dataset_id=? AND del_flag=0 ORDER BY created_time DESC, id DESC
+        Index('idx_data_dataset_del_created', 'dataset_id', 'del_flag', 'created_time', 'id'),
+        # 按内容哈希查找引用同一媒体文件的数据
+        Index('idx_data_media_hash', 'media_hash'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment='数据ID，主键自增')
     dataset_id = Column(Integer, nullable=False, comment='数据集ID')
-    title = Column(String(255), nullable=False, comment='数据标题')
-    answer = Column(String(255), nullable=False, comment='数据答案')
+    title = Column(long_text(), nullable=False, comment='数据标题')
+    # 完整答案和上下文只在打开单条数据时加载
+    answer = deferred(Column(long_text(), nullable=False, comment='数据答案'), group=LONG_TEXT_GROUP)
+    answer_preview = Column(String(ANSWER_PREVIEW_LENGTH), nullable=True, comment='答案预览（前若干字符）')
+    context = deferred(Column(CompressedText, nullable=True, comment='参考上下文（压缩存储）'), group=LONG_TEXT_GROUP)
+    # 图片/视频/音频数据集的媒体文件存放在内容寻址存储中，这里只记录哈希
+    media_hash = Column(String(64), nullable=True, comment='媒体文件 sha256')
+    media_type = Column(String(100), nullable=True, comment='媒体 MIME 类型')
+    media_size = Column(BigInteger, nullable=True, comment='媒体文件字节数')
     status = Column(SQLAlchemyEnum(DataStatus), nullable=False, comment='数据状态')
     tag = Column(String(255), nullable=True, comment='数据标签')
     del_flag = Column(Integer, nullable=False, default=0, comment='删除标记，0未删除，1已删除')
@@ -37,12 +103,30 @@ class DataModel(Base):
             "dataset_id": self.dataset_id,
             "title": self.title,
             "answer": self.answer, # 返回枚举值
+            "context": self.context,
+            "media_hash": self.media_hash,
+            "media_type": self.media_type,
+            "media_size": self.media_size,
             "status": self.status.value if isinstance(self.status, DataStatus) else self.status, # 返回枚举值
             "tag": self.tag,
             "del_flag": self.del_flag,
             "created_time": self.created_time.strftime('%Y-%m-%d %H:%M:%S') if self.created_time else None # 格式化时间
         }
 
+    @classmethod
+    def shard_session(cls, session, dataset_id):
+        """数据集所在分片的会话，未启用分片时即为主库会话"""
+        return ShardRouter.session_for(session, dataset_id)
+
+    @classmethod
+    def list_columns(cls):
+        """列表页展示所需的列，标题截取预览部分，答案读取预览列，不触及长文本"""
+        return (cls.id, cls.dataset_id,
+                func.substr(cls.title, 1, TITLE_PREVIEW_LENGTH).label('title'),
+                cls.answer_preview.label('answer'),
+                cls.media_hash, cls.media_type,
+                cls.status, cls.tag, cls.created_time)
+
     @classmethod
     def _apply_filters(cls, query, filters, dataset_id):
         """安全地应用过滤条件到查询，兼容QDate类型"""
@@ -53,10 +137,21 @@ class DataModel(Base):
         try:
             # 过滤已删除的数据集
             query = query.filter((cls.del_flag == 0) & (cls.dataset_id == dataset_id))
-            # 名称过滤
+            # 标题过滤（全文索引，前缀匹配）
             if filters.get('title'):
-                search_term = f"%{str(filters['title']).strip()}%"
-                query = query.filter(cls.title.ilike(search_term))
+                query = query.filter(*match_clauses(query.session, cls, ('title',), filters['title']))
+
+            # 关键词过滤：同时检索标题、答案和标签
+            if filters.get('keyword'):
+                query = query.filter(*match_clauses(query.session, cls, ('title', 'answer', 'tag'), filters['keyword']))
+
+            # 标签过滤：走标签倒排索引，tag_mode 为 'and' 时须包含全部标签
+            if filters.get('tags'):
+                tags = filters['tags']
+                names = split_tags(tags) if isinstance(tags, str) else [str(t).strip() for t in tags if str(t).strip()]
+                if names:
+                    mode = 'and' if filters.get('tag_mode') == 'and' else 'or'
+                    query = query.filter(cls.id.in_(DataTagModel.matching_data_ids(names, mode, dataset_id)))
 
             # 状态过滤
             if filters.get('status') and filters['status'] != '全部':
@@ -89,34 +184,167 @@ class DataModel(Base):
         return query
 
     @classmethod
-    def get_paginated_data(cls, session, page=1, per_page=10, filters=None, dataset_id=None):
-        """获取分页的数据集，基于过滤条件"""
+    def count_data(cls, session, filters=None, dataset_id=None, approximate=False):
+        """
+        统计数据集下满足过滤条件的数据条数，结果按过滤签名缓存，写入时失效。
+        approximate=True 时，无过滤条件且数据集较大时返回数据集维护的 content_size 作为估算值，
+        与 DatasetModel.count_datasets 使用同一阈值，小数据集仍精确统计。
+        """
         if not session:
             logger.error("数据库会话不可用")
-            return [], 0, 1 # 数据、总条目数、总页数
+            return 0
 
-        query = session.query(cls)
-        query = cls._apply_filters(query, filters, dataset_id)
+        key = count_cache.key(cls.__tablename__, filters, dataset_id)
+        cached = count_cache.get(key)
+        if cached is not None:
+            return cached
+        version = count_cache.version(cls.__tablename__)
 
         try:
-            total_items = query.count()
-            total_pages = math.ceil(total_items / per_page) if per_page > 0 else 1
-            if page < 1:
-                page = 1
-            elif page > total_pages and total_pages > 0:
-                page = total_pages # 若页码超出总页数，则调整为最后一页
-
-            offset = (page - 1) * per_page
-            data = query.order_by(cls.created_time.desc()).offset(offset).limit(per_page).all()
-            
-            # 将数据集对象转换为字典
-            data_dicts = [d.to_dict() for d in data]
-            
-            return data_dicts, total_items, total_pages
+            if approximate and not has_filters(filters):
+                estimate = cls.estimate_count(session, dataset_id)
+                if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+                    return ApproximateCount(estimate)
+
+            # 直接 SELECT COUNT，避免 query.count() 包装子查询
+            shard = cls.shard_session(session, dataset_id)
+            query = cls._apply_filters(shard.query(func.count(cls.id)), filters, dataset_id)
+            total = query.scalar() or 0
+            count_cache.set(key, total, version)
+            return total
+        except Exception as e:
+            logger.error(f"统计数据条数时出错: {e}", exc_info=True)
+            session.rollback()
+            cls.shard_session(session, dataset_id).rollback()
+            return 0
+
+    @classmethod
+    def estimate_count(cls, session, dataset_id):
+        """以数据集维护的 content_size 估算数据条数"""
+        from models.dataset_model import DatasetModel
+        try:
+            return session.query(DatasetModel.content_size).filter(DatasetModel.id == dataset_id).scalar()
+        except Exception as e:
+            logger.warning(f"读取数据集内容量失败 (ID: {dataset_id}): {e}")
+            session.rollback()
+            return None
+
+    @classmethod
+    def get_keyset_data(cls, session, cursor=None, direction="next", per_page=10, filters=None, dataset_id=None):
+        """
+        基于 (created_time, id) 游标获取一页数据（仅展示列），返回 (投影行, 首行游标, 末行游标)。
+        出错时抛出异常，调用方据此区分读取失败与数据已读完。
+        """
+        if not session:
+            raise ValueError("数据库会话不可用")
+
+        session = cls.shard_session(session, dataset_id)
+        try:
+            query = cls._apply_filters(session.query(*cls.list_columns()), filters, dataset_id)
+            query = apply_keyset(query, cls.created_time, cls.id, cursor, direction)
+            data = query.limit(per_page).all()
+            if direction == "prev":
+                data.reverse()
+
+            first_cursor, last_cursor = page_bounds(data)
+            return [ProjectedRow(d) for d in data], first_cursor, last_cursor
+        except Exception as e:
+            logger.error(f"按游标获取数据时出错: {e}", exc_info=True)
+            session.rollback()
+            raise
+
+    @classmethod
+    def get_data_detail(cls, session, data_id, dataset_id):
+        """打开单条数据时读取完整内容（含延迟加载的答案与上下文）"""
+        shard = cls.shard_session(session, dataset_id)
+        try:
+            data = shard.query(cls).options(undefer_group(LONG_TEXT_GROUP)).filter(
+                cls.id == data_id, cls.dataset_id == dataset_id
+            ).first()
+            return data.to_dict() if data else None
+        except Exception as e:
+            logger.error(f"读取数据详情时出错 (ID: {data_id}): {e}", exc_info=True)
+            shard.rollback()
+            return None
+
+    @classmethod
+    def get_enabled_batch(cls, session, dataset_id, after_id=0, batch_size=500, with_answer=False, with_media=False):
+        """
+        按主键顺序读取数据集下一批启用的数据（评测执行器流式读取用），
+        返回 [(ID, 标题, 上下文[, 答案][, 媒体哈希, MIME 类型]), ...]，调用方以最后一行ID作为下一批的 after_id。
+        读取出错时抛出异常，避免评测把中断的数据流当作读取完毕。
+        """
+        shard = cls.shard_session(session, dataset_id)
+        columns = [cls.id, cls.title, cls.context] + ([cls.answer] if with_answer else [])
+        if with_media:
+            columns += [cls.media_hash, cls.media_type]
+        try:
+            rows = shard.query(*columns).filter(
+                cls.dataset_id == dataset_id, cls.del_flag == 0,
+                cls.status == DataStatus.ENABLED, cls.id > after_id
+            ).order_by(cls.id).limit(batch_size).all()
+            return [tuple(row) for row in rows]
+        except Exception as e:
+            logger.error(f"读取评测数据时出错 (数据集ID: {dataset_id}): {e}", exc_info=True)
+            shard.rollback()
+            raise
+
+    @classmethod
+    def get_answers(cls, session, dataset_id, data_ids):
+        """按ID批量读取参考答案（评分用），返回 {数据ID: 答案}，出错时抛出异常"""
+        if not data_ids:
+            return {}
+        shard = cls.shard_session(session, dataset_id)
+        try:
+            rows = shard.query(cls.id, cls.answer).filter(
+                cls.dataset_id == dataset_id, cls.id.in_(list(data_ids))
+            ).all()
+            return {row.id: row.answer for row in rows}
+        except Exception as e:
+            logger.error(f"读取参考答案时出错 (数据集ID: {dataset_id}): {e}", exc_info=True)
+            shard.rollback()
+            raise
+
+    @classmethod
+    def backfill_previews(cls, session, batch_size=2000):
+        """为历史数据补建答案预览列"""
+        try:
+            total = 0
+            while True:
+                ids = [row[0] for row in session.query(cls.id).filter(
+                    cls.answer_preview.is_(None)
+                ).order_by(cls.id).limit(batch_size).all()]
+                if not ids:
+                    break
+                session.query(cls).filter(cls.id.in_(ids)).update(
+                    {cls.answer_preview: func.coalesce(func.substr(cls.answer, 1, ANSWER_PREVIEW_LENGTH), '')},
+                    synchronize_session=False
+                )
+                session.commit()
+                total += len(ids)
+            if total:
+                logger.info(f"已为 {total} 条历史数据补建答案预览")
+            return total
         except Exception as e:
-            logger.error(f"获取分页数据集时出错: {e}", exc_info=True)
-            session.rollback() # 出错时回滚
-            return [], 0, 1
+            logger.error(f"补建答案预览时出错: {e}", exc_info=True)
+            session.rollback()
+            return 0
+
+    @classmethod
+    def count_tags(cls, session, dataset_id):
+        """统计某个数据集下各标签的数据条数"""
+        return DataTagModel.count_tags(cls.shard_session(session, dataset_id), dataset_id=dataset_id)
+
+    @classmethod
+    def count_all_tags(cls, session, dataset_ids):
+        """统计一组数据集下各标签的数据条数，各分片并行统计后汇总"""
+        dataset_ids = list(dataset_ids)
+        if not dataset_ids:
+            return Counter()
+        total = Counter()
+        for counts in ShardRouter.map(session, lambda shard: DataTagModel.count_tags(shard, dataset_ids=dataset_ids)):
+            total.update(counts)
+        return total
 
     @classmethod
     def get_all_data(cls, session, filters=None, dataset_id=None):
@@ -125,7 +353,8 @@ class DataModel(Base):
             logger.error("获取所有数据集时数据库会话不可用")
             return []
 
-        query = session.query(cls)
+        session = cls.shard_session(session, dataset_id)
+        query = session.query(cls).options(undefer_group(LONG_TEXT_GROUP))
         query = cls._apply_filters(query, filters, dataset_id)
 
         try:
@@ -136,12 +365,61 @@ class DataModel(Base):
             session.rollback()
             return []
 
+    @classmethod
+    def add_data_batch(cls, session, rows, dataset_id):
+        """
+        批量添加数据及其标签关联，只 flush 不提交，由调用方与统计更新一起提交。
+        出错时抛出异常，由调用方回滚整批。
+        """
+        shard = cls.shard_session(session, dataset_id)
+        created_time = datetime.now(timezone(timedelta(hours=8)))  # 设置为中国时区(UTC+8)
+        items = []
+        for data in rows:
+            answer = data.get('answer')
+            items.append(DataModel(
+                dataset_id=dataset_id,
+                title=data.get('title'),
+                answer=answer,
+                answer_preview=preview_answer(answer),
+                context=data.get('context') or None,
+                media_hash=data.get('media_hash'),
+                media_type=data.get('media_type'),
+                media_size=data.get('media_size'),
+                status=DataStatus.ENABLED,
+                tag=data.get('tags'),
+                del_flag=0,
+                created_time=created_time
+            ))
+        shard.add_all(items)
+        shard.flush()
+        for item in items:
+            DataTagModel.attach(shard, item.id, dataset_id, split_tags(item.tag))
+        return items
+
+    @classmethod
+    def discard_batch(cls, shard, data_ids):
+        """
+        撤销分片上已提交的一批导入数据及其标签关联并提交（主库提交失败时的补偿）。
+        出错时抛出异常。
+        """
+        try:
+            shard.query(DataTagModel).filter(DataTagModel.data_id.in_(data_ids)).delete(synchronize_session=False)
+            shard.query(cls).filter(cls.id.in_(data_ids)).delete(synchronize_session=False)
+            shard.commit()
+            logger.warning(f"已撤销分片上的 {len(data_ids)} 条导入数据")
+        except Exception as e:
+            logger.error(f"撤销导入数据失败 (ID {data_ids[0]}-{data_ids[-1]}，共 {len(data_ids)} 条): {e}", exc_info=True)
+            shard.rollback()
+            raise
+
     @classmethod
     def add_data(cls, session, datas, dataset_id):
         """添加新数据"""
         title = datas.get('title')
         answer = datas.get('answer')
+        context = datas.get('context') or None
         tag = datas.get('tags')
+        session = cls.shard_session(session, dataset_id)
            
         # 创建新数据集
         try:
@@ -149,13 +427,22 @@ class DataModel(Base):
                 dataset_id=dataset_id,
                 title=title,
                 answer=answer,
+                answer_preview=preview_answer(answer),
+                context=context,
+                media_hash=datas.get('media_hash'),
+                media_type=datas.get('media_type'),
+                media_size=datas.get('media_size'),
                 status=DataStatus.ENABLED,
                 tag=tag,
                 del_flag=0,
                 created_time=datetime.now(timezone(timedelta(hours=8)))  # 设置为中国时区(UTC+8)
             )
             session.add(new_data)
+            session.flush()
+            # 同一事务内写入标签关联
+            DataTagModel.attach(session, new_data.id, dataset_id, split_tags(tag))
             session.commit()
+            notify_write(cls.__tablename__, dataset_id)
             logger.info(f"已成功添加数据集 (名称: {title}, 类别: {answer})")
             return new_data
         except ValueError as ve:
@@ -196,6 +483,7 @@ class DataModel(Base):
             if dataset:
                 dataset.del_flag = 1
                 session.commit()
+                notify_write(cls.__tablename__, dataset.dataset_id)
                 logger.info(f"已成功删除数据集 (ID: {dataset_id})")
                 return True
             else:
@@ -0,0 +1,204 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql import func
+from datetime import datetime, timezone, timedelta
+from collections import Counter
+from utils.logger import get_logger
+from models.tag_model import normalize_tag_name
+
+Base = declarative_base()
+logger = get_logger("dataset_stats_model")
+
+# 统计分组
+STAT_TOTAL = 'total'            # 总量：datasets / items
+STAT_CATEGORY = 'category'      # 各分类的数据集数量
+STAT_STATUS = 'status'          # 各状态的数据集数量
+STAT_TAG = 'tag'                # 各标签的数据条数
+STAT_IMPORT_DAY = 'import_day'  # 每日导入条数
+
+
+def today():
+    """中国时区(UTC+8)的当天日期字符串"""
+    return datetime.now(timezone(timedelta(hours=8))).strftime('%Y-%m-%d')
+
+
+class DatasetStatsModel(Base):
+    """数据集统计汇总表，由新增、导入、删除等写操作增量维护，首页直接读取"""
+    __tablename__ = 't_dataset_stats'
+    __table_args__ = (
+        UniqueConstraint('stat_group', 'stat_key', name='uk_stats_group_key'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, comment='主键自增')
+    stat_group = Column(String(32), nullable=False, comment='统计分组')
+    stat_key = Column(String(255), nullable=False, comment='统计项')
+    stat_value = Column(Integer, nullable=False, default=0, comment='统计值')
+    updated_time = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, comment='最后更新时间')
+
+    @classmethod
+    def apply_changes(cls, session, changes):
+        """
+        在当前事务中累加统计值，不提交，由调用方随业务写入一起提交。
+        按 (分组, 统计项) 排序依次 upsert，并发事务以相同顺序加锁，
+        同时新增同一统计项也不会因唯一约束冲突而失败。
+        :param changes: {(stat_group, stat_key): delta}
+        """
+        items = sorted(((group, str(key)), delta) for (group, key), delta in changes.items()
+                       if delta and key is not None)
+        for (group, key), delta in items:
+            cls._upsert(session, group, key, delta)
+
+    @classmethod
+    def _upsert(cls, session, group, key, delta):
+        """原子地累加一个统计项，不存在时插入"""
+        dialect = session.get_bind().dialect.name
+        values = dict(stat_group=group, stat_key=key, stat_value=delta, updated_time=datetime.utcnow())
+        if dialect == 'mysql':
+            stmt = mysql_insert(cls).values(**values)
+            stmt = stmt.on_duplicate_key_update(
+                stat_value=cls.stat_value + stmt.inserted.stat_value,
+                updated_time=stmt.inserted.updated_time
+            )
+        elif dialect == 'sqlite':
+            stmt = sqlite_insert(cls).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['stat_group', 'stat_key'],
+                set_={'stat_value': cls.stat_value + stmt.excluded.stat_value,
+                      'updated_time': stmt.excluded.updated_time}
+            )
+        else:
+            row = session.query(cls).filter(
+                cls.stat_group == group, cls.stat_key == key
+            ).with_for_update().first()
+            if row:
+                row.stat_value = row.stat_value + delta
+            else:
+                session.add(cls(**values))
+            return
+        session.execute(stmt)
+
+    @classmethod
+    def dataset_added(cls, session, category, status):
+        """新增数据集"""
+        cls.apply_changes(session, {
+            (STAT_TOTAL, 'datasets'): 1,
+            (STAT_CATEGORY, category): 1,
+            (STAT_STATUS, status): 1,
+        })
+
+    @classmethod
+    def dataset_changed(cls, session, old_category, old_status, new_category, new_status):
+        """数据集分类或状态变更"""
+        changes = Counter()
+        if old_category != new_category:
+            changes[(STAT_CATEGORY, old_category)] -= 1
+            changes[(STAT_CATEGORY, new_category)] += 1
+        if old_status != new_status:
+            changes[(STAT_STATUS, old_status)] -= 1
+            changes[(STAT_STATUS, new_status)] += 1
+        cls.apply_changes(session, changes)
+
+    @classmethod
+    def dataset_removed(cls, session, category, status, content_size, tag_counts=None):
+        """删除数据集，同时扣减其数据条数和标签计数"""
+        changes = Counter({
+            (STAT_TOTAL, 'datasets'): -1,
+            (STAT_TOTAL, 'items'): -(content_size or 0),
+            (STAT_CATEGORY, category): -1,
+            (STAT_STATUS, status): -1,
+        })
+        for tag, count in (tag_counts or {}).items():
+            changes[(STAT_TAG, normalize_tag_name(tag))] -= count
+        cls.apply_changes(session, changes)
+
+    @classmethod
+    def items_imported(cls, session, item_count, tag_counts=None):
+        """导入数据：累加总条数、当日导入量和标签计数"""
+        changes = Counter({
+            (STAT_TOTAL, 'items'): item_count,
+            (STAT_IMPORT_DAY, today()): item_count,
+        })
+        for tag, count in (tag_counts or {}).items():
+            changes[(STAT_TAG, normalize_tag_name(tag))] += count
+        cls.apply_changes(session, changes)
+
+    @classmethod
+    def get_group(cls, session, group, limit=None):
+        """读取某个分组，按统计值倒序"""
+        query = session.query(cls.stat_key, cls.stat_value).filter(
+            cls.stat_group == group, cls.stat_value > 0
+        ).order_by(cls.stat_value.desc())
+        if limit:
+            query = query.limit(limit)
+        return [(key, value) for key, value in query.all()]
+
+    @classmethod
+    def get_dashboard(cls, session, top_tags=20, recent_days=30, top_datasets=10):
+        """读取首页看板所需的全部预计算数据"""
+        from models.dataset_model import DatasetModel
+        try:
+            totals = dict(cls.get_group(session, STAT_TOTAL))
+            start_day = (datetime.now(timezone(timedelta(hours=8))) - timedelta(days=recent_days - 1)).strftime('%Y-%m-%d')
+            imports = session.query(cls.stat_key, cls.stat_value).filter(
+                cls.stat_group == STAT_IMPORT_DAY, cls.stat_key >= start_day
+            ).order_by(cls.stat_key).all()
+            # 各数据集内容量直接读取维护好的 content_size
+            datasets = session.query(DatasetModel.dataset_name, DatasetModel.content_size).filter(
+                DatasetModel.del_flag == 0
+            ).order_by(DatasetModel.content_size.desc()).limit(top_datasets).all()
+
+            return {
+                "dataset_total": totals.get('datasets', 0),
+                "item_total": totals.get('items', 0),
+                "categories": cls.get_group(session, STAT_CATEGORY),
+                "statuses": cls.get_group(session, STAT_STATUS),
+                "tags": cls.get_group(session, STAT_TAG, limit=top_tags),
+                "imports": [(day, value) for day, value in imports],
+                "datasets": [(name, size) for name, size in datasets],
+            }
+        except Exception as e:
+            logger.error(f"读取统计数据时出错: {e}", exc_info=True)
+            session.rollback()
+            return None
+
+    @classmethod
+    def rebuild(cls, session):
+        """根据业务表全量重建统计（首次启用或修复时使用）"""
+        from models.dataset_model import DatasetModel
+        from models.dataset_son_model import DataModel
+        try:
+            changes = Counter()
+            rows = session.query(
+                DatasetModel.dataset_category, DatasetModel.status,
+                func.count(DatasetModel.id), func.sum(DatasetModel.content_size)
+            ).filter(DatasetModel.del_flag == 0).group_by(DatasetModel.dataset_category, DatasetModel.status).all()
+            for category, status, count, size in rows:
+                changes[(STAT_TOTAL, 'datasets')] += count
+                changes[(STAT_TOTAL, 'items')] += int(size or 0)
+                changes[(STAT_CATEGORY, category.value)] += count
+                changes[(STAT_STATUS, status.value)] += count
+
+            # 标签关联可能分布在多个分片，按有效数据集ID并行统计
+            live_datasets = [row[0] for row in session.query(DatasetModel.id).filter(DatasetModel.del_flag == 0).all()]
+            for name, count in DataModel.count_all_tags(session, live_datasets).items():
+                changes[(STAT_TAG, name)] += count
+
+            session.query(cls).delete()
+            cls.apply_changes(session, changes)
+            session.commit()
+            logger.info("统计数据已全量重建")
+            return True
+        except Exception as e:
+            logger.error(f"重建统计数据时出错: {e}", exc_info=True)
+            session.rollback()
+            return False
+
+    @classmethod
+    def ensure_initialized(cls, session):
+        """统计表为空而业务表已有数据时，执行一次全量重建"""
+        from models.dataset_model import DatasetModel
+        if session.query(cls.id).first() is None and session.query(DatasetModel.id).first() is not None:
+            return cls.rebuild(session)
+        return True
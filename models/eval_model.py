@@ -0,0 +1,176 @@
+from sqlalchemy import Column, Integer, BigInteger, Boolean, String, Text, DateTime, Enum as SQLAlchemyEnum, Index, insert, update
+from sqlalchemy.orm import declarative_base
+from datetime import datetime
+import enum
+import json
+from utils.logger import get_logger
+from models.dataset_son_model import long_text
+
+Base = declarative_base()
+logger = get_logger("eval_model")
+
+
+class EvalRunStatus(enum.Enum):
+    RUNNING = "运行中"
+    FINISHED = "已完成"
+    FAILED = "失败"
+    CANCELLED = "已取消"
+
+
+class EvalRunModel(Base):
+    """一次评测运行：数据集、模型及运行参数"""
+    __tablename__ = 't_eval_run'
+    __table_args__ = (
+        Index('idx_eval_run_dataset', 'dataset_id', 'created_time'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, comment='运行ID，主键自增')
+    dataset_id = Column(Integer, nullable=False, comment='数据集ID')
+    model = Column(String(255), nullable=False, comment='模型名称')
+    config = Column(Text, nullable=True, comment='运行参数（JSON）')
+    status = Column(SQLAlchemyEnum(EvalRunStatus), nullable=False, default=EvalRunStatus.RUNNING, comment='运行状态')
+    total = Column(Integer, nullable=False, default=0, comment='已完成条数')
+    succeeded = Column(Integer, nullable=False, default=0, comment='成功条数')
+    failed = Column(Integer, nullable=False, default=0, comment='失败条数')
+    created_time = Column(DateTime, nullable=False, default=datetime.utcnow, comment='开始时间')
+    finished_time = Column(DateTime, nullable=True, comment='结束时间')
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "dataset_id": self.dataset_id,
+            "model": self.model,
+            "config": json.loads(self.config) if self.config else {},
+            "status": self.status.value if isinstance(self.status, EvalRunStatus) else self.status,
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "created_time": self.created_time.strftime('%Y-%m-%d %H:%M:%S') if self.created_time else None,
+            "finished_time": self.finished_time.strftime('%Y-%m-%d %H:%M:%S') if self.finished_time else None,
+        }
+
+    @classmethod
+    def create_run(cls, session, dataset_id, model, config=None):
+        """登记一次评测运行，返回运行ID"""
+        try:
+            run = cls(dataset_id=dataset_id, model=model,
+                      config=json.dumps(config or {}, ensure_ascii=False),
+                      status=EvalRunStatus.RUNNING)
+            session.add(run)
+            session.commit()
+            logger.info(f"已创建评测运行 (ID: {run.id}, 数据集ID: {dataset_id}, 模型: {model})")
+            return run.id
+        except Exception as e:
+            logger.error(f"创建评测运行失败 (数据集ID: {dataset_id}): {e}", exc_info=True)
+            session.rollback()
+            return None
+
+    @classmethod
+    def finish_run(cls, session, run_id, stats, status=EvalRunStatus.FINISHED):
+        """记录运行结束状态与汇总"""
+        try:
+            session.query(cls).filter(cls.id == run_id).update({
+                cls.status: status,
+                cls.total: stats.get('total', 0),
+                cls.succeeded: stats.get('succeeded', 0),
+                cls.failed: stats.get('failed', 0),
+                cls.finished_time: datetime.utcnow(),
+            }, synchronize_session=False)
+            session.commit()
+        except Exception as e:
+            logger.error(f"更新评测运行状态失败 (ID: {run_id}): {e}", exc_info=True)
+            session.rollback()
+
+    @classmethod
+    def get_run(cls, session, run_id):
+        try:
+            run = session.query(cls).filter(cls.id == run_id).first()
+            return run.to_dict() if run else None
+        except Exception as e:
+            logger.error(f"读取评测运行失败 (ID: {run_id}): {e}", exc_info=True)
+            return None
+
+
+class EvalResultModel(Base):
+    """单条数据在某次运行中的模型输出、耗时、token 数与评分"""
+    __tablename__ = 't_eval_result'
+    __table_args__ = (
+        Index('idx_eval_result_run_data', 'run_id', 'data_id'),
+        Index('idx_eval_result_data', 'data_id'),
+    )
+
+    id = Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True, comment='主键自增')
+    run_id = Column(Integer, nullable=False, comment='运行ID')
+    data_id = Column(Integer, nullable=False, comment='数据ID')
+    output = Column(long_text(), nullable=True, comment='模型输出')
+    latency_ms = Column(Integer, nullable=True, comment='请求耗时（毫秒）')
+    prompt_tokens = Column(Integer, nullable=True, comment='输入 token 数')
+    completion_tokens = Column(Integer, nullable=True, comment='输出 token 数')
+    attempts = Column(Integer, nullable=False, default=1, comment='请求次数（含重试）')
+    error = Column(String(500), nullable=True, comment='失败原因，成功时为空')
+    cached = Column(Boolean, nullable=False, default=False, comment='输出是否取自响应缓存（耗时不计入模型延迟）')
+    scores = Column(Text, nullable=True, comment='各项评分（JSON）')
+    created_time = Column(DateTime, nullable=False, default=datetime.utcnow, comment='写入时间')
+
+    # 批量写入时从结果字典中取的字段
+    RESULT_FIELDS = ('data_id', 'output', 'latency_ms', 'prompt_tokens', 'completion_tokens', 'attempts', 'error', 'cached')
+
+    @classmethod
+    def bulk_insert(cls, session, run_id, results):
+        """
+        一次 executemany 批量写入一组结果并提交，不经过 ORM 对象。
+        :param results: 执行器产出的结果字典列表
+        """
+        if not results:
+            return 0
+        now = datetime.utcnow()
+        rows = []
+        for result in results:
+            row = {field: result.get(field) for field in cls.RESULT_FIELDS}
+            if row['error']:
+                row['error'] = row['error'][:500]
+            row['attempts'] = 1 if row['attempts'] is None else row['attempts']
+            row['cached'] = bool(row['cached'])
+            row['run_id'] = run_id
+            row['created_time'] = now
+            rows.append(row)
+        try:
+            session.execute(insert(cls.__table__), rows)
+            session.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"批量写入评测结果失败 (运行ID: {run_id}, {len(rows)} 条): {e}", exc_info=True)
+            session.rollback()
+            raise
+
+    @classmethod
+    def update_scores(cls, session, scores_by_id):
+        """
+        批量回写评分并提交。
+        :param scores_by_id: {结果ID: {指标: 分数}}
+        """
+        if not scores_by_id:
+            return 0
+        rows = [{'id': result_id, 'scores': json.dumps(scores, ensure_ascii=False)}
+                for result_id, scores in scores_by_id.items()]
+        try:
+            session.execute(update(cls), rows)
+            session.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"回写评分失败 ({len(rows)} 条): {e}", exc_info=True)
+            session.rollback()
+            return 0
+
+    @classmethod
+    def get_results(cls, session, run_id, after_id=0, batch_size=1000):
+        """按主键顺序读取一批结果：[(结果ID, 数据ID, 输出, 错误), ...]，出错时抛出异常"""
+        try:
+            rows = session.query(cls.id, cls.data_id, cls.output, cls.error).filter(
+                cls.run_id == run_id, cls.id > after_id
+            ).order_by(cls.id).limit(batch_size).all()
+            return [tuple(row) for row in rows]
+        except Exception as e:
+            logger.error(f"读取评测结果失败 (运行ID: {run_id}): {e}", exc_info=True)
+            session.rollback()
+            raise
@@ -0,0 +1,44 @@
+import enum
+from datetime import datetime
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def format_value(value):
+    """将原始列值转换为展示值：枚举取值，时间格式化"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.strftime(TIME_FORMAT)
+    return value
+
+
+class ProjectedRow:
+    """
+    列表查询的投影行，包装 SQLAlchemy Row 而不构建 ORM 实体。
+    属性访问返回原始值（用于游标等），get()/[] 返回展示值，格式化只在实际访问时发生。
+    """
+    __slots__ = ('_row',)
+
+    def __init__(self, row):
+        self._row = row
+
+    def __getattr__(self, name):
+        return getattr(self._row, name)
+
+    def __getitem__(self, key):
+        return format_value(getattr(self._row, key))
+
+    def __repr__(self):
+        return f"ProjectedRow({self.to_dict()})"
+
+    def get(self, key, default=None):
+        """兼容 to_dict() 结果的字典式取值"""
+        value = getattr(self._row, key, default)
+        return format_value(value) if value is not None else default
+
+    def keys(self):
+        return self._row._fields
+
+    def to_dict(self):
+        return {key: self.get(key) for key in self.keys()}
@@ -0,0 +1,139 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index, select, distinct, exists
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql import func
+from datetime import datetime
+from collections import Counter
+from utils.logger import get_logger
+
+Base = declarative_base()
+logger = get_logger("tag_model")
+
+TAG_NAME_LENGTH = 100
+
+
+def normalize_tag_name(name):
+    """标签名按 t_tag.name 的长度截断；关联表、统计表等所有按名称计数的地方都须经过此函数"""
+    return name[:TAG_NAME_LENGTH]
+
+
+class TagModel(Base):
+    __tablename__ = 't_tag'
+
+    id = Column(Integer, primary_key=True, autoincrement=True, comment='标签ID，主键自增')
+    name = Column(String(TAG_NAME_LENGTH), nullable=False, unique=True, comment='标签名称')
+    created_time = Column(DateTime, nullable=False, default=datetime.utcnow, comment='创建时间')
+
+    @classmethod
+    def get_or_create_ids(cls, session, names):
+        """返回 {标签名: 标签ID}，不存在的标签自动创建（不提交）"""
+        names = list(dict.fromkeys(normalize_tag_name(n) for n in names if n))
+        if not names:
+            return {}
+        ids = dict(session.query(cls.name, cls.id).filter(cls.name.in_(names)).all())
+        missing = [n for n in names if n not in ids]
+        if missing:
+            new_tags = [cls(name=n) for n in missing]
+            session.add_all(new_tags)
+            session.flush()
+            ids.update({t.name: t.id for t in new_tags})
+        return ids
+
+    @classmethod
+    def ids_for_names(cls, names):
+        """按名称查标签ID的子查询"""
+        return select(cls.id).where(cls.name.in_([normalize_tag_name(n) for n in names]))
+
+
+class DataTagModel(Base):
+    """数据与标签的关联表（倒排索引）"""
+    __tablename__ = 't_data_tag'
+    __table_args__ = (
+        # 按标签找数据：WHERE dataset_id=? AND tag_id IN (...)，覆盖 data_id
+        Index('idx_data_tag_dataset_tag', 'dataset_id', 'tag_id', 'data_id'),
+        Index('idx_data_tag_tag', 'tag_id', 'data_id'),
+    )
+
+    data_id = Column(Integer, primary_key=True, comment='数据ID')
+    tag_id = Column(Integer, primary_key=True, comment='标签ID')
+    dataset_id = Column(Integer, nullable=False, comment='数据集ID')
+
+    @classmethod
+    def attach(cls, session, data_id, dataset_id, names):
+        """为一条数据建立标签关联（不提交）"""
+        cls.attach_many(session, [(data_id, dataset_id, names)])
+
+    @classmethod
+    def attach_many(cls, session, entries):
+        """
+        批量建立标签关联（不提交）。
+        :param entries: [(data_id, dataset_id, [标签名, ...]), ...]
+        """
+        entries = [(data_id, dataset_id, list(dict.fromkeys(normalize_tag_name(n) for n in names if n)))
+                   for data_id, dataset_id, names in entries]
+        tag_ids = TagModel.get_or_create_ids(session, [n for _, _, names in entries for n in names])
+        rows = [
+            {"data_id": data_id, "tag_id": tag_ids[n], "dataset_id": dataset_id}
+            for data_id, dataset_id, names in entries
+            for n in names
+        ]
+        if rows:
+            session.execute(cls.__table__.insert(), rows)
+
+    @classmethod
+    def matching_data_ids(cls, names, mode='or', dataset_id=None):
+        """
+        返回命中标签的数据ID子查询。
+        :param mode: 'or' 命中任一标签；'and' 须包含全部标签
+        """
+        names = list(dict.fromkeys(names))
+        query = select(cls.data_id).where(cls.tag_id.in_(TagModel.ids_for_names(names)))
+        if dataset_id is not None:
+            query = query.where(cls.dataset_id == dataset_id)
+        if mode == 'and' and len(names) > 1:
+            query = query.group_by(cls.data_id).having(func.count(distinct(cls.tag_id)) == len(names))
+        return query
+
+    @classmethod
+    def count_tags(cls, session, dataset_id=None, dataset_ids=None):
+        """
+        按标签统计数据条数，直接在关联表上 GROUP BY。
+        :param dataset_id: 限定单个数据集
+        :param dataset_ids: 限定一组数据集（列表或子查询）
+        """
+        query = session.query(TagModel.name, func.count(cls.data_id)).join(TagModel, TagModel.id == cls.tag_id)
+        if dataset_id is not None:
+            query = query.filter(cls.dataset_id == dataset_id)
+        if dataset_ids is not None:
+            query = query.filter(cls.dataset_id.in_(dataset_ids))
+        return Counter(dict(query.group_by(TagModel.name).all()))
+
+    @classmethod
+    def backfill(cls, session, batch_size=2000):
+        """
+        根据历史数据的 tag 字符串补建关联。只处理尚无任何关联的数据（反连接），
+        每批单独提交，中途中断后下次启动会从未处理的数据继续。
+        """
+        from models.dataset_son_model import DataModel, split_tags
+        try:
+            last_id, total = 0, 0
+            while True:
+                rows = session.query(DataModel.id, DataModel.dataset_id, DataModel.tag).filter(
+                    DataModel.id > last_id, DataModel.tag.isnot(None), DataModel.tag != '',
+                    ~exists().where(cls.data_id == DataModel.id)
+                ).order_by(DataModel.id).limit(batch_size).all()
+                if not rows:
+                    break
+                # 拆分后没有有效标签的数据（如 "nan"）不建关联，只推进游标
+                entries = [(row.id, row.dataset_id, split_tags(row.tag)) for row in rows]
+                entries = [entry for entry in entries if entry[2]]
+                cls.attach_many(session, entries)
+                session.commit()
+                last_id = rows[-1].id
+                total += len(entries)
+            if total:
+                logger.info(f"已为 {total} 条历史数据补建标签关联")
+            return total
+        except Exception as e:
+            logger.error(f"补建标签关联时出错: {e}", exc_info=True)
+            session.rollback()
+            return 0
@@ -0,0 +1,98 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QModelIndex
+from utils.database import DatabaseManager
+from views.dataset.data_item_model import DataItemTableModel
+
+
+class Row(dict):
+    media_hash = None
+
+
+class SyncExecutor:
+    """按提交顺序在当前线程执行任务，代替线程池"""
+
+    def __init__(self):
+        self.queue = []
+
+    def submit(self, fn, *args, on_result=None, on_error=None):
+        self.queue.append((fn, args, on_result, on_error))
+
+    def cancel_pending(self):
+        self.queue.clear()
+
+    def run(self):
+        while self.queue:
+            fn, args, on_result, on_error = self.queue.pop(0)
+            try:
+                result = fn(*args)
+            except Exception as e:
+                on_error(str(e))
+                continue
+            on_result(result)
+
+
+@pytest.fixture(autouse=True)
+def no_database(monkeypatch):
+    monkeypatch.setattr(DatabaseManager, "get_session", classmethod(lambda cls: None))
+
+
+def make_model(rows, batch_size=10, max_loaded_batches=2):
+    cursors = []
+
+    def fetch(session, cursor=None, direction="next", per_page=10):
+        cursors.append(cursor)
+        start = 0 if cursor is None else next(i for i, r in enumerate(rows) if r["id"] == cursor) + 1
+        batch = rows[start:start + per_page]
+        return batch, None, (batch[-1]["id"] if batch else None)
+
+    model = DataItemTableModel(fetch, batch_size=batch_size, max_loaded_batches=max_loaded_batches)
+    model.executor = SyncExecutor()
+    return model, cursors
+
+
+def load_all(model):
+    model.start()
+    model.executor.run()
+    while model.canFetchMore():
+        model.fetchMore(QModelIndex())
+        model.executor.run()
+
+
+def test_evicted_batch_reloads_in_place():
+    rows = [Row(id=i, title=f"t{i}") for i in range(35)]
+    model, _ = make_model(rows)
+    load_all(model)
+    assert model.rowCount() == 35 and 0 not in model._loaded
+
+    assert model.data(model.index(3, 1)) == DataItemTableModel.LOADING_TEXT
+    model.executor.run()
+    assert model.data(model.index(3, 1)) == "t3"
+    assert model.rowCount() == 35
+
+
+def test_short_reload_resets_model():
+    rows = [Row(id=i, title=f"t{i}") for i in range(35)]
+    model, cursors = make_model(rows)
+    load_all(model)
+
+    # 访问前两批，末批（第 30-34 行）被淘汰
+    for row in (0, 10):
+        model.data(model.index(row, 1))
+        model.executor.run()
+    assert 3 not in model._loaded
+
+    # 末批中的行被删除后，重新读取只返回 1 行
+    del rows[31:]
+    model.data(model.index(32, 1))
+    cursors.clear()
+    model.executor.run()
+
+    # 模型被重置并从头重新读取，不会留下一直显示“加载中...”的行
+    assert cursors == [29, None]
+    assert model.rowCount() == 10
+    load_all(model)
+    assert model.rowCount() == 31
+    assert model.data(model.index(30, 1)) == "t30"
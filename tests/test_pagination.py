@@ -0,0 +1,51 @@
+from utils.count_cache import ApproximateCount
+from utils.pagination import KeysetPager
+
+# 按 (created_time, id) 倒序排列的行，游标直接使用行ID
+ROWS = list(range(95, 0, -1))
+PER_PAGE = 10
+
+
+def keyset_fetch(session, cursor, direction, per_page, filters):
+    if direction == "next":
+        rows = [r for r in ROWS if cursor is None or r < cursor][:per_page]
+    else:
+        rows = [r for r in reversed(ROWS) if cursor is None or r > cursor][:per_page]
+        rows.reverse()
+    return rows, (rows[0] if rows else None), (rows[-1] if rows else None)
+
+
+def offset_fetch(session, page, per_page, filters):
+    rows = ROWS[(page - 1) * per_page:page * per_page]
+    return rows, (rows[0] if rows else None), (rows[-1] if rows else None)
+
+
+def make_pager(total):
+    return KeysetPager(keyset_fetch, offset_fetch, lambda session, filters: total, per_page=PER_PAGE)
+
+
+def test_exact_count_last_page_uses_remainder():
+    rows, total, pages, page = make_pager(len(ROWS)).load(None, 10)
+    assert (total, pages, page) == (95, 10, 10)
+    assert rows == ROWS[90:]
+
+
+def test_approximate_count_below_real_rows_does_not_clamp_or_shortcut():
+    # 估算值 42 比实际 95 行少：第 5 页按估算是“末页”，但实际是满页
+    rows, total, pages, page = make_pager(ApproximateCount(42)).load(None, 5)
+    assert pages == 5 and page == 5
+    assert rows == ROWS[40:50]
+
+    # 估算范围之外的页不被调整到估算的末页
+    rows, _, _, page = make_pager(ApproximateCount(42)).load(None, 8)
+    assert page == 8
+    assert rows == ROWS[70:80]
+
+
+def test_approximate_count_above_real_rows_returns_actual_rows():
+    # 估算值 200 比实际 95 行多：末页行数按实际数据，而不是按估算余数
+    rows, total, pages, page = make_pager(ApproximateCount(200)).load(None, 10)
+    assert page == 10
+    assert rows == ROWS[90:]
+    rows, _, _, page = make_pager(ApproximateCount(200)).load(None, 15)
+    assert page == 15 and rows == []
@@ -0,0 +1,54 @@
+from collections import Counter
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from models.dataset_model import Base, DatasetModel, DatasetCategory
+from models.dataset_son_model import Base as DataBase, DataModel, split_tags
+from models.dataset_stats_model import Base as StatsBase, DatasetStatsModel, STAT_TAG
+from models.tag_model import Base as TagBase, TAG_NAME_LENGTH
+
+LONG_TAG = "长" * (TAG_NAME_LENGTH + 50)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    for base in (Base, DataBase, StatsBase, TagBase):
+        base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def import_items(session, dataset_id, rows):
+    """与导入流程相同：写入数据并按 split_tags 增量累加统计"""
+    DataModel.add_data_batch(session, rows, dataset_id)
+    DatasetModel.add_content_size(session, dataset_id, len(rows))
+    DatasetStatsModel.items_imported(session, len(rows), Counter(
+        tag for row in rows for tag in split_tags(row.get('tags'))))
+    session.commit()
+
+
+def tag_stats(session):
+    return dict(DatasetStatsModel.get_group(session, STAT_TAG))
+
+
+def test_long_tag_names_match_between_incremental_and_rebuilt_stats(session):
+    dataset = DatasetModel(dataset_name="长标签", dataset_category=DatasetCategory.TEXT)
+    session.add(dataset)
+    session.commit()
+
+    import_items(session, dataset.id, [
+        {'title': 'a', 'answer': 'x', 'tags': f"{LONG_TAG},短"},
+        {'title': 'b', 'answer': 'y', 'tags': LONG_TAG},
+    ])
+    truncated = LONG_TAG[:TAG_NAME_LENGTH]
+    incremental = tag_stats(session)
+    assert incremental == {truncated: 2, "短": 1}
+    assert DataModel.count_tags(session, dataset.id) == Counter(incremental)
+
+    assert DatasetStatsModel.rebuild(session)
+    assert tag_stats(session) == incremental
+
+    # 删除数据集按标签表中的名称扣减，长标签也能扣减到 0
+    assert DatasetModel.delete_dataset(session, dataset.id)
+    assert tag_stats(session) == {}
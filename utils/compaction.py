@@ -0,0 +1,107 @@
+from datetime import datetime, timezone, timedelta
+from PySide6.QtCore import QObject, QTimer
+from sqlalchemy import select, literal
+from utils.database import DatabaseManager
+from utils.sharding import ShardRouter
+from utils.task_executor import TaskExecutor
+from utils.logger import get_logger
+
+logger = get_logger("compaction")
+
+
+class Compactor:
+    """将软删除超过 N 天的数据分批移入归档表，保持业务表精简"""
+
+    def __init__(self, older_than_days=30, batch_size=1000):
+        self.older_than_days = older_than_days
+        self.batch_size = batch_size
+
+    def run(self, session):
+        """执行一次归档，返回 {表名: 归档条数}"""
+        from models.archive_model import ARCHIVE_TABLES
+        from models.dataset_model import DatasetModel
+        from models.dataset_son_model import DataModel
+        # 先补齐分片上未完成的级联删除，使这些数据子项随后按时归档
+        DatasetModel.repair_deleted_cascades(session)
+        cutoff = datetime.now(timezone(timedelta(hours=8))) - timedelta(days=self.older_than_days)
+        result = {}
+        for model, archive in ARCHIVE_TABLES:
+            # 数据子项在各分片内各自归档
+            sessions = ShardRouter.all_sessions(session) if model is DataModel else [session]
+            result[model.__tablename__] = sum(self.compact(s, model, archive, cutoff) for s in sessions)
+        return result
+
+    def compact(self, session, model, archive, cutoff):
+        """分批归档一张表，每批一个事务"""
+        from models.tag_model import DataTagModel
+        from models.dataset_son_model import DataModel
+
+        source = model.__table__
+        columns = [c.name for c in archive.columns if c.name in source.c]
+        total = 0
+        while True:
+            try:
+                ids = [row[0] for row in session.query(model.id).filter(
+                    model.del_flag == 1,
+                    model.updated_time < cutoff
+                ).order_by(model.id).limit(self.batch_size).all()]
+                if not ids:
+                    break
+
+                archived_time = datetime.now(timezone(timedelta(hours=8)))
+                session.execute(archive.insert().from_select(
+                    columns + ['archived_time'],
+                    select(*[source.c[name] for name in columns], literal(archived_time)).where(source.c.id.in_(ids))
+                ))
+                if model is DataModel:
+                    # 标签关联随数据一并清理
+                    session.query(DataTagModel).filter(DataTagModel.data_id.in_(ids)).delete(synchronize_session=False)
+                session.execute(source.delete().where(source.c.id.in_(ids)))
+                session.commit()
+                total += len(ids)
+            except Exception as e:
+                logger.error(f"归档表 {source.name} 时出错: {e}", exc_info=True)
+                session.rollback()
+                break
+
+        if total:
+            logger.info(f"已将 {total} 条软删除数据从 {source.name} 移入归档表")
+        return total
+
+
+class CompactionJob(QObject):
+    """定时在后台线程执行归档"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        config = DatabaseManager.load_config()
+        self.compactor = Compactor(
+            older_than_days=config.getint('maintenance', 'archive_after_days', fallback=30),
+            batch_size=config.getint('maintenance', 'batch_size', fallback=1000)
+        )
+        interval_hours = config.getint('maintenance', 'interval_hours', fallback=24)
+        self.executor = TaskExecutor(max_threads=1, parent=self)
+        self.running = False
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_hours * 3600 * 1000)
+        self.timer.timeout.connect(self.run)
+
+    def start(self, initial_delay_ms=60000):
+        """启动定时任务，首次执行延后，避开启动高峰"""
+        QTimer.singleShot(initial_delay_ms, self.run)
+        self.timer.start()
+
+    def run(self):
+        """提交一次归档任务，上一次未结束则跳过"""
+        if self.running:
+            return
+        self.running = True
+        self.executor.submit(self._compact, on_result=self._finished, on_error=self._finished)
+
+    def _compact(self):
+        with DatabaseManager.get_session() as session:
+            return self.compactor.run(session)
+
+    def _finished(self, result):
+        self.running = False
+        logger.info(f"归档任务结束: {result}")
@@ -0,0 +1,123 @@
+import threading
+import time
+from datetime import date
+from utils import data_events
+from utils.logger import get_logger
+
+logger = get_logger("count_cache")
+
+# 无过滤条件且估算行数超过该阈值时，先展示近似总数
+APPROXIMATE_COUNT_THRESHOLD = 100000
+
+
+class ApproximateCount(int):
+    """近似总数，仍可作为 int 参与分页计算"""
+    approximate = True
+
+
+def is_approximate(count):
+    """判断总数是否为近似值"""
+    return getattr(count, "approximate", False)
+
+
+def format_count(count):
+    """格式化总数，近似值显示为 ~1.2M 形式"""
+    if not is_approximate(count):
+        return str(int(count))
+    for unit, size in (("B", 10 ** 9), ("M", 10 ** 6), ("K", 10 ** 3)):
+        if count >= size:
+            return f"~{count / size:.1f}{unit}"
+    return f"~{int(count)}"
+
+
+def _normalize_value(value):
+    """将过滤值转换为可哈希、可比较的形式，兼容QDate类型"""
+    if hasattr(value, "toPython"):  # 处理QDate类型
+        value = value.toPython()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(str(v) for v in value))
+    return str(value).strip()
+
+
+def filter_signature(filters):
+    """生成过滤条件签名，忽略空值与“全部”"""
+    if not filters:
+        return ()
+    items = []
+    for key, value in filters.items():
+        if value is None or value == "全部":
+            continue
+        normalized = _normalize_value(value)
+        if normalized in ("", ()):
+            continue
+        items.append((key, normalized))
+    return tuple(sorted(items))
+
+
+def has_filters(filters):
+    """过滤条件是否实际生效"""
+    return bool(filter_signature(filters))
+
+
+class CountCache:
+    """
+    按 (表名, 数据集ID, 过滤签名) 缓存总条目数，写入事件到达时按范围失效。
+    与分页缓存相同，按表版本号丢弃查询期间已失效的计数。
+    """
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._entries = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def key(self, table_name, filters=None, dataset_id=None):
+        """构造缓存键"""
+        return (table_name, dataset_id, filter_signature(filters))
+
+    def get(self, key):
+        """读取缓存，过期返回 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            return value
+
+    def version(self, table_name):
+        """表的当前版本号，计数查询开始前取得"""
+        with self._lock:
+            return self._versions.get(table_name, 0)
+
+    def set(self, key, value, version=None):
+        """写入缓存，version 与当前版本号不一致（查询期间发生过写入）时放弃"""
+        with self._lock:
+            if version is not None and version != self._versions.get(key[0], 0):
+                return False
+            self._entries[key] = (int(value), time.monotonic())
+            return True
+
+    def invalidate(self, table_name, dataset_id=None):
+        """使某张表（可限定数据集）的计数缓存失效"""
+        with self._lock:
+            self._versions[table_name] = self._versions.get(table_name, 0) + 1
+            stale = [k for k in self._entries
+                     if k[0] == table_name and (dataset_id is None or k[1] == dataset_id)]
+            for k in stale:
+                del self._entries[k]
+        if stale:
+            logger.debug(f"计数缓存失效 (表: {table_name}, 数据集ID: {dataset_id}, 条目: {len(stale)})")
+
+    def clear(self):
+        """清空全部缓存"""
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = CountCache()
+data_events.subscribe(count_cache.invalidate)
@@ -0,0 +1,37 @@
+import threading
+from utils.logger import get_logger
+
+logger = get_logger("data_events")
+
+# 数据写入事件的订阅者，签名为 callback(table_name, dataset_id)
+_subscribers = []
+_lock = threading.Lock()
+
+
+def subscribe(callback):
+    """订阅数据写入事件，用于缓存失效等"""
+    with _lock:
+        if callback not in _subscribers:
+            _subscribers.append(callback)
+
+
+def unsubscribe(callback):
+    """取消订阅"""
+    with _lock:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+
+def notify_write(table_name, dataset_id=None):
+    """
+    通知某张表发生了写入。
+    :param table_name: 被写入的表名
+    :param dataset_id: 写入涉及的数据集ID，None 表示影响整张表
+    """
+    with _lock:
+        subscribers = list(_subscribers)
+    for callback in subscribers:
+        try:
+            callback(table_name, dataset_id)
+        except Exception as e:
+            logger.error(f"处理写入事件失败 (表: {table_name}, 数据集ID: {dataset_id}): {e}", exc_info=True)
@@ -2,15 +2,28 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 from configparser import ConfigParser
 from utils.logger import get_logger
+from utils.sharding import ShardRouter
 import os
 
 logger = get_logger()
 
 class DatabaseManager:
+    config_path = 'config/database.ini'
     _engine = None
     _session_factory = None
     _scoped_session = None
 
+    @classmethod
+    def load_config(cls):
+        """Reads the database config file."""
+        if not os.path.exists(cls.config_path):
+            logger.error(f"Database configuration file not found at: {cls.config_path}")
+            raise FileNotFoundError(f"Database configuration file not found: {cls.config_path}")
+
+        config = ConfigParser()
+        config.read(cls.config_path, encoding='utf-8')
+        return config
+
     @classmethod
     def initialize_engine(cls):
         """Initializes the SQLAlchemy engine based on the config file."""
@@ -18,18 +31,20 @@ class DatabaseManager:
             logger.info("Database engine already initialized.")
             return
 
-        config_path = 'config/database.ini'
-        if not os.path.exists(config_path):
-            logger.error(f"Database configuration file not found at: {config_path}")
-            raise FileNotFoundError(f"Database configuration file not found: {config_path}")
-
-        config = ConfigParser()
-        config.read(config_path)
+        config = cls.load_config()
 
         try:
-            params = config['mysql']
-            db_url = f"mysql+pymysql://{params['user']}:{params['password']}@{params['host']}:{params.getint('port', 3306)}/{params['database']}?charset=utf8mb4"
-            cls._engine = create_engine(db_url, echo=False) # Set echo=True for debugging SQL
+            backend = config.get('database', 'backend', fallback='mysql')
+            if backend == 'sqlite':
+                # SQLite 后备存储，全文检索使用 FTS5
+                db_path = config.get('sqlite', 'path', fallback='data/lmtest.db')
+                os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+                cls._engine = create_engine(f"sqlite:///{db_path}", echo=False,
+                                            connect_args={'check_same_thread': False})
+            else:
+                params = config['mysql']
+                db_url = f"mysql+pymysql://{params['user']}:{params['password']}@{params['host']}:{params.getint('port', 3306)}/{params['database']}?charset=utf8mb4"
+                cls._engine = create_engine(db_url, echo=False) # Set echo=True for debugging SQL
             cls._session_factory = sessionmaker(bind=cls._engine)
             # Use scoped_session for thread-local session management, common in web/GUI apps
             cls._scoped_session = scoped_session(cls._session_factory)
@@ -46,6 +61,9 @@ class DatabaseManager:
                 cls._scoped_session = None
                 raise # Re-raise the connection error
 
+            # 数据子项分片（可选）
+            ShardRouter.initialize(config, cls._engine)
+
         except KeyError as e:
             logger.error(f"Missing key in database config: {e}")
             raise ValueError(f"Missing required key in database config: {e}")
@@ -77,11 +95,13 @@ class DatabaseManager:
         """Removes the current session associated with the scope (e.g., thread)."""
         if cls._scoped_session:
             cls._scoped_session.remove()
+            ShardRouter.remove_sessions()
             logger.debug("SQLAlchemy session removed from scope.")
 
     @classmethod
     def close_engine(cls):
         """Disposes of the connection pool."""
+        ShardRouter.close()
         if cls._engine:
             cls._engine.dispose()
             cls._engine = None
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+import os
+import threading
+from utils.logger import get_logger
+
+logger = get_logger("disk_lru")
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class LRUDirectory:
+    """
+    容量受限的缓存目录：每个条目一个文件，总大小超过上限时按最近访问时间淘汰。
+    只负责文件的位置、访问顺序与淘汰，文件内容的读写由调用方完成。可在工作线程中并发使用。
+    """
+
+    def __init__(self, root, max_bytes, suffix='', fanout=False):
+        """
+        :param suffix: 文件扩展名，如 '.png'
+        :param fanout: 为 True 时按名称前两位分子目录存放（条目很多时避免单目录过大）
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.fanout = fanout
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # 名称 -> 字节数，按访问顺序排列
+        os.makedirs(root, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        """启动时按修改时间恢复 LRU 顺序"""
+        folders = [entry.path for entry in os.scandir(self.root) if entry.is_dir()] if self.fanout else [self.root]
+        files = []
+        for folder in folders:
+            for entry in os.scandir(folder):
+                if entry.is_file() and entry.name.endswith(self.suffix):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name[:len(entry.name) - len(self.suffix)], stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+        self.total_bytes = sum(self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def path_for(self, name):
+        folder = os.path.join(self.root, name[:2]) if self.fanout else self.root
+        return os.path.join(folder, f"{name}{self.suffix}")
+
+    def touch(self, name):
+        """命中时刷新访问时间并返回文件路径，未命中返回 None"""
+        with self._lock:
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+        path = self.path_for(name)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def discard(self, name):
+        """移除条目（如文件已损坏）"""
+        with self._lock:
+            self.total_bytes -= self._entries.pop(name, 0)
+        _remove(self.path_for(name))
+
+    def write(self, name, writer):
+        """
+        写入条目：writer(临时文件路径) 写入内容并返回是否成功，
+        成功后原子替换到位，必要时淘汰最久未访问的条目。
+        """
+        path = self.path_for(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            if not writer(tmp_path):
+                _remove(tmp_path)
+                return False
+            os.replace(tmp_path, path)
+            file_size = os.path.getsize(path)
+        except OSError as e:
+            logger.warning(f"缓存文件写入失败: {path} ({e})")
+            _remove(tmp_path)
+            return False
+        with self._lock:
+            self.total_bytes += file_size - self._entries.pop(name, 0)
+            self._entries[name] = file_size
+            evicted = []
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_name, old_size = self._entries.popitem(last=False)
+                self.total_bytes -= old_size
+                evicted.append(old_name)
+        for old_name in evicted:
+            _remove(self.path_for(old_name))
+        return True
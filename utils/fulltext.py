@@ -0,0 +1,160 @@
+import re
+from sqlalchemy import or_, select, text, inspect
+from sqlalchemy.sql import table, column, literal_column
+from utils.logger import get_logger
+
+logger = get_logger("fulltext")
+
+# 全文索引定义：索引名 -> (表名, 列)
+# MySQL 的 MATCH(...) 列必须与某个 FULLTEXT 索引完全一致，因此标题单独建索引
+FULLTEXT_INDEXES = {
+    'ft_dataset_name': ('t_dataset_info', ('dataset_name',)),
+    'ft_data_title': ('t_data_info', ('title',)),
+    'ft_data_text': ('t_data_info', ('title', 'answer', 'tag')),
+}
+
+NGRAM_TOKEN_SIZE = 2    # MySQL ngram_token_size 默认值
+TRIGRAM_SIZE = 3        # SQLite FTS5 trigram 分词器最短可检索长度
+
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+# 已确认可用的全文索引名
+_ready_indexes = set()
+
+
+def _fts_table(index_name):
+    """SQLite 下每个全文索引对应一张 FTS5 虚拟表"""
+    return f"{index_name}_fts"
+
+
+def find_index(table_name, columns):
+    """按表名和列查找全文索引名"""
+    for name, (tbl, cols) in FULLTEXT_INDEXES.items():
+        if tbl == table_name and cols == tuple(columns):
+            return name
+    return None
+
+
+def split_terms(term):
+    """拆分检索词，去除布尔检索保留字符"""
+    return [w for w in _BOOLEAN_OPERATORS.sub(' ', str(term or '')).split() if w]
+
+
+def ensure_fulltext_indexes(engine):
+    """创建缺失的全文索引：MySQL 使用 ngram 解析器，SQLite 使用 FTS5 trigram 外部内容表"""
+    dialect = engine.dialect.name
+    inspector = inspect(engine)
+    for name, (table_name, columns) in FULLTEXT_INDEXES.items():
+        if not inspector.has_table(table_name):
+            continue
+        try:
+            if dialect == 'mysql':
+                _ensure_mysql_index(engine, name, table_name, columns)
+            elif dialect == 'sqlite':
+                _ensure_sqlite_index(engine, name, table_name, columns)
+            else:
+                logger.warning(f"数据库 {dialect} 不支持全文索引，检索将回退到 LIKE")
+                return
+            _ready_indexes.add(name)
+        except Exception as e:
+            logger.error(f"创建全文索引 {name} 失败，检索将回退到 LIKE: {e}", exc_info=True)
+
+
+def _ensure_mysql_index(engine, name, table_name, columns):
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT COUNT(*) FROM information_schema.STATISTICS "
+                 "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name AND INDEX_NAME = :index_name"),
+            {"table_name": table_name, "index_name": name}
+        ).scalar()
+        if not exists:
+            conn.execute(text(f"ALTER TABLE {table_name} ADD FULLTEXT INDEX {name} ({', '.join(columns)}) WITH PARSER ngram"))
+            logger.info(f"已为表 {table_name} 创建全文索引 {name}")
+
+
+def _ensure_sqlite_index(engine, name, table_name, columns):
+    fts = _fts_table(name)
+    cols = ', '.join(columns)
+    new_cols = ', '.join(f"new.{c}" for c in columns)
+    old_cols = ', '.join(f"old.{c}" for c in columns)
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": fts}
+        ).scalar()
+        if exists:
+            return
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table_name}', content_rowid='id', tokenize='trigram')"
+        ))
+        # 外部内容表通过触发器与基表保持同步
+        conn.execute(text(
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE ON {table_name} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        ))
+        conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+        logger.info(f"已为表 {table_name} 创建 FTS5 索引 {fts}")
+
+
+def _mysql_query(words, prefix):
+    """构造 MySQL 布尔模式检索串：每个词都必须出现，可选前缀匹配"""
+    return ' '.join(f"+{w}*" if prefix else f'+"{w}"' for w in words)
+
+
+def _sqlite_query(words, columns=None):
+    """构造 FTS5 检索串：trigram 为子串匹配，天然覆盖前缀匹配"""
+    colspec = f"{{{' '.join(columns)}}} : " if columns else ''
+    return ' AND '.join(f'{colspec}"{w}"' for w in words)
+
+
+def _like_clause(model, columns, words):
+    """无法使用全文索引时回退到 LIKE"""
+    clauses = []
+    for w in words:
+        clauses.append(or_(*[getattr(model, c).ilike(f"%{w}%") for c in columns]))
+    return clauses
+
+
+def match_clauses(session, model, columns, term, prefix=True):
+    """
+    生成全文检索过滤条件列表，供 _apply_filters 使用。
+    :param session: 当前会话，用于判断数据库方言
+    :param model: ORM 模型类
+    :param columns: 检索列名，需与 FULLTEXT_INDEXES 中某个索引一致
+    :param term: 检索词，空白分隔的多个词按 AND 组合
+    :param prefix: 是否启用前缀匹配
+    """
+    words = split_terms(term)
+    if not words:
+        return []
+
+    index_name = find_index(model.__tablename__, columns)
+    dialect = session.get_bind().dialect.name if session else None
+    if index_name not in _ready_indexes:
+        return _like_clause(model, columns, words)
+
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import match
+        cols = [getattr(model, c) for c in columns]
+        return [match(*cols, against=_mysql_query(words, prefix)).in_boolean_mode()]
+
+    if dialect == 'sqlite':
+        long_words = [w for w in words if len(w) >= TRIGRAM_SIZE]
+        short_words = [w for w in words if len(w) < TRIGRAM_SIZE]
+        clauses = _like_clause(model, columns, short_words)
+        if long_words:
+            fts = table(_fts_table(index_name), column('rowid'))
+            fts_match = literal_column(fts.name).op('MATCH')(_sqlite_query(long_words, columns))
+            clauses.append(model.id.in_(select(fts.c.rowid).where(fts_match)))
+        return clauses
+
+    return _like_clause(model, columns, words)
+
@@ -0,0 +1,131 @@
+import base64
+from contextlib import contextmanager
+import hashlib
+import mimetypes
+import mmap
+import os
+import shutil
+import tempfile
+from utils.logger import get_logger
+
+logger = get_logger("media_store")
+
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+class MediaStore:
+    """
+    内容寻址的媒体文件存储：文件按 sha256 存放在 <root>/ab/cd/<sha256> 下，
+    相同内容只保存一份，数据库中只记录哈希值。
+    """
+
+    def __init__(self, root='data/media'):
+        self.root = root
+        self.tmp_dir = os.path.join(root, 'tmp')
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+    def path_for(self, digest):
+        """哈希值对应的存储路径，前两级目录取哈希前 4 位"""
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def exists(self, digest):
+        return bool(digest) and os.path.exists(self.path_for(digest))
+
+    def put_file(self, src_path):
+        """
+        导入文件，边读边计算哈希并写入临时文件，内容已存在则直接丢弃临时文件。
+        :return: (sha256, 字节数, MIME 类型)
+        """
+        with open(src_path, 'rb') as src:
+            digest, size = self._ingest(src)
+        media_type = mimetypes.guess_type(src_path)[0] or 'application/octet-stream'
+        return digest, size, media_type
+
+    def put_bytes(self, data):
+        """导入内存中的数据，返回 (sha256, 字节数)"""
+        digest = hashlib.sha256(data).hexdigest()
+        if not self.exists(digest):
+            self._commit(self._write_temp(lambda f: f.write(data)), digest)
+        return digest, len(data)
+
+    def _ingest(self, src):
+        hasher = hashlib.sha256()
+        size = 0
+
+        def copy(f):
+            nonlocal size
+            for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+                hasher.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+
+        tmp_path = self._write_temp(copy)
+        digest = hasher.hexdigest()
+        if self.exists(digest):
+            os.remove(tmp_path)
+            logger.debug(f"媒体文件已存在，跳过写入: {digest}")
+        else:
+            self._commit(tmp_path, digest)
+        return digest, size
+
+    def _write_temp(self, writer):
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                writer(f)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        return tmp_path
+
+    def _commit(self, tmp_path, digest):
+        """临时文件原子地移动到最终位置"""
+        path = self.path_for(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+        logger.info(f"已写入媒体文件 {digest}")
+
+    def open(self, digest):
+        """以二进制只读方式打开媒体文件"""
+        return open(self.path_for(digest), 'rb')
+
+    @contextmanager
+    def mmap(self, digest):
+        """内存映射只读访问，大文件无需整体读入内存"""
+        with self.open(digest) as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b''
+                return
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    def encode_base64(self, digest):
+        """以内存映射读取并编码为 base64（评测请求内联媒体用），不额外复制一份原始内容"""
+        with self.mmap(digest) as data:
+            return base64.b64encode(data).decode('ascii')
+
+    def copy_to(self, digest, dst_path):
+        """导出媒体文件"""
+        shutil.copyfile(self.path_for(digest), dst_path)
+
+    def delete(self, digest):
+        """删除媒体文件（调用方需确认已无数据引用）"""
+        path = self.path_for(digest)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+_media_store = None
+
+
+def get_media_store():
+    """全局媒体存储，根目录取自 config/database.ini 的 [media] root"""
+    global _media_store
+    if _media_store is None:
+        from utils.database import DatabaseManager
+        root = DatabaseManager.load_config().get('media', 'root', fallback='data/media')
+        _media_store = MediaStore(root)
+    return _media_store
@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+from utils import data_events
+from utils.count_cache import filter_signature
+from utils.logger import get_logger
+
+logger = get_logger("page_cache")
+
+
+class PageCache:
+    """
+    进程内分页结果缓存（LRU + TTL）。
+    键为 (表名, 数据集ID, 过滤签名, 页码, 每页条数)，收到写入事件时按表和数据集精确失效。
+    每张表维护一个版本号，失效时递增；查询前取得的版本号与写入缓存时不一致，
+    说明查询期间发生过写入，结果不再写入缓存。
+    """
+
+    def __init__(self, max_entries=256, ttl=120):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._versions = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def key(self, table_name, filters, page, per_page, dataset_id=None):
+        """构造缓存键"""
+        return (table_name, dataset_id, filter_signature(filters), page, per_page)
+
+    def get(self, key):
+        """读取缓存，未命中或已过期返回 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if time.monotonic() - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def contains(self, key):
+        """是否已缓存（不计入命中统计，供预取判断）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.monotonic() - entry[1] <= self.ttl
+
+    def version(self, table_name):
+        """表的当前版本号，查询开始前取得，写入缓存时传给 set"""
+        with self._lock:
+            return self._versions.get(table_name, 0)
+
+    def set(self, key, value, version=None):
+        """
+        写入缓存，超出容量时淘汰最久未使用的条目。
+        :param version: 查询开始前的表版本号，已失效过则放弃写入
+        """
+        with self._lock:
+            if version is not None and version != self._versions.get(key[0], 0):
+                return False
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, table_name, dataset_id=None):
+        """使某张表（可限定数据集）的分页缓存失效"""
+        with self._lock:
+            self._versions[table_name] = self._versions.get(table_name, 0) + 1
+            stale = [k for k in self._entries
+                     if k[0] == table_name and (dataset_id is None or k[1] in (dataset_id, None))]
+            for k in stale:
+                del self._entries[k]
+            self.invalidations += len(stale)
+        if stale:
+            logger.debug(f"分页缓存失效 (表: {table_name}, 数据集ID: {dataset_id}, 条目: {len(stale)})")
+
+    def clear(self):
+        """清空全部缓存"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """返回命中率等统计信息"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+page_cache = PageCache()
+data_events.subscribe(page_cache.invalidate)
@@ -0,0 +1,161 @@
+import base64
+import json
+import math
+from datetime import datetime
+from sqlalchemy import and_, or_
+from utils.logger import get_logger
+from utils.page_cache import page_cache
+from utils.count_cache import is_approximate
+
+logger = get_logger("pagination")
+
+
+def encode_cursor(created_time, row_id):
+    """将 (created_time, id) 编码为不透明的游标字符串"""
+    payload = json.dumps([created_time.isoformat() if created_time else None, row_id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """解析游标字符串，返回 (created_time, id)"""
+    try:
+        created_time, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_time), int(row_id)
+    except Exception as e:
+        logger.error(f"无效的分页游标: {cursor}")
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def apply_keyset(query, time_column, id_column, cursor=None, direction="next"):
+    """
+    为查询追加 keyset 条件和排序。
+    列表按 (created_time, id) 倒序展示：next 取游标之后（更早）的行，prev 取游标之前（更新）的行。
+    prev 方向按正序返回，调用方需自行反转结果。
+    """
+    if direction not in ("next", "prev"):
+        raise ValueError(f"Invalid keyset direction: {direction}")
+
+    if cursor:
+        created_time, row_id = decode_cursor(cursor)
+        if direction == "next":
+            query = query.filter(or_(
+                time_column < created_time,
+                and_(time_column == created_time, id_column < row_id)
+            ))
+        else:
+            query = query.filter(or_(
+                time_column > created_time,
+                and_(time_column == created_time, id_column > row_id)
+            ))
+
+    if direction == "next":
+        return query.order_by(time_column.desc(), id_column.desc())
+    return query.order_by(time_column.asc(), id_column.asc())
+
+
+def page_bounds(rows):
+    """返回一页 ORM 对象的首行、末行游标"""
+    if not rows:
+        return None, None
+    return (encode_cursor(rows[0].created_time, rows[0].id),
+            encode_cursor(rows[-1].created_time, rows[-1].id))
+
+
+class KeysetPager:
+    """
+    基于 (created_time, id) 游标的分页器。
+    记录已访问页面的首末游标：相邻翻页与首末页走 keyset 查询，只有任意跳页才回退到 OFFSET。
+    """
+
+    def __init__(self, keyset_fetch, offset_fetch, count_fetch, per_page=10,
+                 cache_table=None, cache_scope=None):
+        self.keyset_fetch = keyset_fetch    # (session, cursor, direction, per_page, filters) -> (rows, first, last)
+        self.offset_fetch = offset_fetch    # (session, page, per_page, filters) -> (rows, first, last)
+        self.count_fetch = count_fetch      # (session, filters) -> total
+        self.per_page = per_page
+        self.filters = None
+        self.cache_table = cache_table      # 分页缓存所属表名，None 表示不缓存
+        self.cache_scope = cache_scope      # 分页缓存范围（数据集ID）
+        self._bounds = {}                   # 页码 -> (首行游标, 末行游标)
+
+    def reset(self, filters=None, per_page=None):
+        """切换过滤条件或每页条数，清空已记录的游标"""
+        self.filters = filters
+        if per_page:
+            self.per_page = per_page
+        self._bounds.clear()
+
+    def clear(self):
+        """数据发生写入后，已记录的游标不再可靠"""
+        self._bounds.clear()
+
+    def snapshot(self):
+        """复制当前过滤条件与已知游标，供后台线程独立加载（如预取）"""
+        clone = KeysetPager(self.keyset_fetch, self.offset_fetch, self.count_fetch, self.per_page,
+                            self.cache_table, self.cache_scope)
+        clone.filters = self.filters
+        clone._bounds = dict(self._bounds)
+        return clone
+
+    def merge(self, snapshot):
+        """后台用快照加载完成后，合并其新记录的游标"""
+        self._bounds.update(snapshot._bounds)
+
+    def cache_key(self, page):
+        """当前过滤条件下某一页的缓存键"""
+        return page_cache.key(self.cache_table, self.filters, page, self.per_page, self.cache_scope)
+
+    def load(self, session, page):
+        """加载指定页，返回 (行数据, 总条目数, 总页数, 实际页码)"""
+        if self.cache_table:
+            cached = page_cache.get(self.cache_key(page))
+            if cached is not None:
+                rows, total_items, total_pages, page, bounds = cached
+                if bounds:
+                    self._bounds[page] = bounds
+                return rows, total_items, total_pages, page
+
+        # 查询前记下表版本号，查询期间发生写入时结果不写入缓存
+        version = page_cache.version(self.cache_table) if self.cache_table else None
+        result = self._load(session, page)
+        rows, total_items, total_pages, actual_page = result
+        # 近似总数会在后台校正，不写入缓存
+        if self.cache_table and not is_approximate(total_items):
+            entry = (rows, total_items, total_pages, actual_page, self._bounds.get(actual_page))
+            if page_cache.set(self.cache_key(page), entry, version) and actual_page != page:
+                page_cache.set(self.cache_key(actual_page), entry, version)
+        return result
+
+    def _load(self, session, page):
+        """
+        查询数据库加载指定页。
+        总数为近似值时不据此调整页码，也不走末页捷径（近似值可能与实际行数相差很大），
+        由调用方在精确总数校正后重新加载。
+        """
+        total_items = self.count_fetch(session, self.filters)
+        total_pages = math.ceil(total_items / self.per_page) if self.per_page > 0 else 1
+        if page < 1:
+            page = 1
+        elif page > total_pages and total_pages > 0 and not is_approximate(total_items):
+            page = total_pages # 若页码超出总页数，则调整为最后一页
+
+        rows, first, last = self._fetch(session, page, total_items, total_pages)
+        if rows:
+            self._bounds[page] = (first, last)
+        return rows, total_items, total_pages, page
+
+    def _fetch(self, session, page, total_items, total_pages):
+        """按已知游标选择最廉价的取数方式"""
+        if page == 1:
+            return self.keyset_fetch(session, None, "next", self.per_page, self.filters)
+        if page - 1 in self._bounds:
+            return self.keyset_fetch(session, self._bounds[page - 1][1], "next", self.per_page, self.filters)
+        if page + 1 in self._bounds:
+            return self.keyset_fetch(session, self._bounds[page + 1][0], "prev", self.per_page, self.filters)
+        if page == total_pages and not is_approximate(total_items):
+            # 末页从最旧的一端反向读取，行数为余数
+            remainder = total_items - (total_pages - 1) * self.per_page
+            return self.keyset_fetch(session, None, "prev", remainder, self.filters)
+
+        logger.debug(f"页码 {page} 无可用游标，回退到 OFFSET 查询")
+        return self.offset_fetch(session, page, self.per_page, self.filters)
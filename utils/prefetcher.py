@@ -0,0 +1,47 @@
+from PySide6.QtCore import QObject
+from utils.database import DatabaseManager
+from utils.page_cache import page_cache
+from utils.task_executor import TaskExecutor
+from utils.logger import get_logger
+
+logger = get_logger("prefetcher")
+
+
+class PagePrefetcher(QObject):
+    """
+    相邻页预取：当前页渲染后，在后台把上一页和下一页加载进分页缓存。
+    过滤条件变化时调用 cancel()，丢弃尚未执行和已过期的预取任务。
+    """
+
+    def __init__(self, max_threads=2, parent=None):
+        super().__init__(parent)
+        # 独立线程池，避免与前台查询争抢线程
+        self.executor = TaskExecutor(max_threads=max_threads, parent=self)
+        self._generation = 0
+
+    def prefetch(self, pager, page, total_pages):
+        """预取 page 的相邻页，已缓存的页跳过"""
+        if not pager.cache_table:
+            return
+        snapshot = pager.snapshot()
+        generation = self._generation
+        for target in (page + 1, page - 1):
+            if target < 1 or target > total_pages:
+                continue
+            if page_cache.contains(snapshot.cache_key(target)):
+                continue
+            self.executor.submit(self._load, snapshot, target, generation)
+
+    def cancel(self):
+        """取消所有预取（过滤条件或每页条数变化时调用）"""
+        self._generation += 1
+        self.executor.cancel_pending()
+
+    def _load(self, pager, page, generation):
+        """在工作线程中加载一页，结果由分页器写入缓存"""
+        if generation != self._generation:
+            return None
+        with DatabaseManager.get_session() as session:
+            pager.load(session, page)
+        logger.debug(f"已预取第 {page} 页 (表: {pager.cache_table})")
+        return page
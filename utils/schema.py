@@ -0,0 +1,54 @@
+from sqlalchemy import inspect, text, Text
+from utils.logger import get_logger
+
+logger = get_logger("schema")
+
+
+def ensure_indexes(engine, *models):
+    """为已存在的表补建模型中新声明的索引（create_all 不会修改已有表）"""
+    inspector = inspect(engine)
+    for model in models:
+        table = model.__table__
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                index.create(bind=engine)
+                logger.info(f"已为表 {table.name} 创建索引 {index.name}")
+            except Exception as e:
+                logger.error(f"创建索引 {index.name} 失败: {e}", exc_info=True)
+
+
+def ensure_columns(engine, *tables):
+    """
+    为已存在的表补建新增的列；MySQL 下同时把模型已改为 TEXT 的变长字符串列放宽。
+    :param tables: ORM 模型类或 Table 对象
+    """
+    inspector = inspect(engine)
+    dialect = engine.dialect
+    for model in tables:
+        table = getattr(model, '__table__', model)
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {column['name']: column for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            column_type = column.type.compile(dialect=dialect)
+            try:
+                if column.name not in existing:
+                    # 已有数据行无法满足 NOT NULL，新增列一律允许为空
+                    with engine.begin() as conn:
+                        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                    logger.info(f"已为表 {table.name} 新增列 {column.name}")
+                elif (dialect.name == 'mysql' and isinstance(column.type, Text)
+                      and not isinstance(existing[column.name]['type'], Text)):
+                    null = '' if column.nullable else ' NOT NULL'
+                    with engine.begin() as conn:
+                        conn.execute(text(f"ALTER TABLE {table.name} MODIFY {column.name} {column_type}{null}"))
+                    logger.info(f"已将表 {table.name} 的列 {column.name} 改为 {column_type}")
+            except Exception as e:
+                logger.error(f"调整列 {table.name}.{column.name} 失败: {e}", exc_info=True)
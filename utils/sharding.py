@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker, scoped_session
+import os
+from utils.logger import get_logger
+
+logger = get_logger("sharding")
+
+
+class ShardRouter:
+    """
+    数据子项分片路由：按 dataset_id 取模选择分片，每个分片是独立的 SQLite 文件或 MySQL 库。
+    未启用分片时所有方法退化为直接使用主库会话。
+    """
+    _engines = []
+    _sessions = []
+
+    @classmethod
+    def initialize(cls, config, main_engine):
+        """根据配置 [sharding] 创建各分片引擎"""
+        cls.close()
+        if not config.getboolean('sharding', 'enabled', fallback=False):
+            return
+
+        count = config.getint('sharding', 'shards', fallback=4)
+        for shard in range(count):
+            if main_engine.dialect.name == 'sqlite':
+                db_path = config.get('sharding', 'sqlite_path', fallback='data/lmtest_items_{shard}.db').format(shard=shard)
+                os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+                engine = create_engine(f"sqlite:///{db_path}", echo=False,
+                                       connect_args={'check_same_thread': False})
+            else:
+                params = config['mysql']
+                schema = config.get('sharding', 'mysql_schema', fallback='{database}_items_{shard}').format(
+                    database=params['database'], shard=shard)
+                with main_engine.begin() as conn:
+                    conn.execute(text(f"CREATE DATABASE IF NOT EXISTS `{schema}` DEFAULT CHARACTER SET utf8mb4"))
+                engine = create_engine(main_engine.url.set(database=schema), echo=False)
+            cls._engines.append(engine)
+            cls._sessions.append(scoped_session(sessionmaker(bind=engine)))
+        logger.info(f"数据分片已启用，共 {count} 个分片")
+
+    @classmethod
+    def enabled(cls):
+        return bool(cls._engines)
+
+    @classmethod
+    def engines(cls):
+        """所有分片引擎，用于建表和建索引"""
+        return list(cls._engines)
+
+    @classmethod
+    def shard_for(cls, dataset_id):
+        """数据集所在分片序号"""
+        return int(dataset_id) % len(cls._engines)
+
+    @classmethod
+    def session_for(cls, session, dataset_id):
+        """返回数据集所在分片的会话；未启用分片或未指定数据集时返回主库会话"""
+        if not cls._engines or dataset_id is None:
+            return session
+        return cls._sessions[cls.shard_for(dataset_id)]()
+
+    @classmethod
+    def all_sessions(cls, session):
+        """当前线程下所有分片的会话"""
+        if not cls._engines:
+            return [session]
+        return [factory() for factory in cls._sessions]
+
+    @classmethod
+    def map(cls, session, fn):
+        """
+        在所有分片上并行执行 fn(分片会话)，按分片顺序返回结果列表。
+        每个工作线程使用各自的会话，执行完即释放。
+        """
+        if not cls._engines:
+            return [fn(session)]
+
+        def run(factory):
+            try:
+                return fn(factory())
+            finally:
+                factory.remove()
+
+        with ThreadPoolExecutor(max_workers=len(cls._sessions)) as pool:
+            return list(pool.map(run, cls._sessions))
+
+    @classmethod
+    def remove_sessions(cls):
+        """释放本线程的分片会话"""
+        for factory in cls._sessions:
+            factory.remove()
+
+    @classmethod
+    def close(cls):
+        for engine in cls._engines:
+            engine.dispose()
+        cls._engines = []
+        cls._sessions = []
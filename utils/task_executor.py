@@ -0,0 +1,103 @@
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from utils.database import DatabaseManager
+from utils.logger import get_logger
+
+logger = get_logger("task_executor")
+
+
+class TaskSignals(QObject):
+    """任务结果信号，在GUI线程创建，跨线程发射时自动排队到GUI线程"""
+    finished = Signal(object)
+    failed = Signal(str)
+    done = Signal()  # 无论成功、失败或取消都会发射，用于跟踪进行中的任务
+
+
+class Task(QRunnable):
+    """在线程池中执行的后台任务"""
+
+    def __init__(self, fn, args, kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self.started = False
+        self.cancelled = False
+
+    def cancel(self):
+        """取消任务：未开始的不再执行，已开始的执行完后不再回调"""
+        self.cancelled = True
+
+    def run(self):
+        self.started = True
+        try:
+            if self.cancelled:
+                return
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            if not self.cancelled:
+                logger.error(f"后台任务执行失败: {e}", exc_info=True)
+                self.signals.failed.emit(str(e))
+        else:
+            if not self.cancelled:
+                self.signals.finished.emit(result)
+        finally:
+            # 工作线程的 scoped session 用完即释放
+            DatabaseManager.remove_session()
+            self.signals.done.emit()
+
+
+class TaskExecutor(QObject):
+    """
+    基于 QThreadPool 的后台任务执行器，结果通过信号回到GUI线程。
+    每个工作线程通过 DatabaseManager 的 scoped session 使用独立会话。
+    """
+    busy_changed = Signal(bool)  # 有无进行中的任务，用于显示加载状态
+
+    def __init__(self, max_threads=None, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        if max_threads:
+            self.pool.setMaxThreadCount(max_threads)
+        self._active = set()  # 持有任务引用，直到任务结束
+
+    def submit(self, fn, *args, on_result=None, on_error=None, **kwargs):
+        """提交任务，on_result/on_error 在GUI线程回调，返回的任务可用于取消"""
+        task = Task(fn, args, kwargs)
+        task.setAutoDelete(False)
+        self._active.add(task)
+        if on_result:
+            task.signals.finished.connect(on_result)
+        if on_error:
+            task.signals.failed.connect(on_error)
+        task.signals.done.connect(lambda: self._task_done(task))
+        if len(self._active) == 1:
+            self.busy_changed.emit(True)
+        self.pool.start(task)
+        return task
+
+    def _task_done(self, task):
+        if task in self._active:
+            self._active.discard(task)
+            if not self._active:
+                self.busy_changed.emit(False)
+
+    def is_busy(self):
+        return bool(self._active)
+
+    def cancel(self, task):
+        """取消单个任务"""
+        task.cancel()
+        if self.pool.tryTake(task):
+            self._task_done(task)
+
+    def cancel_pending(self):
+        """取消尚未开始执行的任务"""
+        self.pool.clear()
+        for task in [task for task in self._active if not task.started]:
+            task.cancel()
+            self._task_done(task)
+
+    def wait_for_done(self, msecs=-1):
+        """等待所有任务完成（退出程序时使用）"""
+        return self.pool.waitForDone(msecs)
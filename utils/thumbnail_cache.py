@@ -0,0 +1,144 @@
+from collections import OrderedDict
+import os
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader, QPainter, QColor, QFont, QPixmap
+from utils.task_executor import TaskExecutor
+from utils.disk_lru import LRUDirectory
+from utils.logger import get_logger
+
+logger = get_logger("thumbnail_cache")
+
+THUMBNAIL_SIZE = 96
+THUMBNAIL_FORMAT = 'PNG'
+
+
+class ThumbnailDiskCache:
+    """
+    按内容哈希存放缩略图的磁盘缓存，总大小超过上限时按最近访问时间淘汰。
+    可在工作线程中并发使用。
+    """
+
+    def __init__(self, root='data/thumbnails', max_bytes=200 * 1024 * 1024):
+        self.files = LRUDirectory(root, max_bytes, suffix='.png')
+
+    def _name(self, digest, size):
+        return f"{digest}_{size}"
+
+    def get(self, digest, size=THUMBNAIL_SIZE):
+        """命中时返回缩略图 QImage，并刷新访问时间"""
+        path = self.files.touch(self._name(digest, size))
+        if path is None:
+            return None
+        image = QImage(path)
+        return None if image.isNull() else image
+
+    def put(self, digest, image, size=THUMBNAIL_SIZE):
+        """写入缩略图，必要时淘汰最久未访问的文件"""
+        if not self.files.write(self._name(digest, size), lambda path: image.save(path, THUMBNAIL_FORMAT)):
+            logger.warning(f"缩略图写入失败: {digest}")
+
+
+def render_thumbnail(media_store, digest, media_type, size=THUMBNAIL_SIZE):
+    """
+    生成缩略图（在工作线程执行）。图片通过 QImageReader 按目标尺寸解码，
+    不会把原图完整解码到内存；视频和音频生成带类型标识的占位图。
+    """
+    if media_type and media_type.startswith('image/'):
+        reader = QImageReader(media_store.path_for(digest))
+        reader.setAutoTransform(True)
+        original = reader.size()
+        if original.isValid():
+            reader.setScaledSize(original.scaled(size, size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if not image.isNull():
+            return image
+        logger.warning(f"图片解码失败 ({digest}): {reader.errorString()}")
+
+    label = {'video': '视频', 'audio': '音频'}.get((media_type or '').split('/')[0], '文件')
+    image = QImage(size, size, QImage.Format_ARGB32)
+    image.fill(QColor('#ECEFF1'))
+    painter = QPainter(image)
+    painter.setPen(QColor('#607D8B'))
+    painter.setFont(QFont("Microsoft YaHei", max(size // 6, 8)))
+    painter.drawText(image.rect(), Qt.AlignCenter, label)
+    painter.end()
+    return image
+
+
+class ThumbnailLoader(QObject):
+    """
+    缩略图加载器：内存 LRU -> 磁盘缓存 -> 工作线程生成。
+    结果通过 thumbnail_ready 信号回到GUI线程。
+    """
+    thumbnail_ready = Signal(str, QPixmap)
+
+    def __init__(self, media_store, disk_cache, size=THUMBNAIL_SIZE, memory_entries=200, parent=None):
+        super().__init__(parent)
+        self.media_store = media_store
+        self.disk_cache = disk_cache
+        self.size = size
+        self.memory_entries = memory_entries
+        self._pixmaps = OrderedDict()
+        self._pending = set()
+        self.executor = TaskExecutor(max_threads=max(os.cpu_count() or 2, 2) // 2, parent=self)
+
+    def cached(self, digest):
+        """内存中已有的缩略图，没有时返回 None"""
+        pixmap = self._pixmaps.get(digest)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(digest)
+        return pixmap
+
+    def request(self, digest, media_type):
+        """请求缩略图：内存命中直接返回，否则提交后台任务并返回 None"""
+        if not digest:
+            return None
+        pixmap = self.cached(digest)
+        if pixmap is not None:
+            return pixmap
+        if digest not in self._pending:
+            self._pending.add(digest)
+            self.executor.submit(
+                self._load, digest, media_type,
+                on_result=self._loaded,
+                on_error=lambda _, d=digest: self._pending.discard(d)
+            )
+        return None
+
+    def _load(self, digest, media_type):
+        """工作线程：先查磁盘缓存，未命中再生成并写回"""
+        image = self.disk_cache.get(digest, self.size)
+        if image is None:
+            image = render_thumbnail(self.media_store, digest, media_type, self.size)
+            self.disk_cache.put(digest, image, self.size)
+        return digest, image
+
+    def _loaded(self, result):
+        """GUI线程：QImage 转为 QPixmap 并放入内存 LRU"""
+        digest, image = result
+        self._pending.discard(digest)
+        pixmap = QPixmap.fromImage(image)
+        self._pixmaps[digest] = pixmap
+        while len(self._pixmaps) > self.memory_entries:
+            self._pixmaps.popitem(last=False)
+        self.thumbnail_ready.emit(digest, pixmap)
+
+    def cancel(self):
+        """取消尚未开始的生成任务（如翻页或关闭对话框时）"""
+        self.executor.cancel_pending()
+        self._pending.clear()
+
+
+_disk_cache = None
+
+
+def get_thumbnail_cache():
+    """全局缩略图磁盘缓存，目录与容量取自 config/database.ini 的 [media]"""
+    global _disk_cache
+    if _disk_cache is None:
+        from utils.database import DatabaseManager
+        config = DatabaseManager.load_config()
+        root = config.get('media', 'thumbnail_dir', fallback='data/thumbnails')
+        max_mb = config.getint('media', 'thumbnail_cache_mb', fallback=200)
+        _disk_cache = ThumbnailDiskCache(root, max_mb * 1024 * 1024)
+    return _disk_cache
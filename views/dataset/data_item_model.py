@@ -0,0 +1,240 @@
+from collections import OrderedDict
+from functools import partial
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from utils.database import DatabaseManager
+from utils.task_executor import TaskExecutor
+from utils.logger import get_logger
+
+logger = get_logger("data_item_model")
+
+
+class DataItemTableModel(QAbstractTableModel):
+    """
+    数据子项的增量加载模型：视图滚动到底部时通过 canFetchMore/fetchMore
+    在后台按 (created_time, id) 游标读取下一批，已加载的行只保存投影结果。
+    行按批分块，只保留最近访问的若干块；滚出视图后被淘汰的块只记住起始游标，
+    再次滚动到时按游标在后台重新读取，内存占用与数据集大小无关。
+    加载失败时停止继续读取并发出 load_failed，调用 retry() 重试。
+    """
+    HEADERS = ["序号", "标题", "答案", "状态", "标签", "创建时间"]
+    FIELDS = [None, "title", "answer", "status", "tag", "created_time"]
+    PREVIEW_HEADER = "预览"
+    LOADING_TEXT = "加载中..."
+
+    loading_changed = Signal(bool)
+    load_failed = Signal(str)
+
+    def __init__(self, keyset_fetch, batch_size=200, thumbnails=None, max_loaded_batches=20, parent=None):
+        """
+        :param keyset_fetch: 游标查询函数，签名同 DataModel.get_keyset_data（已绑定 dataset_id），出错时抛出异常
+        :param thumbnails: ThumbnailLoader，不为空时追加预览列
+        :param max_loaded_batches: 内存中最多保留的批数
+        """
+        super().__init__(parent)
+        self.keyset_fetch = keyset_fetch
+        self.batch_size = batch_size
+        self.thumbnails = thumbnails
+        self.max_loaded_batches = max_loaded_batches
+        self.executor = TaskExecutor(max_threads=1, parent=self)
+        self._row_count = 0
+        self._batch_cursors = []  # 第 i 批的起始游标（第 0 批为 None）
+        self._loaded = OrderedDict()  # 批序号 -> 投影行列表，按访问顺序排列
+        self._reloading = set()
+        self._cursor = None
+        self._started = False
+        self._loading = False
+        self._exhausted = False
+        self._error = None
+        self._generation = 0  # reload() 后递增，丢弃之前提交的读取结果
+        if thumbnails is not None:
+            thumbnails.thumbnail_ready.connect(self._thumbnail_ready)
+
+    @property
+    def preview_column(self):
+        return len(self.HEADERS) if self.thumbnails is not None else None
+
+    def start(self):
+        """开始加载（页面首次显示时调用）"""
+        if not self._started:
+            self._started = True
+            self.fetchMore(QModelIndex())
+
+    def retry(self):
+        """加载失败后重试：继续读取下一批，已淘汰的可见行在重绘时重新读取"""
+        if self._error is None:
+            return
+        self._error = None
+        if self._row_count:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._row_count - 1, self.columnCount() - 1))
+        self.fetchMore(QModelIndex())
+
+    def row_at(self, row):
+        """返回行的投影结果；所在批已被淘汰时安排后台重新读取并返回 None"""
+        if not 0 <= row < self._row_count:
+            return None
+        batch, offset = divmod(row, self.batch_size)
+        rows = self._loaded.get(batch)
+        if rows is None:
+            self._reload(batch)
+            return None
+        self._loaded.move_to_end(batch)
+        return rows[offset] if offset < len(rows) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS) + (1 if self.thumbnails is not None else 0)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section] if section < len(self.HEADERS) else self.PREVIEW_HEADER
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole and column == 0:
+            return str(row + 1)
+        item = self.row_at(row)
+        if item is None:
+            return self.LOADING_TEXT if role == Qt.DisplayRole and column == 1 else None
+        if column == self.preview_column:
+            if role == Qt.DecorationRole and item.media_hash:
+                # 只有可见行会被请求绘制，缩略图因此按需加载
+                return self.thumbnails.request(item.media_hash, item.media_type)
+            if role == Qt.DisplayRole and not item.media_hash:
+                return "无"
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+            return None
+        if role == Qt.DisplayRole:
+            return str(item.get(self.FIELDS[column], '') or '')
+        if role == Qt.ToolTipRole and column in (1, 2):
+            return item.get(self.FIELDS[column], '')
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return (self._started and not parent.isValid() and not self._exhausted
+                and not self._loading and self._error is None)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """后台读取下一批，结果回到GUI线程后追加"""
+        if parent.isValid() or self._loading or self._exhausted or self._error is not None:
+            return
+        self._loading = True
+        self.loading_changed.emit(True)
+        self.executor.submit(self._fetch, self._cursor,
+                             on_result=partial(self._append, self._generation),
+                             on_error=partial(self._failed, self._generation))
+
+    def _fetch(self, cursor):
+        session = DatabaseManager.get_session()
+        rows, _, last_cursor = self.keyset_fetch(session, cursor=cursor, direction="next", per_page=self.batch_size)
+        return rows, last_cursor
+
+    def _append(self, generation, result):
+        if generation != self._generation:
+            return
+        rows, last_cursor = result
+        self._loading = False
+        self.loading_changed.emit(False)
+        if len(rows) < self.batch_size:
+            self._exhausted = True
+        if not rows:
+            return
+        # 除最后一批外每批都是整批，行号可直接换算为批序号
+        batch = len(self._batch_cursors)
+        self._batch_cursors.append(self._cursor)
+        self._cursor = last_cursor
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._row_count += len(rows)
+        self._store(batch, rows)
+        self.endInsertRows()
+
+    def _reload(self, batch):
+        """后台按起始游标重新读取已淘汰的一批"""
+        if batch in self._reloading or self._error is not None:
+            return
+        self._reloading.add(batch)
+        self.executor.submit(
+            self._fetch, self._batch_cursors[batch],
+            on_result=partial(self._reloaded, self._generation, batch),
+            on_error=partial(self._reload_failed, self._generation, batch)
+        )
+
+    def _reloaded(self, generation, batch, result):
+        if generation != self._generation:
+            return
+        self._reloading.discard(batch)
+        first = batch * self.batch_size
+        count = min(self.batch_size, self._row_count - first)
+        rows = result[0]
+        if len(rows) < count:
+            # 首次加载后有数据被删除：之后各批的行号都已错位，从头重新加载
+            logger.info(f"数据子项已变化（第 {batch} 批重新读取仅 {len(rows)}/{count} 行），重新加载")
+            self.reload()
+            return
+        self._store(batch, rows[:count])
+        self.dataChanged.emit(self.index(first, 0), self.index(first + count - 1, self.columnCount() - 1))
+
+    def reload(self):
+        """清空已加载的行并从第一批重新读取"""
+        self.executor.cancel_pending()
+        self._generation += 1
+        self.beginResetModel()
+        self._row_count = 0
+        self._batch_cursors = []
+        self._loaded.clear()
+        self._reloading.clear()
+        self._cursor = None
+        self._exhausted = False
+        self._error = None
+        self.endResetModel()
+        if self._loading:
+            self._loading = False
+            self.loading_changed.emit(False)
+        if self._started:
+            self.fetchMore(QModelIndex())
+
+    def _reload_failed(self, generation, batch, message):
+        if generation != self._generation:
+            return
+        self._reloading.discard(batch)
+        self._set_error(message)
+
+    def _store(self, batch, rows):
+        self._loaded[batch] = rows
+        self._loaded.move_to_end(batch)
+        while len(self._loaded) > self.max_loaded_batches:
+            self._loaded.popitem(last=False)
+
+    def _failed(self, generation, message):
+        if generation != self._generation:
+            return
+        self._loading = False
+        self.loading_changed.emit(False)
+        self._set_error(message)
+
+    def _set_error(self, message):
+        logger.error(f"加载数据子项失败: {message}")
+        self._error = message
+        self.load_failed.emit(message)
+
+    def _thumbnail_ready(self, digest, pixmap):
+        column = self.preview_column
+        for batch, rows in self._loaded.items():
+            for offset, item in enumerate(rows):
+                if item.media_hash == digest:
+                    index = self.index(batch * self.batch_size + offset, column)
+                    self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def cancel(self):
+        """关闭时取消尚未开始的加载"""
+        self.executor.cancel_pending()
+        if self.thumbnails is not None:
+            self.thumbnails.cancel()
@@ -1,19 +1,38 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QGridLayout,QHBoxLayout, QTabWidget, QWidget,
-                            QFormLayout, QLabel, QTableWidget, QTableWidgetItem,
-                            QHeaderView, QFrame, QSpacerItem, QSizePolicy)
-from PySide6.QtCore import Qt
+                            QFormLayout, QLabel, QPushButton, QTableView, QAbstractItemView,
+                            QHeaderView, QSizePolicy, QTextBrowser)
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QFont
-from models import dataset_son_model
+from functools import partial
 from utils.logger import get_logger
-from models.dataset_model import DatasetCategory, DatasetModel, DatasetStatus
+from models.dataset_model import DatasetCategory
 from models.dataset_son_model import DataModel
 from utils.database import DatabaseManager
+from utils.media_store import get_media_store
+from utils.thumbnail_cache import ThumbnailLoader, get_thumbnail_cache, THUMBNAIL_SIZE
+from utils.count_cache import format_count, is_approximate
+from utils.task_executor import TaskExecutor
+from views.dataset.data_item_model import DataItemTableModel
 
 logger = get_logger("dataset_details_dialog")
 class DatasetDetailsDialog(QDialog):
     def __init__(self, dataset, parent=None):
         super().__init__(parent)
         self.dataset = dataset
+        # 图片/视频/音频数据集显示缩略图，行滚动到可见区域时才加载
+        self.show_previews = dataset.dataset_category != DatasetCategory.TEXT
+        thumbnails = ThumbnailLoader(get_media_store(), get_thumbnail_cache(), parent=self) if self.show_previews else None
+        # 数据子项按游标增量加载，滚动到底部时读取下一批
+        self.item_model = DataItemTableModel(
+            partial(DataModel.get_keyset_data, dataset_id=dataset.id),
+            thumbnails=thumbnails,
+            parent=self
+        )
+        # 数据子项总数：大数据集先显示估算值，再在后台校正为精确值
+        self.item_total = None
+        self.items_loading = False
+        self.items_started = False
+        self.count_executor = TaskExecutor(max_threads=1, parent=self)
         self.init_ui()
         # self.dataset_id = dataset.id
     def init_ui(self):
@@ -24,46 +43,7 @@ class DatasetDetailsDialog(QDialog):
         self.setup_ui()
     def setup_style(self):
         """设置整体样式"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #F5F5F5;
-            }
-            QTabWidget::pane {
-                border: 1px solid #CCCCCC;
-                background-color: white;
-                border-radius: 8px;
-            }
-            QTabBar::tab {
-                padding: 10px 25px;
-                background-color: #E8E8E8;
-                border: 1px solid #CCCCCC;
-                border-bottom: none;
-                margin-right: 4px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-size: 14px;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                font-weight: bold;
-                color: #007ACC;
-            }
-            QTableWidget {
-                border: 1px solid #CCCCCC;
-                gridline-color: #E8E8E8;
-                border-radius: 8px;
-                margin: 10px;
-            }
-            QHeaderView::section {
-                background-color: #F0F0F0;
-                padding: 10px;
-                border: none;
-                border-right: 1px solid #CCCCCC;
-                border-bottom: 1px solid #CCCCCC;
-                font-size: 13px;
-                font-weight: bold;
-            }
-        """)
+        self.setObjectName("datasetDetailsDialog")
     def setup_ui(self):
         """设置UI布局"""
         main_layout = QVBoxLayout()
@@ -76,8 +56,9 @@ class DatasetDetailsDialog(QDialog):
         # 添加基本信息标签页
         tab_widget.addTab(self.create_basic_info_tab(), "基本信息")
         
-        # 添加数据子项标签页
-        tab_widget.addTab(self.create_items_tab(), "数据子项")
+        # 添加数据子项标签页，首次切换到该页时才开始加载
+        self.items_tab_index = tab_widget.addTab(self.create_items_tab(), "数据子项")
+        tab_widget.currentChanged.connect(self.handle_tab_changed)
     def create_basic_info_tab(self):
         """创建基本信息标签页（优化行间距和备注处理）"""
         tab = QWidget()
@@ -89,12 +70,7 @@ class DatasetDetailsDialog(QDialog):
         # 创建表单容器（固定宽度+圆角阴影）
         form_container = QWidget()
         form_container.setFixedWidth(600)  # 适当加宽容器
-        form_container.setStyleSheet("""
-            background-color: white;
-            border-radius: 12px;
-            padding: 25px 35px;
-            border: none;
-        """)
+        form_container.setObjectName("infoForm")
         
         # 表单布局 - 紧凑型设计
         form_layout = QFormLayout()
@@ -104,36 +80,6 @@ class DatasetDetailsDialog(QDialog):
         
         # 统一字体配置
         field_font = QFont("Microsoft YaHei", 14)  # 适当增大字体
-        label_style = """
-            QLabel {
-                color: #424242;
-                font-weight: 500;
-                padding-right: 12px;
-                min-width: 90px;
-            }
-        """
-        value_style = """
-            QLabel {
-                color: #616161;
-                background: #FAFAFA;
-                padding: 6px 10px;
-                min-width: 280px;
-                max-height: 36px;
-                border-radius: 8px;
-                border: 1px solid #EEEEEE;
-            }
-        """
-        remark_style = """
-            QLabel {
-                color: #616161;
-                background: #FAFAFA;
-                padding: 12px;
-                min-width: 280px;
-                max-width: 280px;
-                border-radius: 6px;
-                border: 1px solid #EEEEEE;
-            }
-        """
 
         # 添加基本信息字段
         info_fields = [
@@ -148,7 +94,7 @@ class DatasetDetailsDialog(QDialog):
             # 创建标签
             label_widget = QLabel(f"{label}:")
             label_widget.setFont(field_font)
-            label_widget.setStyleSheet(label_style)
+            label_widget.setProperty("class", "info-label")
             label_widget.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
             
             # 创建值控件
@@ -159,7 +105,7 @@ class DatasetDetailsDialog(QDialog):
             
             # 备注行特殊样式处理
             if is_remark:
-                value_widget.setStyleSheet(remark_style)
+                value_widget.setProperty("class", "info-remark")
                 value_widget.setWordWrap(True)
                 # 调整备注的高度
                 value_widget.setTextInteractionFlags(Qt.TextSelectableByMouse)
@@ -167,7 +113,7 @@ class DatasetDetailsDialog(QDialog):
                 value_widget.setMinimumHeight(80)  # 为备注提供足够高度
                 value_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             else:
-                value_widget.setStyleSheet(value_style)
+                value_widget.setProperty("class", "info-value")
                 value_widget.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
             
             # 使用水平布局包装值控件
@@ -198,60 +144,31 @@ class DatasetDetailsDialog(QDialog):
         # 创建表格容器
         table_container = QWidget()
         table_container.setMinimumSize(900, 400)
-        table_container.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border-radius: 12px;
-                padding: 0;
-                border: none;
-            }
-        """)
+        table_container.setObjectName("itemsContainer")
 
         table_layout = QVBoxLayout(table_container)
 
         # 初始化表格
-        self.data_table = QTableWidget()
+        self.data_table = QTableView()
         self.data_table.setObjectName("dataTable")
+        self.data_table.setModel(self.item_model)
 
         self.data_table.setFont(QFont("Microsoft YaHei", 14))
         self.data_table.setAlternatingRowColors(True)
-        self.data_table.setColumnCount(6)
-
-        headers = ["序号", "标题", "答案", "状态", "标签", "创建时间"]
-        self.data_table.setHorizontalHeaderLabels(headers)
         self.data_table.verticalHeader().setVisible(False)   # 隐藏垂直表头
-        self.data_table.setEditTriggers(QTableWidget.NoEditTriggers)  # 禁用编辑
-        self.data_table.setSelectionBehavior(QTableWidget.SelectRows)  # 整行选中
-        self.data_table.setSelectionMode(QTableWidget.SingleSelection)  # 单选
+        self.data_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # 禁用编辑
+        self.data_table.setSelectionBehavior(QAbstractItemView.SelectRows)  # 整行选中
+        self.data_table.setSelectionMode(QAbstractItemView.SingleSelection)  # 单选
         self.data_table.verticalHeader().setDefaultSectionSize(42)  # 行高
+        # 固定行高，百万行滚动时无需逐行计算高度
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.data_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
 
         # 表头设置
         header = self.data_table.horizontalHeader() 
         header.setFont(QFont("Microsoft YaHei", 12, QFont.Medium))
         header.setObjectName("tableHeader")
 
-        header.setStyleSheet("""
-            QHeaderView#tableHeader {
-                background-color: transparent;
-                border-top left right: 1px solid #e0e0e0;
-                border-radius: 8px;
-            }
-            QHeaderView#tableHeader::section {
-                background-color: #f5f5f5;
-                color: #333333;
-                border: none;
-                border-bottom: 2px solid #e0e0e0;
-                border-left: 1px solid #e0e0e0;
-                border-top: 1px solid #e0e0e0;
-                border-right: 1px solid #e0e0e0;
-                padding: 0;
-                font-family: "Microsoft YaHei";
-                font-size: 14pt;
-                font-weight: 500;
-                qproperty-alignment: AlignCenter;
-            }
-        """)
-
         header.setStretchLastSection(False) 
         header.setSectionResizeMode(0, QHeaderView.Fixed)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
@@ -259,28 +176,8 @@ class DatasetDetailsDialog(QDialog):
         header.setSectionResizeMode(3, QHeaderView.Fixed)
         header.setSectionResizeMode(4, QHeaderView.Fixed)
         header.setSectionResizeMode(5, QHeaderView.Fixed)
-
-        # 表格样式设置        
-        self.data_table.setStyleSheet("""
-            QTableWidget#dataTable {
-                background-color: #ffffff;
-                alternate-background-color: #fafafa;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                gridline-color: #f0f0f0;
-                selection-background-color: #e3f2fd;
-                selection-color: #1976d2;
-            }
-            QTableWidget#dataTable::item {
-                padding: 0;
-                border-bottom: 1px solid #f0f0f0;
-                border-left: 1px solid #f0f0f0;
-            }
-            QTableWidget#dataTable::item:selected {
-                background-color: #e3f2fd;
-                color: #1976d2;
-            }
-        """)
+        if self.show_previews:
+            header.setSectionResizeMode(self.item_model.preview_column, QHeaderView.Fixed)
 
         # 设置列宽
         self.data_table.setColumnWidth(0, 40) # 序号列
@@ -289,74 +186,113 @@ class DatasetDetailsDialog(QDialog):
         self.data_table.setColumnWidth(3, 60)  # 状态列
         self.data_table.setColumnWidth(4, 100)  # 标签列
         self.data_table.setColumnWidth(5, 150)  # 创建时间列
+        if self.show_previews:
+            self.data_table.setColumnWidth(self.item_model.preview_column, THUMBNAIL_SIZE + 16)  # 预览列
+            self.data_table.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+            self.data_table.verticalHeader().setDefaultSectionSize(THUMBNAIL_SIZE + 8)
+
+        # 双击打开单条数据，此时才加载完整答案与上下文
+        self.data_table.doubleClicked.connect(self.show_item_detail)
+
+        # 总数与加载状态
+        self.items_status_label = QLabel()
+        self.items_status_label.setProperty("class", "muted-label")
+        self.item_model.loading_changed.connect(self.update_items_status)
+        self.item_model.rowsInserted.connect(lambda *args: self.update_items_status(False))
+        # 加载失败时显示原因，可点击重试
+        self.items_retry_btn = QPushButton("重试")
+        self.items_retry_btn.hide()
+        self.items_retry_btn.clicked.connect(self.retry_items)
+        self.item_model.load_failed.connect(self.show_items_error)
+        status_layout = QHBoxLayout()
+        status_layout.addWidget(self.items_status_label)
+        status_layout.addWidget(self.items_retry_btn)
+        status_layout.addStretch()
 
         table_layout.addWidget(self.data_table)
         layout.addWidget(table_container)
-
-        # 加载数据
-        self.update_tab_table()
+        layout.addLayout(status_layout)
 
         return tab
 
-    def update_tab_table(self, dataset=None, current_page=1, total_pages=1):
-        """更新数据子项表格（完整实现）"""
-        # 表格初始化检查
-        if not hasattr(self, 'data_table'):
-            logger.error("表格控件未初始化")
-            return
+    def handle_tab_changed(self, index):
+        """首次切换到数据子项页时开始加载"""
+        if index == self.items_tab_index and not self.items_started:
+            self.items_started = True
+            self.count_items(approximate=True)
+            self.item_model.start()
 
-        try:
-            # 清空现有数据
-            self.data_table.setRowCount(0)
-            with DatabaseManager.get_session() as session:
-                datas, total_items, total_pages = DataModel.get_paginated_data(
-                        session,
-                        dataset_id=self.dataset.id,
-                        page=current_page,
-                        per_page=10
-                    )
-            
-            # 处理空数据状态
-            if not datas:
-                self.data_table.setRowCount(1)
-                self.data_table.setSpan(0, 0, 1, self.data_table.columnCount())
-                no_data_item = QTableWidgetItem("暂无数据")
-                no_data_item.setFont(QFont("Microsoft YaHei", 12))
-                no_data_item.setTextAlignment(Qt.AlignCenter)
-                self.data_table.setItem(0, 0, no_data_item)
-                # self.update_pagination(0, 1, 1)
-                return
+    def count_items(self, approximate):
+        """后台统计数据子项总数"""
+        self.count_executor.submit(
+            self._count_items, approximate,
+            on_result=self.apply_item_total,
+            on_error=lambda message: logger.error(f"统计数据子项总数失败: {message}")
+        )
 
-            # 设置表格行数
-            self.data_table.setRowCount(len(datas))
-            # 填充数据行
-            for row, data in enumerate(datas):
-                # 填充各列数据
-                self.data_table.setItem(row, 0, QTableWidgetItem(str(row+1)))  # 序号
-                self.data_table.setItem(row, 1, QTableWidgetItem(data.get('title', '')))  # 标题
-                self.data_table.setItem(row, 2, QTableWidgetItem(data.get('answer', '')))  # 答案
-                
-                # 状态列（特殊居中处理）
-                status_item = QTableWidgetItem(data.get('status', ''))
-                self.data_table.setItem(row, 3, status_item)
-                
-                self.data_table.setItem(row, 4, QTableWidgetItem(data.get('tags', '')))  # 标签
-                
-                # 时间列（自动转为字符串）
-                time_str = str(data.get('created_time', ''))[:19]  # 截取到秒
-                self.data_table.setItem(row, 5, QTableWidgetItem(time_str))
+    def _count_items(self, approximate):
+        with DatabaseManager.get_session() as session:
+            return DataModel.count_data(session, dataset_id=self.dataset.id, approximate=approximate)
 
-                # 添加操作按钮（如需）
-                # self._add_action_buttons(row_idx, str(item.get('id', '')))
+    def apply_item_total(self, total):
+        self.item_total = total
+        self.update_items_status(self.items_loading)
+        if is_approximate(total):
+            self.count_items(approximate=False)
 
-            # 更新分页控件
-            # actual_total = len(datasets) if datasets is not None else total_items
-            # self.update_pagination(actual_total, current_page, total_pages)
+    def update_items_status(self, loading):
+        """显示已加载条数和数据集总量"""
+        self.items_loading = loading
+        if not self.items_retry_btn.isHidden():
+            return  # 保留加载失败的提示，直到点击重试
+        loaded = self.item_model.rowCount()
+        total = format_count(self.item_total) if self.item_total is not None else "..."
+        text = f"已加载 {loaded} 条 / 共 {total} 条"
+        self.items_status_label.setText(text + ("，加载中..." if loading else ""))
+
+    def show_items_error(self, message):
+        """加载失败：显示原因与重试按钮，不当作已加载完毕"""
+        loaded = self.item_model.rowCount()
+        self.items_status_label.setText(f"已加载 {loaded} 条，加载失败: {message}")
+        self.items_retry_btn.show()
+
+    def retry_items(self):
+        self.items_retry_btn.hide()
+        self.item_model.retry()
+
+    def show_item_detail(self, index):
+        """打开单条数据详情，在后台按需读取完整答案与上下文"""
+        item = self.item_model.row_at(index.row())
+        if item is None:
+            return
+        self.item_model.executor.submit(
+            self._read_detail, item.id,
+            on_result=self.open_item_detail,
+            on_error=lambda message: logger.error(f"读取数据详情失败: {message}")
+        )
+
+    def _read_detail(self, data_id):
+        with DatabaseManager.get_session() as session:
+            return DataModel.get_data_detail(session, data_id, self.dataset.id)
+
+    def open_item_detail(self, detail):
+        if not detail:
+            return
 
-        except Exception as e:
-            logger.error(f"更新表格失败: {str(e)}", exc_info=True)
-            self.data_table.setRowCount(0)
-            error_item = QTableWidgetItem("数据加载失败")
-            error_item.setTextAlignment(Qt.AlignCenter)
-            self.data_table.setItem(0, 0, error_item)
+        dialog = QDialog(self)
+        dialog.setWindowTitle("数据详情")
+        dialog.resize(700, 500)
+        layout = QVBoxLayout(dialog)
+        browser = QTextBrowser()
+        browser.setFont(QFont("Microsoft YaHei", 12))
+        sections = [("标题", detail['title']), ("答案", detail['answer']),
+                    ("上下文", detail['context']), ("标签", detail['tag'])]
+        browser.setPlainText("\n\n".join(f"【{label}】\n{value or '无'}" for label, value in sections))
+        layout.addWidget(browser)
+        dialog.exec()
 
+    def done(self, result):
+        """关闭时取消尚未开始的加载和缩略图任务"""
+        self.item_model.cancel()
+        self.count_executor.cancel_pending()
+        super().done(result)
@@ -1,14 +1,11 @@
-from typing import override
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QComboBox, QTextEdit, QFrame,
     QPushButton
 )
-from PySide6.QtCore import Qt,Slot,Signal
+from PySide6.QtCore import Qt,Signal
 from PySide6.QtGui import QCursor
 from utils.logger import get_logger
-from models.dataset_model import DatasetModel, DatasetStatus, DatasetCategory
-from utils.database import DatabaseManager
 import enum
 
 logger = get_logger("dataset_dialog")
@@ -188,89 +185,9 @@ class DatasetDialog(QDialog):
         self.fill_data()
 
     def setup_style(self):
-        """设置样式表"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f5f7fa;
-                border: 1px solid #e4e7ed;
-                border-radius: 8px;
-            }
-            
-            .form-label {
-                font-size: 15px;
-                font-weight: 500;
-                color: #333333;
-            }
-            
-            .form-input, .form-combo, .form-text {
-                border: 1px solid #dcdfe6;
-                border-radius: 4px;
-                padding: 8px 12px;
-                background-color: #ffffff;
-                font-size: 14px;
-                color: #606266;
-            }
-            
-            .form-input:hover, .form-combo:hover, .form-text:hover {
-                border-color: #c0c4cc;
-            }
-            
-            .form-input:focus, .form-combo:focus, .form-text:focus {
-                border-color: #409eff;
-                box-shadow: 0 0 0 2px rgba(64, 158, 255, 0.2);
-            }
-            
-            .form-combo::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: right center;
-                width: 24px;
-                border-left: none;
-            }
-            
-            .separator {
-                background-color: #ebeef5;
-                margin: 1px 0;
-                height: 1px;
-            }
-            
-            .primary-button {
-                background-color: #409eff;
-                color: white;
-                border-radius: 4px;
-                font-size: 15px;
-                font-weight: 500;
-                padding: 8px 20px;
-            }
-            
-            .primary-button:hover {
-                background-color: #66b1ff;
-            }
-            
-            .primary-button:pressed {
-                background-color: #3a8ee6;
-            }
-            
-            .secondary-button {
-                background-color: #f5f7fa;
-                color: #606266;
-                border: 1px solid #dcdfe6;
-                border-radius: 4px;
-                font-size: 15px;
-                font-weight: 500;
-                padding: 8px 20px;
-            }
-            
-            .secondary-button:hover {
-                background-color: #ecf5ff;
-                color: #409eff;
-                border-color: #c6e2ff;
-            }
-            
-            .secondary-button:pressed {
-                background-color: #e6ebf5;
-            }
-        """)
-        
+        """设置样式（样式规则见 views/theme.py）"""
+        self.setObjectName("datasetDialog")
+
         # 设置鼠标悬停样式
         self.confirm_btn.setCursor(QCursor(Qt.PointingHandCursor))
         self.cancel_btn.setCursor(QCursor(Qt.PointingHandCursor))
\ No newline at end of file
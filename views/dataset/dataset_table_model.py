@@ -0,0 +1,125 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QEvent, Signal
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+
+
+class DatasetTableModel(QAbstractTableModel):
+    """数据集列表模型：每行保存一个预先格式化好的元组，视图按需读取，不创建任何单元格对象"""
+    HEADERS = ["序号", "名称", "分类", "状态", "内容量", "创建时间", "操作"]
+    ACTION_COLUMN = 6
+    # 各列对齐方式，None 为默认
+    ALIGNMENTS = {
+        3: Qt.AlignCenter,
+        4: Qt.AlignRight | Qt.AlignVCenter,
+        5: Qt.AlignCenter,
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # (序号, 名称, 分类, 状态, 内容量, 创建时间, 数据集ID)
+
+    def set_rows(self, datasets):
+        """整页替换数据"""
+        self.beginResetModel()
+        self._rows = [
+            (str(row + 1),
+             dataset.get("dataset_name", "") or "",
+             dataset.get("dataset_category", "") or "",
+             dataset.get("status", "") or "",
+             str(dataset.get("content_size", "")),
+             dataset.get("created_time", "") or "",
+             str(dataset.get("id", "")))
+            for row, dataset in enumerate(datasets)
+        ]
+        self.endResetModel()
+
+    def dataset_id(self, row):
+        return self._rows[row][-1]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return None if column == self.ACTION_COLUMN else self._rows[index.row()][column]
+        if role == Qt.TextAlignmentRole:
+            return self.ALIGNMENTS.get(column)
+        if role == Qt.UserRole:
+            return self._rows[index.row()][-1]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    操作列委托：直接绘制查看/编辑/导入/删除图标并处理点击命中，
+    取代每行一组 QPushButton 及其样式表。
+    """
+    action_triggered = Signal(str, str)  # 动作名, 数据集ID
+
+    # (动作名, 图标, 图标边长)
+    ACTIONS = [
+        ('view', 'utils/img/view.png', 16),
+        ('edit', 'utils/img/edit.png', 16),
+        ('import', 'utils/img/import.png', 12),
+        ('delete', 'utils/img/delete.png', 12),
+    ]
+    SLOT_WIDTH = 30   # 每个按钮占位宽度
+    SPACING = 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pixmaps = {}
+
+    def _pixmap(self, path, size):
+        """图标只加载和缩放一次"""
+        if path not in self._pixmaps:
+            self._pixmaps[path] = QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return self._pixmaps[path]
+
+    def _slots(self, rect):
+        """各按钮在单元格中的区域，整体水平居中"""
+        total = len(self.ACTIONS) * self.SLOT_WIDTH + (len(self.ACTIONS) - 1) * self.SPACING
+        x = rect.x() + (rect.width() - total) // 2
+        slots = []
+        for name, path, size in self.ACTIONS:
+            slots.append((name, path, size, QRect(x, rect.y(), self.SLOT_WIDTH, rect.height())))
+            x += self.SLOT_WIDTH + self.SPACING
+        return slots
+
+    def paint(self, painter, option, index):
+        # 先绘制背景（选中、交替行颜色等）
+        option.widget.style().drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        for _, path, size, slot in self._slots(option.rect):
+            pixmap = self._pixmap(path, size)
+            x = slot.x() + (slot.width() - pixmap.width()) // 2
+            y = slot.y() + (slot.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+
+    def hit_test(self, rect, pos):
+        """返回点击位置对应的动作名"""
+        for name, _, _, slot in self._slots(rect):
+            if slot.contains(pos):
+                return name
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseMove:
+            hit = self.hit_test(option.rect, event.position().toPoint())
+            option.widget.viewport().setCursor(Qt.PointingHandCursor if hit else Qt.ArrowCursor)
+        elif event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action = self.hit_test(option.rect, event.position().toPoint())
+            if action:
+                self.action_triggered.emit(action, model.data(index, Qt.UserRole))
+                return True
+        return super().editorEvent(event, model, option, index)
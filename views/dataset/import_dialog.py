@@ -1,15 +1,13 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
+    QVBoxLayout, QHBoxLayout, QTableWidget,
     QTableWidgetItem, QPushButton, QFileDialog, QMessageBox,
-    QLabel, QLineEdit, QGridLayout, QDialog, QFrame
+    QLabel, QLineEdit, QDialog, QFrame
 )
 from PySide6.QtCore import Qt, Signal
-from models.dataset_model import DatasetModel
-from models.dataset_son_model import DataModel, DataStatus
-from utils.database import DatabaseManager
-import pandas as pd
-import pandas as pd
+from models.dataset_son_model import DataStatus
+import os
 from utils.logger import get_logger
+from views.theme import icon_button
 
 
 logger = get_logger("import_dialog")
@@ -24,14 +22,7 @@ class ImportDialog(QDialog):
         self.setWindowTitle("数据导入")
         # 设置对话框大小
         self.setMinimumSize(800, 600)
-        # 设置对话框样式
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f5f7fa;
-                border: 1px solid #e4e7ed;
-                border-radius: 8px;
-            }
-        """)
+        self.setObjectName("importDialog")
         # 初始化界面布局
         self.init_ui()
 
@@ -45,66 +36,24 @@ class ImportDialog(QDialog):
 
         # 顶部区域
         top_frame = QFrame()
-        top_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e4e7ed;
-                border-radius: 8px;
-                padding: 0;
-                height: 40px;
-            }
-        """)
+        top_frame.setObjectName("importTopFrame")
         top_layout = QHBoxLayout(top_frame)
         
         # 选择文件按钮
         self.select_file_btn = QPushButton("选择文件")
         self.select_file_btn.setMinimumSize(100, 32)
-        self.select_file_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #409eff;
-                color: white;
-                border-radius: 4px;
-                width: 60px;
-                height: 32px;
-            }
-            QPushButton:hover {
-                background-color: #66b1ff;
-            }
-        """)
+        self.select_file_btn.setProperty("class", "primary-button")
         self.select_file_btn.clicked.connect(self.select_file)
         top_layout.addWidget(self.select_file_btn)        
         # 文件名称显示区域
         self.file_name_display = QLineEdit()
         self.file_name_display.setReadOnly(True)
-        self.file_name_display.setStyleSheet("""
-            QLineEdit {
-                background-color: white;
-                border: 1px solid #e4e7ed;
-                border-radius: 6px;
-                padding: 0;
-                max-width: 200px;
-                height: 32px;
-            }
-            QLineEdit::uneditable {
-                background-color: #f5f7fa;
-            }
-        """)
+        self.file_name_display.setObjectName("fileNameDisplay")
         top_layout.addWidget(self.file_name_display)
         # 导入模板下载按钮
         self.download_template_btn = QPushButton("下载模板")
         self.download_template_btn.setMinimumSize(100, 32)
-        self.download_template_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #409eff;
-                color: white;
-                border-radius: 4px; 
-                width: 60px;
-                height: 32px;
-            }
-            QPushButton:hover {
-                
-            }
-        """)
+        self.download_template_btn.setProperty("class", "primary-button")
         self.download_template_btn.clicked.connect(self.download_template)
         top_layout.addWidget(self.download_template_btn)
         top_layout.addStretch()
@@ -113,35 +62,16 @@ class ImportDialog(QDialog):
 
         # 提示标签
         info_label = QLabel("提示：预览展示前十条数据")
-        info_label.setStyleSheet("""
-            QLabel {
-                color: #606266;
-                font-weight: bold;
-                border:none;
-            }
-        """)
+        info_label.setProperty("class", "hint-label")
         top_layout.addWidget(info_label)
         top_layout.addStretch()
 
         # 表格区域
         self.data_table = QTableWidget()
+        self.data_table.setObjectName("importTable")
         self.data_table.setColumnCount(4)
         self.data_table.setHorizontalHeaderLabels(["序号", "标题", "答案", "标签"])
         self.data_table.verticalHeader().setVisible(False)
-        self.data_table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #e4e7ed;
-                border-radius: 8px;
-            }
-            QHeaderView::section {
-                background-color: #f5f7fa;
-                padding: 5px;
-                border: none;
-                border-right: 1px solid #e4e7ed;
-                border-bottom: 1px solid #e4e7ed;
-            }
-        """)
         # 设置列宽
         self.data_table.setColumnWidth(0, 40)
         self.data_table.setColumnWidth(1, 280)
@@ -152,57 +82,17 @@ class ImportDialog(QDialog):
 
         # 底部按钮区域
         button_frame = QFrame()
-        button_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e4e7ed;
-                border-radius: 8px;
-                padding: 5px;
-                height: 40px;
-            }
-        """)
+        button_frame.setObjectName("importButtonFrame")
         main_layout.addWidget(button_frame)
         button_layout = QHBoxLayout(button_frame)     
         button_layout.setContentsMargins(0, 0, 0, 0)
         button_layout.setSpacing(10)   
         # 确定按钮
-        self.confirm_btn = QPushButton()
-        self.confirm_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                image: url(utils/img/confirm.png);
-                width: 40px;
-                height: 40px;
-            }
-            QPushButton:hover {
-                cursor: pointer;
-            }
-            QPushButton:pressed {
-                padding: 4px;
-            }
-        """)
+        self.confirm_btn = icon_button("confirm", size=40, min_size=(80, 40))
         self.confirm_btn.clicked.connect(self.emit_import_confirmed)
         
         # 取消按钮
-        self.cancel_btn = QPushButton()
-        self.cancel_btn.setMinimumSize(80, 32)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                image: url(utils/img/cancel.png);
-                width: 40px;
-                height: 40px;
-            }
-            QPushButton:hover {
-                cursor: pointer;
-            }
-            QPushButton:pressed {
-                padding: 4px;
-            }
-        """)
-        
+        self.cancel_btn = icon_button("cancel", size=40, min_size=(80, 40))
         self.cancel_btn.clicked.connect(self.reject)
         
         button_layout.addStretch()
@@ -224,6 +114,8 @@ class ImportDialog(QDialog):
         fil = file_path.split("/")[-1]
         self.file_name_display.setText(fil)
         if file_path:
+            # pandas 导入较慢，只在真正读取文件时加载
+            import pandas as pd
             try:
                 # 读取数据
                 data_list = []
@@ -250,6 +142,11 @@ class ImportDialog(QDialog):
                         'title': str(row['title']),
                         'answer': str(row['answer']),
                         'tags': str(row['tags']),
+                        # 可选的参考上下文列
+                        'context': str(row['context']) if 'context' in df.columns and pd.notna(row['context']) else None,
+                        # 可选的媒体文件列，相对路径以导入文件所在目录为准
+                        'media_path': os.path.join(os.path.dirname(file_path), str(row['media']))
+                                      if 'media' in df.columns and pd.notna(row['media']) else None,
                         'status': DataStatus.ENABLED
                     }
                     data_list.append(data_item)
@@ -318,6 +215,7 @@ class ImportDialog(QDialog):
         )
         
         if file_path:
+            import pandas as pd
             try:
                 # 创建示例数据
                 template_data = {
@@ -1,23 +1,142 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
+    QFrame, QProgressBar, QPushButton, QScrollArea
+)
+from PySide6.QtCore import Qt, Signal
+
+
+class StatPanel(QFrame):
+    """统计面板：标题 + 若干行 名称/比例条/数值"""
+
+    def __init__(self, title, max_rows=10):
+        super().__init__()
+        self.max_rows = max_rows
+        self.setObjectName("statPanel")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 12, 16, 12)
+        layout.setSpacing(8)
+
+        title_label = QLabel(title)
+        title_label.setProperty("class", "panel-title")
+        layout.addWidget(title_label)
+
+        self.rows_layout = QGridLayout()
+        self.rows_layout.setHorizontalSpacing(10)
+        self.rows_layout.setVerticalSpacing(6)
+        self.rows_layout.setColumnStretch(1, 1)
+        layout.addLayout(self.rows_layout)
+        layout.addStretch()
+
+    def set_rows(self, rows):
+        """设置数据行 [(名称, 数值), ...]"""
+        while self.rows_layout.count():
+            item = self.rows_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+
+        rows = list(rows)[:self.max_rows]
+        if not rows:
+            self.rows_layout.addWidget(QLabel("暂无数据"), 0, 0)
+            return
+
+        max_value = max(value for _, value in rows) or 1
+        for row, (name, value) in enumerate(rows):
+            name_label = QLabel(str(name))
+            name_label.setMinimumWidth(90)
+            bar = QProgressBar()
+            bar.setTextVisible(False)
+            bar.setRange(0, max_value)
+            bar.setValue(value)
+            value_label = QLabel(str(value))
+            value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.rows_layout.addWidget(name_label, row, 0)
+            self.rows_layout.addWidget(bar, row, 1)
+            self.rows_layout.addWidget(value_label, row, 2)
+
 
 class HomeView(QWidget):
+    refresh_signal = Signal()   # 刷新看板信号
+    shown_signal = Signal()     # 页面显示信号
+
     def __init__(self):
         super().__init__()
-        
+
         layout = QVBoxLayout()
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(12)
         self.setLayout(layout)
-        
+
         welcome_label = QLabel("欢迎使用 上研院 大模型测试平台 v1.0")
-        welcome_label.setStyleSheet("""
-            QLabel {
-                font-size: 20px;
-                color: #2c3e50;
-                padding: 20px;
-            }
-        """)
+        welcome_label.setObjectName("welcomeLabel")
         welcome_label.setAlignment(Qt.AlignCenter)
-        
-        layout.addStretch(1)
-        layout.addWidget(welcome_label)
-        layout.addStretch(1)
\ No newline at end of file
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(welcome_label, stretch=1)
+        self.refresh_button = QPushButton("刷新")
+        self.refresh_button.setCursor(Qt.PointingHandCursor)
+        self.refresh_button.setProperty("class", "primary-button")
+        self.refresh_button.clicked.connect(self.refresh_signal.emit)
+        header_layout.addWidget(self.refresh_button)
+        layout.addLayout(header_layout)
+
+        # 汇总卡片
+        summary_layout = QHBoxLayout()
+        summary_layout.setSpacing(12)
+        self.dataset_total_label = self.create_summary_card(summary_layout, "数据集总数")
+        self.item_total_label = self.create_summary_card(summary_layout, "数据条目总数")
+        self.recent_import_label = self.create_summary_card(summary_layout, "近30天导入")
+        layout.addLayout(summary_layout)
+
+        # 统计面板
+        panels = QWidget()
+        panels_layout = QGridLayout(panels)
+        panels_layout.setContentsMargins(0, 0, 0, 0)
+        panels_layout.setSpacing(12)
+        self.category_panel = StatPanel("分类分布")
+        self.status_panel = StatPanel("状态分布")
+        self.dataset_panel = StatPanel("数据集内容量 Top 10")
+        self.tag_panel = StatPanel("标签 Top 20", max_rows=20)
+        self.import_panel = StatPanel("近30天导入量", max_rows=30)
+        panels_layout.addWidget(self.category_panel, 0, 0)
+        panels_layout.addWidget(self.status_panel, 0, 1)
+        panels_layout.addWidget(self.dataset_panel, 1, 0)
+        panels_layout.addWidget(self.tag_panel, 1, 1)
+        panels_layout.addWidget(self.import_panel, 2, 0, 1, 2)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.NoFrame)
+        scroll_area.setWidget(panels)
+        layout.addWidget(scroll_area, stretch=1)
+
+    def create_summary_card(self, parent_layout, title):
+        """创建汇总卡片，返回数值标签"""
+        card = QFrame()
+        card.setObjectName("summaryCard")
+        card_layout = QVBoxLayout(card)
+        title_label = QLabel(title)
+        title_label.setProperty("class", "card-title")
+        value_label = QLabel("-")
+        value_label.setProperty("class", "card-value")
+        card_layout.addWidget(title_label)
+        card_layout.addWidget(value_label)
+        parent_layout.addWidget(card)
+        return value_label
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.shown_signal.emit()
+
+    def update_dashboard(self, stats):
+        """刷新看板数据"""
+        if not stats:
+            return
+        self.dataset_total_label.setText(str(stats["dataset_total"]))
+        self.item_total_label.setText(str(stats["item_total"]))
+        self.recent_import_label.setText(str(sum(value for _, value in stats["imports"])))
+        self.category_panel.set_rows(stats["categories"])
+        self.status_panel.set_rows(stats["statuses"])
+        self.dataset_panel.set_rows(stats["datasets"])
+        self.tag_panel.set_rows(stats["tags"])
+        self.import_panel.set_rows(stats["imports"])
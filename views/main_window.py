@@ -20,23 +20,8 @@ class MainWindow(QMainWindow):
         
         # 左侧菜单栏
         self.menu_list = QListWidget()
+        self.menu_list.setObjectName("menuList")
         self.menu_list.setFixedWidth(200)
-        self.menu_list.setStyleSheet("""
-            QListWidget {
-                background-color: #34495e;
-                color: white;
-                font-size: 16px;
-                border: none;
-            }
-            QListWidget::item {
-                height: 50px;
-                padding-left: 20px;
-                border-bottom: 1px solid #2c3e50;
-            }
-            QListWidget::item:selected {
-                background-color: #3498db;
-            }
-        """)
         main_layout.addWidget(self.menu_list)
         
         # 右侧内容区域
@@ -46,16 +31,8 @@ class MainWindow(QMainWindow):
         
         # 标题栏
         self.title_label = QLabel()
+        self.title_label.setObjectName("pageTitle")
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 15px 0;
-                border-bottom: 2px solid #3498db;
-            }
-        """)
         content_layout.addWidget(self.title_label)
         
         # 页面堆栈
@@ -64,21 +41,49 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(content_widget, stretch=1)
 
+        # 尚未创建的页面：堆栈索引 -> 页面工厂
+        self.page_factories = {}
+        # 随页面一起创建的控制器，保持引用
+        self.page_controllers = {}
+
         # 连接菜单列表项点击事件
         self.menu_list.currentRowChanged.connect(self.set_current_page_from_menu)
     
-    def add_page(self, widget, title):
-        """添加页面到堆栈并更新菜单"""
+    def add_page(self, page, title):
+        """
+        添加页面到堆栈并更新菜单
+        :param page: 页面控件，或无参工厂函数（首次切换到该页时调用，返回 (页面控件, 控制器)）
+        """
+        if isinstance(page, QWidget):
+            widget = page
+        else:
+            # 先放入空白占位，真正的页面在首次显示时创建
+            widget = QWidget()
+            self.page_factories[self.stacked_widget.count()] = page
         self.stacked_widget.addWidget(widget)
         # 存储页面标题
         widget.setProperty("page_title", title)
         # 添加到菜单列表
         self.menu_list.addItem(title)
-    
+
+    def ensure_page(self, index):
+        """按需创建页面，替换占位控件"""
+        factory = self.page_factories.pop(index, None)
+        if factory is None:
+            return
+        placeholder = self.stacked_widget.widget(index)
+        widget, controller = factory()
+        widget.setProperty("page_title", placeholder.property("page_title"))
+        self.page_controllers[index] = controller
+        self.stacked_widget.insertWidget(index, widget)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+
     @Slot(int)
     def set_current_page_from_menu(self, index):
         """根据菜单选择设置当前显示的页面"""
         if 0 <= index < self.stacked_widget.count():
+            self.ensure_page(index)
             self.stacked_widget.setCurrentIndex(index)
             current_widget = self.stacked_widget.currentWidget()
             title = current_widget.property("page_title")
@@ -88,6 +93,7 @@ class MainWindow(QMainWindow):
         """由控制器设置当前页面，并同步菜单选中状态"""
         if 0 <= index < self.stacked_widget.count():
             # 设置堆栈页面
+            self.ensure_page(index)
             self.stacked_widget.setCurrentIndex(index)
             current_widget = self.stacked_widget.currentWidget()
             title = current_widget.property("page_title")
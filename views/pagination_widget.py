@@ -0,0 +1,144 @@
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QLineEdit, QComboBox, QPushButton
+from PySide6.QtGui import QIntValidator
+from PySide6.QtCore import Qt, Signal
+from utils.count_cache import format_count
+from views.theme import icon_button
+
+PAGE_SIZES = [10, 20, 50, 100]
+
+
+def page_window(current_page, total_pages, slots):
+    """
+    计算页码窗口：首页、末页与当前页附近的页码，中间用 None 表示省略。
+    结果长度不超过 slots，计算量与总页数无关。
+    """
+    if total_pages <= slots:
+        return list(range(1, total_pages + 1))
+    # 除首末页和两处省略号外，中间可放的页码数
+    middle = slots - 4
+    half = middle // 2
+    if current_page - half <= 3:
+        # 靠近首页：左侧不省略
+        return list(range(1, slots - 1)) + [None, total_pages]
+    if current_page + half >= total_pages - 2:
+        # 靠近末页：右侧不省略
+        return [1, None] + list(range(total_pages - slots + 3, total_pages + 1))
+    start = current_page - half
+    return [1, None] + list(range(start, start + middle)) + [None, total_pages]
+
+
+class PaginationWidget(QFrame):
+    """
+    分页控件：固定数量的页码按钮循环复用，另有跳页输入框和每页条数选择。
+    刷新时只更新按钮文字，不随总页数增长。
+    上一页/下一页请求相邻页，由分页器沿 keyset 游标读取。
+    """
+    page_changed = Signal(int)        # 请求跳转的页码
+    page_size_changed = Signal(int)   # 新的每页条数
+
+    def __init__(self, page_sizes=PAGE_SIZES, window_slots=9, parent=None):
+        super().__init__(parent)
+        self.setObjectName("paginationFrame")
+        self.current_page = 1
+        self.total_pages = 0
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(8)
+
+        # 总条数
+        self.total_label = QLabel("共 0 条")
+        self.total_label.setProperty("class", "muted-label")
+        layout.addWidget(self.total_label)
+        layout.addStretch()
+
+        self.prev_btn = icon_button("left_arrow", size=12, tooltip="上一页", min_size=(40, 30))
+        self.prev_btn.clicked.connect(lambda: self.request_page(self.current_page - 1))
+        layout.addWidget(self.prev_btn)
+
+        # 页码按钮池
+        self.page_buttons = []
+        for _ in range(window_slots):
+            button = QPushButton()
+            button.setProperty("class", "page-button")
+            button.setCheckable(True)
+            button.setCursor(Qt.PointingHandCursor)
+            button.clicked.connect(lambda _, b=button: self.handle_page_button(b))
+            self.page_buttons.append(button)
+            layout.addWidget(button)
+
+        self.next_btn = icon_button("right_arrow", size=12, tooltip="下一页", min_size=(40, 30))
+        self.next_btn.clicked.connect(lambda: self.request_page(self.current_page + 1))
+        layout.addWidget(self.next_btn)
+        layout.addStretch()
+
+        # 跳页
+        jump_label = QLabel("跳至")
+        jump_label.setProperty("class", "muted-label")
+        self.jump_input = QLineEdit()
+        self.jump_input.setObjectName("pageJumpInput")
+        self.jump_input.setValidator(QIntValidator(1, 2 ** 31 - 1, self))
+        self.jump_input.setFixedWidth(70)
+        self.jump_input.returnPressed.connect(self.handle_jump)
+        jump_suffix = QLabel("页")
+        jump_suffix.setProperty("class", "muted-label")
+        layout.addWidget(jump_label)
+        layout.addWidget(self.jump_input)
+        layout.addWidget(jump_suffix)
+
+        # 每页条数
+        self.page_size_combo = QComboBox()
+        self.page_size_combo.setObjectName("pageSizeCombo")
+        for size in page_sizes:
+            self.page_size_combo.addItem(f"{size} 条/页", size)
+        self.page_size_combo.currentIndexChanged.connect(
+            lambda index: self.page_size_changed.emit(self.page_size_combo.itemData(index))
+        )
+        layout.addWidget(self.page_size_combo)
+
+        self.update_pagination(0, 1, 0)
+
+    def page_size(self):
+        """当前每页条数"""
+        return self.page_size_combo.currentData()
+
+    def update_pagination(self, total_items, current_page, total_pages):
+        """刷新总数、页码窗口和按钮状态"""
+        self.current_page = current_page
+        self.total_pages = total_pages
+        self.total_label.setText(f"共 {format_count(total_items)} 条")
+
+        pages = page_window(current_page, total_pages, len(self.page_buttons))
+        for index, button in enumerate(self.page_buttons):
+            if index >= len(pages):
+                button.hide()
+                continue
+            page = pages[index]
+            button.setProperty("page", page or 0)
+            button.setText(str(page) if page else "…")
+            button.setEnabled(page is not None)
+            button.setChecked(page == current_page)
+            button.show()
+
+        self.prev_btn.setEnabled(current_page > 1)
+        self.next_btn.setEnabled(current_page < total_pages)
+
+    def request_page(self, page):
+        """请求跳转到有效页码"""
+        if 1 <= page <= self.total_pages and page != self.current_page:
+            self.page_changed.emit(page)
+
+    def handle_page_button(self, button):
+        page = button.property("page")
+        # 点击当前页时保持选中状态
+        button.setChecked(page == self.current_page)
+        if page:
+            self.request_page(page)
+
+    def handle_jump(self):
+        """跳页输入框回车，超出范围的页码收敛到首末页"""
+        text = self.jump_input.text()
+        if not text or self.total_pages < 1:
+            return
+        self.jump_input.clear()
+        self.request_page(min(max(int(text), 1), self.total_pages))
@@ -0,0 +1,416 @@
+import os
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QPushButton
+
+ICON_DIR = 'utils/img'
+
+# 主题色
+COLORS = {
+    'primary': '#409eff',
+    'primary_hover': '#66b1ff',
+    'primary_pressed': '#3a8ee6',
+    'accent': '#3498db',
+    'title': '#2c3e50',
+    'text': '#333333',
+    'text_secondary': '#606266',
+    'text_muted': '#666666',
+    'border': '#e0e0e0',
+    'border_light': '#eaeaea',
+    'input_border': '#dcdfe6',
+    'input_hover': '#c0c4cc',
+    'background': '#f5f7fa',
+    'header': '#f5f5f5',
+    'selection': '#e3f2fd',
+    'selection_text': '#1976d2',
+    'menu': '#34495e',
+    'menu_border': '#2c3e50',
+}
+
+# 全局样式表：应用启动时安装一次，各控件通过 objectName 或 class 属性匹配，不再单独调用 setStyleSheet
+STYLESHEET = """
+/* 主窗口 */
+QListWidget#menuList {{
+    background-color: {menu};
+    color: white;
+    font-size: 16px;
+    border: none;
+}}
+QListWidget#menuList::item {{
+    height: 50px;
+    padding-left: 20px;
+    border-bottom: 1px solid {menu_border};
+}}
+QListWidget#menuList::item:selected {{
+    background-color: {accent};
+}}
+QLabel#pageTitle {{
+    font-size: 24px;
+    font-weight: bold;
+    color: {title};
+    padding: 15px 0;
+    border-bottom: 2px solid {accent};
+}}
+
+/* 卡片容器 */
+#filterFrame, #tableFrame, #paginationFrame, #statPanel, #summaryCard {{
+    background-color: #ffffff;
+    border-radius: 8px;
+    border: 1px solid {border_light};
+}}
+#filterFrame {{
+    padding: 12px;
+}}
+#paginationFrame {{
+    padding: 8px;
+}}
+
+/* 文本 */
+QLabel[class="filter-label"] {{
+    font-size: 14px;
+    color: {text};
+}}
+QLabel[class="muted-label"] {{
+    font-size: 14px;
+    color: {text_muted};
+    border: none;
+}}
+QLabel[class="panel-title"] {{
+    font-size: 15px;
+    font-weight: bold;
+    color: {title};
+}}
+QLabel[class="card-title"] {{
+    font-size: 13px;
+    color: {text_muted};
+    border: none;
+}}
+QLabel[class="card-value"] {{
+    font-size: 26px;
+    font-weight: bold;
+    color: {title};
+    border: none;
+}}
+QLabel#welcomeLabel {{
+    font-size: 20px;
+    color: {title};
+    padding: 20px;
+}}
+#statPanel QLabel {{
+    font-size: 13px;
+    color: {text};
+    border: none;
+}}
+#statPanel QProgressBar {{
+    border: none;
+    background-color: #f0f2f5;
+    border-radius: 4px;
+    max-height: 8px;
+}}
+#statPanel QProgressBar::chunk {{
+    background-color: {accent};
+    border-radius: 4px;
+}}
+
+/* 输入控件 */
+QLineEdit[class="filter-input"] {{
+    font-size: 14px;
+    border: 1px solid {input_border};
+    border-radius: 4px;
+    padding: 8px;
+    min-width: 150px;
+}}
+QComboBox[class="filter-combo"], QDateEdit[class="filter-date"], QComboBox#pageSizeCombo {{
+    font-family: 'Microsoft YaHei';
+    font-size: 14px;
+    color: {text};
+    background: white;
+    border: 1px solid {input_border};
+    border-radius: 4px;
+    padding: 6px 12px 6px 8px;
+    min-width: 80px;
+    selection-background-color: #e6f7ff;
+}}
+QDateEdit[class="filter-date"] {{
+    min-width: 100px;
+}}
+QComboBox[class="filter-combo"]:hover, QDateEdit[class="filter-date"]:hover, QComboBox#pageSizeCombo:hover {{
+    border-color: {input_hover};
+}}
+QComboBox[class="filter-combo"]::drop-down, QDateEdit[class="filter-date"]::drop-down, QComboBox#pageSizeCombo::drop-down {{
+    subcontrol-origin: padding;
+    subcontrol-position: right center;
+    width: 20px;
+    border: none;
+    padding: 0;
+}}
+QComboBox[class="filter-combo"]::down-arrow, QDateEdit[class="filter-date"]::down-arrow, QComboBox#pageSizeCombo::down-arrow {{
+    image: url(utils/img/down_arrow.png);
+    width: 12px;
+    height: 12px;
+}}
+
+/* 表单（新建/修改数据集） */
+QDialog#datasetDialog, QDialog#importDialog {{
+    background-color: {background};
+    border: 1px solid #e4e7ed;
+    border-radius: 8px;
+}}
+QLabel[class="form-label"] {{
+    font-size: 15px;
+    font-weight: 500;
+    color: {text};
+}}
+QLineEdit[class="form-input"], QComboBox[class="form-combo"], QTextEdit[class="form-text"] {{
+    border: 1px solid {input_border};
+    border-radius: 4px;
+    padding: 8px 12px;
+    background-color: #ffffff;
+    font-size: 14px;
+    color: {text_secondary};
+}}
+QLineEdit[class="form-input"]:hover, QComboBox[class="form-combo"]:hover, QTextEdit[class="form-text"]:hover {{
+    border-color: {input_hover};
+}}
+QLineEdit[class="form-input"]:focus, QComboBox[class="form-combo"]:focus, QTextEdit[class="form-text"]:focus {{
+    border-color: {primary};
+}}
+QComboBox[class="form-combo"]::drop-down {{
+    subcontrol-origin: padding;
+    subcontrol-position: right center;
+    width: 24px;
+    border-left: none;
+}}
+QFrame[class="separator"] {{
+    background-color: #ebeef5;
+    margin: 1px 0;
+    max-height: 1px;
+}}
+
+/* 按钮 */
+QPushButton[class="primary-button"] {{
+    background-color: {primary};
+    color: white;
+    border: none;
+    border-radius: 4px;
+    font-size: 15px;
+    font-weight: 500;
+    padding: 6px 16px;
+}}
+QPushButton[class="primary-button"]:hover {{
+    background-color: {primary_hover};
+}}
+QPushButton[class="primary-button"]:pressed {{
+    background-color: {primary_pressed};
+}}
+QPushButton[class="secondary-button"] {{
+    background-color: {background};
+    color: {text_secondary};
+    border: 1px solid {input_border};
+    border-radius: 4px;
+    font-size: 15px;
+    font-weight: 500;
+    padding: 8px 20px;
+}}
+QPushButton[class="secondary-button"]:hover {{
+    background-color: #ecf5ff;
+    color: {primary};
+    border-color: #c6e2ff;
+}}
+QPushButton[class="secondary-button"]:pressed {{
+    background-color: #e6ebf5;
+}}
+QPushButton[class="icon-button"] {{
+    background-color: transparent;
+    border: none;
+    padding: 0;
+}}
+QPushButton[class="icon-button"]:pressed {{
+    padding: 2px;
+}}
+
+/* 分页 */
+QPushButton[class="page-button"] {{
+    min-width: 32px;
+    min-height: 28px;
+    padding: 0 6px;
+    background-color: white;
+    color: {text_secondary};
+    border: 1px solid {input_border};
+    border-radius: 4px;
+    font-size: 13px;
+}}
+QPushButton[class="page-button"]:hover {{
+    color: {primary};
+    border-color: {primary};
+}}
+QPushButton[class="page-button"]:checked {{
+    background-color: {primary};
+    color: white;
+    border-color: {primary};
+}}
+QPushButton[class="page-button"]:disabled {{
+    border: none;
+    background-color: transparent;
+}}
+QLineEdit#pageJumpInput {{
+    font-size: 13px;
+    border: 1px solid {input_border};
+    border-radius: 4px;
+    padding: 4px 6px;
+}}
+
+QMessageBox {{
+    font-family: "Microsoft YaHei";
+    min-width: 300px;
+    min-height: 150px;
+}}
+
+/* 表格 */
+QTableView#dataTable, QTableWidget#importTable {{
+    background-color: #ffffff;
+    alternate-background-color: #fafafa;
+    border: 1px solid {border};
+    border-radius: 8px;
+    gridline-color: #f0f0f0;
+    selection-background-color: {selection};
+    selection-color: {selection_text};
+}}
+QTableView#dataTable::item {{
+    padding: 0;
+    border-bottom: 1px solid #f0f0f0;
+    border-left: 1px solid #f0f0f0;
+}}
+QTableView#dataTable::item:selected {{
+    background-color: {selection};
+    color: {selection_text};
+}}
+QHeaderView#tableHeader {{
+    background-color: transparent;
+}}
+QHeaderView#tableHeader::section, QTableWidget#importTable QHeaderView::section {{
+    background-color: {header};
+    color: {text};
+    border: none;
+    border-bottom: 2px solid {border};
+    border-left: 1px solid {border};
+    padding: 10px 12px;
+    font-family: "Microsoft YaHei";
+    font-size: 13px;
+    font-weight: 500;
+}}
+
+/* 数据集详情 */
+QDialog#datasetDetailsDialog {{
+    background-color: #F5F5F5;
+}}
+QDialog#datasetDetailsDialog QTabWidget::pane {{
+    border: 1px solid #CCCCCC;
+    background-color: white;
+    border-radius: 8px;
+}}
+QDialog#datasetDetailsDialog QTabBar::tab {{
+    padding: 10px 25px;
+    background-color: #E8E8E8;
+    border: 1px solid #CCCCCC;
+    border-bottom: none;
+    margin-right: 4px;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+    font-size: 14px;
+}}
+QDialog#datasetDetailsDialog QTabBar::tab:selected {{
+    background-color: white;
+    font-weight: bold;
+    color: #007ACC;
+}}
+#infoForm, #itemsContainer {{
+    background-color: white;
+    border-radius: 12px;
+    border: none;
+}}
+#infoForm {{
+    padding: 25px 35px;
+}}
+QLabel[class="info-label"] {{
+    color: #424242;
+    font-weight: 500;
+    padding-right: 12px;
+    min-width: 90px;
+}}
+QLabel[class="info-value"], QLabel[class="info-remark"] {{
+    color: #616161;
+    background: #FAFAFA;
+    min-width: 280px;
+    border-radius: 8px;
+    border: 1px solid #EEEEEE;
+}}
+QLabel[class="info-value"] {{
+    padding: 6px 10px;
+    max-height: 36px;
+}}
+QLabel[class="info-remark"] {{
+    padding: 12px;
+    max-width: 280px;
+    border-radius: 6px;
+}}
+
+/* 导入 */
+#importTopFrame, #importButtonFrame {{
+    background-color: white;
+    border: 1px solid #e4e7ed;
+    border-radius: 8px;
+    padding: 0;
+}}
+QLineEdit#fileNameDisplay {{
+    background-color: white;
+    border: 1px solid #e4e7ed;
+    border-radius: 6px;
+    padding: 0;
+    max-width: 200px;
+    min-height: 32px;
+}}
+QLabel[class="hint-label"] {{
+    color: {text_secondary};
+    font-weight: bold;
+    border: none;
+}}
+""".format(**COLORS)
+
+_icons = {}
+
+
+def icon(name):
+    """按名称返回 utils/img 下的图标，每个图标只解码一次"""
+    cached = _icons.get(name)
+    if cached is None:
+        cached = QIcon(os.path.join(ICON_DIR, f"{name}.png"))
+        _icons[name] = cached
+    return cached
+
+
+def preload_icons():
+    """启动时预加载全部图标"""
+    for file_name in os.listdir(ICON_DIR):
+        name, ext = os.path.splitext(file_name)
+        if ext.lower() == '.png':
+            icon(name)
+
+
+def icon_button(name, size=16, tooltip=None, min_size=(30, 30)):
+    """创建只显示图标的按钮，图标取自缓存"""
+    button = QPushButton()
+    button.setProperty("class", "icon-button")
+    button.setIcon(icon(name))
+    button.setIconSize(QSize(size, size))
+    button.setMinimumSize(*min_size)
+    button.setCursor(Qt.PointingHandCursor)
+    if tooltip:
+        button.setToolTip(tooltip)
+    return button
+
+
+def apply_theme(app):
+    """安装全局样式表并预加载图标，应用启动时调用一次"""
+    preload_icons()
+    app.setStyleSheet(STYLESHEET)